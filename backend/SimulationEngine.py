@@ -1,12 +1,17 @@
 from __future__ import annotations
-import random
+import heapq
+import math
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Any
+from . import rng
 from .aircraft import Aircraft, EmergencyType
 
 
 SimTime = int  # for compatibility across backend modules
 
+# Most ticks ``advance`` runs without an event scan after scans keep finding no idle ticks
+MAX_SCAN_BACKOFF_TICKS = 16
+
 @dataclass
 class SimulationEngine:
     """
@@ -18,11 +23,14 @@ class SimulationEngine:
         assignments through the Airport interface.
 
         The simulation advances in discrete time ticks measured in minutes.
+        With ``event_driven`` enabled, ``run_for`` skips over ticks in which
+        nothing can happen and jumps straight to the next event instead.
         """
     params: Any
     airport: Any
     stats: Any
     seed: Optional[int] = None
+    event_driven: bool = False
 
     def __post_init__(self) -> None:
         """
@@ -45,14 +53,23 @@ class SimulationEngine:
         self._inbound_acc: float = 0.0
         self._outbound_acc: float = 0.0
 
-        self._pending_inbound: List[Tuple[int, Any]] = []
-        self._pending_outbound: List[Tuple[int, Any]] = []
+        # Min-heaps of (spawn_time, seq, aircraft); seq keeps equal spawn times in creation order
+        self._pending_inbound: List[Tuple[int, int, Any]] = []
+        self._pending_outbound: List[Tuple[int, int, Any]] = []
+        self._next_pending_seq: int = 0
 
-        self._rng = random.Random(self.seed)
+        # Independent streams, so e.g. an extra emergency roll never shifts fuel draws
+        self._fuel_rng = rng.stream(self.seed, rng.FUEL)
+        self._emergency_rng = rng.stream(self.seed, rng.EMERGENCIES)
+        self._class_rng = rng.stream(self.seed, rng.CLASSES)
 
         self._next_in_id: int = 1
         self._next_out_id: int = 1
 
+        # Event-driven mode: plain ticks left before the next event scan, and the current backoff
+        self._ticks_before_scan: int = 0
+        self._scan_backoff: int = 0
+
         self._prime_scheduler(lookahead_window=15)
 
 
@@ -95,7 +112,7 @@ class SimulationEngine:
                 created_aircraft.append(a)
                 # Sample the spawn time using the updated stats
                 spawn_time = self.stats.sample_inbound_spawn_time(t)
-                self._pending_inbound.append((spawn_time, a))
+                self._schedule(self._pending_inbound, spawn_time, a)
 
             # Outbound planes
             self._outbound_acc += self.expected_per_tick(self.params.outbound_rate_per_hour, dt)
@@ -104,7 +121,7 @@ class SimulationEngine:
                 a = self.make_outbound_aircraft(now=t)
                 created_aircraft.append(a)
                 spawn_time = self.stats.sample_outbound_spawn_time(t)
-                self._pending_outbound.append((spawn_time, a))
+                self._schedule(self._pending_outbound, spawn_time, a)
         
         # Apply emergencies to the new batch
         self._apply_emergencies_this_tick(created_aircraft)
@@ -143,32 +160,187 @@ class SimulationEngine:
         # apply constraints
         self.update_constraints(now, dt)
 
-        # attempt assignments
-        if hasattr(self.airport, "assignLanding"):
-            self.airport.assignLanding(now)
-        if hasattr(self.airport, "assignTakeOff"):
-            self.airport.assignTakeOff(now)
+        # attempt assignments (through the airport's assignment policy if it has one)
+        if hasattr(self.airport, "assignRunways"):
+            self.airport.assignRunways(now)
+        else:
+            if hasattr(self.airport, "assignLanding"):
+                self.airport.assignLanding(now)
+            if hasattr(self.airport, "assignTakeOff"):
+                self.airport.assignTakeOff(now)
 
         # stats snapshot
         if hasattr(self.stats, "snapshot_queues"):
-            self.stats.snapshot_queues(
-                holding_size=self.airport.holding.size(),
-                takeoff_size=self.airport.takeoff.size(),
-                time=now,
-            )
+            self._snapshot(now, ticks=1)
 
     def run_for(self, duration_min: int) -> None:
         """
            Run the simulation for a fixed duration.
 
+           In event-driven mode the engine jumps between events with
+           ``advance`` rather than calling ``tick`` for every time step.
+           Both modes finish on the same tick and produce identical statistics.
+
            Parameters
            ----------
            duration_min : int
                Number of minutes the simulation should run.
         """
         end_time = self.current_time + int(duration_min)
-        while self.current_time < end_time:
+        while self.current_time < end_time and not self.is_paused:
+            if self.event_driven:
+                self.advance(until=end_time)
+            else:
+                self.tick()
+
+    def advance(self, until: Optional[int] = None) -> None:
+        """
+        Jump to the next event and process it as a normal tick.
+
+        Ticks before the next event are idle: no aircraft spawns, no runway
+        is released, no fuel or cancellation threshold is crossed and no
+        assignment can succeed. Their only effects (rate accumulation and
+        queue-size snapshots) are applied in bulk before the event tick
+        itself is processed by ``tick``.
+
+        When scans keep finding an event on the very next tick (busy
+        traffic), the scan is skipped for a growing number of plain ticks,
+        up to ``MAX_SCAN_BACKOFF_TICKS``, so event-driven mode costs little
+        more than ticking when there is nothing to skip.
+
+        Parameters
+        ----------
+        until : int, optional
+            Simulation time the jump must not overshoot. The engine stops on
+            the first tick at or after this time even if nothing happens there.
+        """
+        if self.is_paused:
+            return
+
+        # In busy traffic the scan keeps finding an event on the next tick; ticking
+        # is always correct, so back off and scan again only after a few plain ticks
+        if self._ticks_before_scan > 0:
+            self._ticks_before_scan -= 1
             self.tick()
+            return
+
+        dt = int(self.params.tick_size_min)
+        target = self.next_event_time(until=until)
+
+        idle_ticks = (target - self.current_time) // dt - 1
+        if idle_ticks > 0:
+            self._scan_backoff = 0
+            self._skip_idle_ticks(idle_ticks, dt)
+        else:
+            self._scan_backoff = min(MAX_SCAN_BACKOFF_TICKS, 2 * self._scan_backoff or 1)
+            self._ticks_before_scan = self._scan_backoff
+
+        self.tick()
+
+    def next_event_time(self, until: Optional[int] = None) -> int:
+        """
+        Return the first tick time at which the simulation state can change.
+
+        Candidate events are aircraft creation by the rate accumulators,
+        pending spawns, runway releases, wake separation clearing on a free
+        runway, fuel emergency and diversion
+        thresholds, and takeoff cancellation deadlines. The result is always
+        at least one tick ahead of the current time.
+
+        Parameters
+        ----------
+        until : int, optional
+            Upper bound on the returned time (rounded up to a tick).
+
+        Returns
+        -------
+        int
+            Simulation time of the next tick that must be processed.
+        """
+        params = self.params
+        now = self.current_time
+        dt = int(params.tick_size_min)
+        next_tick = now + dt
+
+        # Aircraft creation on the very next tick is the most common event at
+        # normal traffic, so it is checked first and ends the scan right away
+        per_tick = (
+            self.expected_per_tick(params.inbound_rate_per_hour, dt),
+            self.expected_per_tick(params.outbound_rate_per_hour, dt),
+        )
+        accs = (self._inbound_acc, self._outbound_acc)
+        for acc, step in zip(accs, per_tick):
+            if step > 0 and acc + step >= 1.0:
+                return next_tick
+
+        # Raw times of the other candidate events; each is due on the first tick at or after it
+        times: List[int] = []
+        if until is not None:
+            times.append(until)
+
+        # Pending spawns are flushed on the first tick at or after their spawn time
+        for pending in (self._pending_inbound, self._pending_outbound):
+            if pending:
+                times.append(pending[0][0])
+
+        holding = self.airport.holding
+        takeoff = self.airport.takeoff
+
+        # Takeoff queue is FIFO, so the head always has the earliest deadline
+        head = takeoff.peek()
+        if head is not None:
+            times.append(head.joinedTakeoffQueueAt + params.max_takeoff_wait_min + 1)
+
+        # Fuel thresholds are checked against the fuel left at the end of a tick
+        fuel_out_at = holding.next_fuel_out(alerts=True)
+        if fuel_out_at is not None:
+            times.append(fuel_out_at - dt - params.fuel_emergency_min)
+        fuel_out_at = holding.next_fuel_out()
+        if fuel_out_at is not None:
+            times.append(fuel_out_at - dt - params.fuel_min_min)
+
+        if hasattr(self.airport, "nextRelease"):
+            # Indexed airport: earliest release, and whether an assignment is due
+            release = self.airport.nextRelease()
+            if release is not None:
+                times.append(release)
+            if hasattr(self.airport, "nextClearance"):
+                # A waiting aircraft can go once a free runway is clear of wake separation
+                for op in ("LANDING", "TAKEOFF"):
+                    clear = self.airport.nextClearance(op, now)
+                    if clear is not None:
+                        times.append(clear)
+            elif (holding.size() > 0 and self.airport.hasFreeRunway("LANDING")) or (
+                takeoff.size() > 0 and self.airport.hasFreeRunway("TAKEOFF")
+            ):
+                return next_tick
+        else:
+            for runway in getattr(self.airport, "runways", []):
+                # Released by updateRunways on the first tick at or after occupiedUntil
+                if runway.occupancy == "OCCUPIED":
+                    times.append(runway.occupiedUntil)
+                # A free runway with a waiting aircraft means an assignment is due
+                elif runway.isAvailable() and (
+                    (runway.canLand() and holding.size() > 0)
+                    or (runway.canTakeOff() and takeoff.size() > 0)
+                ):
+                    return next_tick
+
+        # Only the earliest time needs rounding to a tick
+        horizon = self._tick_at_or_after(min(times), dt) if times else None
+        if horizon == next_tick:
+            return next_tick
+        limit = None if horizon is None else (horizon - now) // dt
+
+        # Aircraft creation: replay the accumulators without mutating them
+        for acc, step in zip(accs, per_tick):
+            ticks = self._ticks_until_creation(acc, step, limit)
+            if ticks is not None:
+                limit = ticks
+
+        if limit is None:
+            return next_tick
+        return now + limit * dt
 
     @staticmethod
     def expected_per_tick(rate_per_hour: float, dt_min: int) -> float:
@@ -194,54 +366,53 @@ class SimulationEngine:
         Apply operational constraints to aircraft queues.
 
         This includes:
-            - Fuel consumption for inbound aircraft
             - Fuel emergency detection
             - Aircraft diversion when fuel reaches critical levels
             - Takeoff cancellation if waiting time exceeds limits
-        """
-
-
-        temp_holding = []
-
-        while self.airport.holding.size() > 0:
-            item = self.airport.holding.dequeue_with_order()
-            if item is not None:
-                temp_holding.append(item)
-
-        for _, order, aircraft in temp_holding:
-            aircraft.consumeFuel(dt)
-
-            if aircraft.fuelRemaining <= self.params.fuel_emergency_min:
-                if aircraft.emergency is None:
-                    aircraft.emergency = EmergencyType(fuel_emergency=True)
-                else:
-                    aircraft.emergency.fuel_emergency = True
-
-            if aircraft.fuelRemaining <= self.params.fuel_min_min:
-                self.stats.record_diversion(aircraft, now)
-                continue
 
-            self.airport.holding.enqueue_with_order(
-                aircraft, aircraft.enteredHoldingAt, order
-            )
+        Fuel is not burned tick by tick. An aircraft's fuel at any time follows
+        from when it entered holding and the fuel it entered with, so the
+        holding queue keeps aircraft in min-heaps keyed by the time their fuel
+        runs out. Constraints are checked against the fuel left at the end of
+        this tick, and only aircraft whose threshold has been reached are
+        touched.
 
-
-        temp_takeoff = []
-
-        while not self.airport.takeoff.isEmpty():
-            temp_takeoff.append(self.airport.takeoff.dequeue())
-
-        for aircraft in temp_takeoff:
-            joined = aircraft.joinedTakeoffQueueAt
-            wait_time = now - joined
-
-            if wait_time > self.params.max_takeoff_wait_min:
-                # CANCEL FLIGHT
-                self.stats.record_cancellation(aircraft, now)
-                continue
-
-            # still valid → re-enqueue
-            self.airport.takeoff.enqueue(aircraft, joined)
+        Fuel emergencies, diversions and cancellations are also reported to
+        the airport's change feed, if it has one.
+        """
+        horizon = now + dt
+        holding = self.airport.holding
+        changes = getattr(self.airport, "changes", None)
+
+        for fuel_out_at, order, aircraft in holding.pop_fuel_alerts(horizon + self.params.fuel_emergency_min):
+            aircraft.fuelRemaining = max(0, fuel_out_at - horizon)
+            if aircraft.emergency is None:
+                aircraft.emergency = EmergencyType(fuel_emergency=True)
+            else:
+                aircraft.emergency.fuel_emergency = True
+            holding.promote(order)
+            if hasattr(self.stats, "record_fuel_emergency"):
+                self.stats.record_fuel_emergency(aircraft, now)
+            if changes is not None:
+                changes.aircraft_changed(aircraft)
+
+        for fuel_out_at, _, aircraft in holding.remove_fuel_out(horizon + self.params.fuel_min_min):
+            aircraft.fuelRemaining = max(0, fuel_out_at - horizon)
+            self.stats.record_diversion(aircraft, now)
+            if changes is not None:
+                changes.aircraft_removed(aircraft)
+
+        # CANCEL FLIGHTS that waited too long (only ever at the head of the FIFO queue)
+        cancelled = self.airport.takeoff.expire(now, self.params.max_takeoff_wait_min)
+        if cancelled:
+            if hasattr(self.stats, "record_cancellations"):
+                self.stats.record_cancellations(cancelled, now)
+            else:
+                for aircraft in cancelled:
+                    self.stats.record_cancellation(aircraft, now)
+            if changes is not None:
+                for aircraft in cancelled:
+                    changes.aircraft_removed(aircraft)
 
     # Factory method to create a new arriving aircraft
     def make_inbound_aircraft(self, now: int):
@@ -263,13 +434,13 @@ class SimulationEngine:
         self._next_in_id += 1
 
         # Assigns  random initial fuel amount within the configured limits
-        fuel = self._rng.randint(
+        fuel = self._fuel_rng.randint(
             self.params.fuel_initial_min_min,
             self.params.fuel_initial_max_min,
         )
 
         # Creates and returns the Aircraft object
-        return Aircraft(
+        return self._new_aircraft(
             aircraft_id=aircraft_id,
             flight_type="INBOUND",
             scheduledTime=now,
@@ -297,7 +468,7 @@ class SimulationEngine:
         self._next_out_id += 1
 
         # Creates and returns the Aircraft object (fuel is 0 as it is not tracked for departures)
-        return Aircraft(
+        return self._new_aircraft(
             aircraft_id=aircraft_id,
             flight_type="OUTBOUND",
             scheduledTime=now,
@@ -309,6 +480,97 @@ class SimulationEngine:
     HELPER FUNCTIONS
     """
 
+    def _new_aircraft(self, **kwargs: Any) -> Any:
+        """Create an Aircraft of a randomly drawn class."""
+        kwargs["aircraft_class"] = self._draw_class()
+        return Aircraft(seed=self.seed, **kwargs)
+
+    def _snapshot(self, now: int, ticks: int) -> None:
+        """Report queue sizes (and runway busy states, if a time series is attached) to the statistics."""
+        kwargs = {}
+        if getattr(self.stats, "timeseries", None) is not None:
+            kwargs["runways_busy"] = [r.occupancy == "OCCUPIED" for r in self.airport.runways]
+        self.stats.snapshot_queues(
+            holding_size=self.airport.holding.size(),
+            takeoff_size=self.airport.takeoff.size(),
+            time=now,
+            ticks=ticks,
+            **kwargs,
+        )
+
+    def _draw_class(self) -> str:
+        """Draw the size class of a new aircraft from ``p_heavy`` / ``p_light``."""
+        p_heavy = getattr(self.params, "p_heavy", 0.0)
+        p_light = getattr(self.params, "p_light", 0.0)
+        r = self._class_rng.random()
+        if r < p_heavy:
+            return "HEAVY"
+        if r < p_heavy + p_light:
+            return "LIGHT"
+        return "MEDIUM"
+
+    def _tick_at_or_after(self, time: int, dt: int) -> int:
+        """Return the first tick time at or after ``time`` that lies in the future."""
+        ticks = math.ceil((int(time) - self.current_time) / dt)
+        return self.current_time + max(1, ticks) * dt
+
+    @staticmethod
+    def _ticks_until_creation(acc: float, per_tick: float, limit: Optional[int]) -> Optional[int]:
+        """
+        Return how many ticks until an accumulator creates its next aircraft.
+
+        The accumulation is replayed with the same floating point additions as
+        ``tick`` so the answer matches the tick-based run exactly.
+
+        Parameters
+        ----------
+        acc : float
+            Current accumulator value.
+        per_tick : float
+            Amount added to the accumulator on every tick.
+        limit : int, optional
+            Stop searching after this many ticks.
+
+        Returns
+        -------
+        Optional[int]
+            Number of ticks until creation, or None if it does not happen
+            within ``limit`` ticks (or ever, for a zero rate).
+        """
+        if per_tick <= 0:
+            return None
+
+        ticks = 0
+        while limit is None or ticks < limit:
+            ticks += 1
+            acc += per_tick
+            if acc >= 1.0:
+                return ticks
+        return None
+
+    def _skip_idle_ticks(self, ticks: int, dt: int) -> None:
+        """
+        Apply the effects of ``ticks`` consecutive idle ticks in bulk.
+
+        Parameters
+        ----------
+        ticks : int
+            Number of idle ticks to skip.
+        dt : int
+            Tick duration in minutes.
+        """
+        inbound_per_tick = self.expected_per_tick(self.params.inbound_rate_per_hour, dt)
+        outbound_per_tick = self.expected_per_tick(self.params.outbound_rate_per_hour, dt)
+        for _ in range(ticks):
+            self._inbound_acc += inbound_per_tick
+            self._outbound_acc += outbound_per_tick
+
+        self.current_time += ticks * dt
+
+        # Queue sizes and runway states cannot change during idle ticks
+        if hasattr(self.stats, "snapshot_queues"):
+            self._snapshot(self.current_time, ticks=ticks)
+
     def _prime_scheduler(self, lookahead_window: int) -> None:
         """
         Pre-generate aircraft traffic for the initial simulation window.
@@ -338,7 +600,7 @@ class SimulationEngine:
                 # Jitter might make spawn_time negative (e.g. -2),
                 # which ensures they appear immediately at tick 0.
                 spawn_time = self.stats.sample_inbound_spawn_time(t)
-                self._pending_inbound.append((spawn_time, a))
+                self._schedule(self._pending_inbound, spawn_time, a)
 
             # Handles the Outbound Backlog
             self._outbound_acc += self.expected_per_tick(self.params.outbound_rate_per_hour, dt)
@@ -348,7 +610,7 @@ class SimulationEngine:
                 created_aircraft.append(a)
 
                 spawn_time = self.stats.sample_outbound_spawn_time(t)
-                self._pending_outbound.append((spawn_time, a))
+                self._schedule(self._pending_outbound, spawn_time, a)
 
         # Apply emergency rolls to these pre-generated planes
         self._apply_emergencies_this_tick(created_aircraft)
@@ -367,7 +629,7 @@ class SimulationEngine:
            Optional[EmergencyType]
                Generated emergency or None if no emergency occurs.
         """
-        r = self._rng.random()
+        r = self._emergency_rng.random()
         p_mech = self.params.p_mechanical_failure
         p_ill = self.params.p_passenger_illness
 
@@ -435,7 +697,7 @@ class SimulationEngine:
 
             # Jitter the actual spawn time around the target time
             spawn_time = self.stats.sample_inbound_spawn_time(target_time)
-            self._pending_inbound.append((spawn_time, a))
+            self._schedule(self._pending_inbound, spawn_time, a)
 
         self._apply_emergencies_this_tick(created)
 
@@ -465,33 +727,54 @@ class SimulationEngine:
             created.append(a)
 
             spawn_time = self.stats.sample_outbound_spawn_time(target_time)
-            self._pending_outbound.append((spawn_time, a))
+            self._schedule(self._pending_outbound, spawn_time, a)
 
         self._apply_emergencies_this_tick(created)
 
+    def _schedule(self, pending: List[Tuple[int, int, Any]], spawn_time: int, aircraft: Any) -> None:
+        """
+           Add an aircraft to a pending spawn schedule.
+
+           Parameters
+           ----------
+           pending : List[Tuple[int, int, Any]]
+               The inbound or outbound pending heap.
+           spawn_time : int
+               Time at which the aircraft should enter its queue.
+           aircraft : Any
+               The scheduled aircraft.
+        """
+        heapq.heappush(pending, (spawn_time, self._next_pending_seq, aircraft))
+        self._next_pending_seq += 1
+
     def _flush_pending(self, now: int) -> None:
         """
            Move aircraft whose spawn time has been reached into airport queues.
 
            Pending inbound aircraft are transferred to the holding queue,
            while outbound aircraft are transferred to the takeoff queue.
+           Both schedules are min-heaps keyed by spawn time, so only the
+           aircraft that are due are popped.
         """
-        # Sort both lists by the spawn_time (the first element of the tuple)
-        self._pending_inbound.sort(key=lambda x: x[0])
-        self._pending_outbound.sort(key=lambda x: x[0])
+        # Spawns are only reported when an event log is attached
+        log_spawns = getattr(self.stats, "event_log", None) is not None
 
         # Inbound: Flush all aircraft whose spawn_time has passed or is now
-        due_inbound = [a for t, a in self._pending_inbound if t <= now]
-        self._pending_inbound = [(t, a) for t, a in self._pending_inbound if t > now]
-        for a in due_inbound:
+        pending = self._pending_inbound
+        while pending and pending[0][0] <= now:
+            _, _, a = heapq.heappop(pending)
+            if log_spawns:
+                self.stats.record_spawn(a, now)
             # We use the original sampled spawn_time for the handleInbound call
             # to ensure the airport knows exactly when it "hit" the airspace.
             self.airport.handleInbound(a, now)
 
         # Outbound: Flush all aircraft whose spawn_time has passed or is now
-        due_outbound = [a for t, a in self._pending_outbound if t <= now]
-        self._pending_outbound = [(t, a) for t, a in self._pending_outbound if t > now]
-        for a in due_outbound:
+        pending = self._pending_outbound
+        while pending and pending[0][0] <= now:
+            _, _, a = heapq.heappop(pending)
+            if log_spawns:
+                self.stats.record_spawn(a, now)
             self.airport.handleOutbound(a, now)
 
     """
@@ -506,8 +789,11 @@ class SimulationEngine:
         return self.stats.report()
 
     def get_holding_queue(self):
-        """Return the holding queue for the simulation."""
-        return self.airport.holding.to_list()
+        """Return the holding queue in landing order, with fuel levels brought up to date."""
+        horizon = self.current_time + int(self.params.tick_size_min)
+        for fuel_out_at, aircraft in self.airport.holding.fuel_out_times():
+            aircraft.fuelRemaining = max(0, fuel_out_at - horizon)
+        return self.airport.holding.landing_order()
 
     def get_takeoff_queue(self):
         """Return the take-off queue for the simulation."""
@@ -40,6 +40,11 @@ class SimulationParams:
         The length of a single simulation tick in minutes. Default is 1.
     fuel_emergency_min : int, optional
         Fuel threshold (in minutes) at which an aircraft declares a fuel emergency. Default is 15.
+    p_heavy : float, optional
+        Share of aircraft in the HEAVY class (longer runway occupancy). Default is 0.
+    p_light : float, optional
+        Share of aircraft in the LIGHT class (shorter runway occupancy). Default is 0.
+        The remainder is MEDIUM.
     """
     num_runways: int
     inbound_rate_per_hour: float
@@ -63,6 +68,9 @@ class SimulationParams:
     tick_size_min: int = 1  # 1-minute discrete tick
     fuel_emergency_min: int = 15
 
+    # Aircraft class mix (shares); the remainder is MEDIUM
+    p_heavy: float = 0.0
+    p_light: float = 0.0
 
     def validate(self) -> None:
         """
@@ -106,4 +114,9 @@ class SimulationParams:
             raise ValueError(f"Total emergency probability ({total_p:.2f}) cannot exceed 1.0.")
             
         if any(p < 0 for p in [self.p_mechanical_failure, self.p_passenger_illness]):
-            raise ValueError("Emergency probabilities cannot be negative.")
\ No newline at end of file
+            raise ValueError("Emergency probabilities cannot be negative.")
+
+        if self.p_heavy < 0 or self.p_light < 0:
+            raise ValueError("Aircraft class shares cannot be negative.")
+        if self.p_heavy + self.p_light > 1.0 + 1e-9:
+            raise ValueError("p_heavy + p_light cannot exceed 1.0.")
@@ -1,26 +1,119 @@
 import random
 import string
-from dataclasses import dataclass
-from typing import Optional
-# from .SimulationEngine import EmergencyType
-# Defined here to avoid circular import from SimulationEngine
-from dataclasses import dataclass
-from typing import Optional
-import random
-import string
+from typing import Any, Optional, Tuple
+
+from . import rng as rng_streams
+
+
+# Aircraft size classes; they drive runway occupancy times
+AIRCRAFT_CLASSES = ("LIGHT", "MEDIUM", "HEAVY")
+DEFAULT_CLASS = "MEDIUM"
+
+ICAO_CODES = (
+    "Boeing ",
+    "Airbus ",
+    "RYANAIR ",
+    "Speedbird ",
+    "Emirates ",
+    "EASY ",
+    "Oceanic ",
+    "Virgin ",
+    "Delta ",
+    "United ",
+)
+
+
+def _flag(bit: int) -> property:
+    """Boolean property backed by one bit of ``EmergencyType.flags``."""
+
+    def get(self) -> bool:
+        return bool(self.flags & bit)
+
+    def set(self, value: bool) -> None:
+        self.flags = self.flags | bit if value else self.flags & ~bit
+
+    return property(get, set)
 
 
-@dataclass
 class EmergencyType:
     """Represent the emergency state of an aircraft.
 
     An aircraft may have a mechanical failure, passenger illness,
-    fuel emergency, or no emergency at all.
+    fuel emergency, or no emergency at all. The state is stored as bit
+    flags in a single slot; the boolean attributes read and set those bits.
     """
 
-    mechanical_failure: bool = False
-    passenger_illness: bool = False
-    fuel_emergency: bool = False
+    __slots__ = ("flags",)
+
+    MECHANICAL_FAILURE = 1
+    PASSENGER_ILLNESS = 2
+    FUEL_EMERGENCY = 4
+
+    def __init__(
+        self,
+        mechanical_failure: bool = False,
+        passenger_illness: bool = False,
+        fuel_emergency: bool = False,
+    ):
+        self.flags = (
+            (self.MECHANICAL_FAILURE if mechanical_failure else 0)
+            | (self.PASSENGER_ILLNESS if passenger_illness else 0)
+            | (self.FUEL_EMERGENCY if fuel_emergency else 0)
+        )
+
+    mechanical_failure = _flag(MECHANICAL_FAILURE)
+    passenger_illness = _flag(PASSENGER_ILLNESS)
+    fuel_emergency = _flag(FUEL_EMERGENCY)
+
+    def __bool__(self) -> bool:
+        return self.flags != 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EmergencyType):
+            return NotImplemented
+        return self.flags == other.flags
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"EmergencyType(mechanical_failure={self.mechanical_failure}, "
+            f"passenger_illness={self.passenger_illness}, "
+            f"fuel_emergency={self.fuel_emergency})"
+        )
+
+
+def _rand_airport(rng=random) -> str:
+    """Generate a random three-letter airport code."""
+    return "".join(rng.choice(string.ascii_uppercase) for _ in range(3))
+
+
+def flight_metadata(seed: Optional[int], aircraft_id: str, flight_type: str) -> Tuple[str, str, int, str, str]:
+    """Generate display metadata for a flight.
+
+    Parameters
+    ----------
+    seed : Optional[int]
+        Run seed. If None the result is not reproducible.
+    aircraft_id : str
+        Aircraft id; together with the seed it selects the random stream.
+    flight_type : str
+        ``INBOUND`` or ``OUTBOUND``, which decides whether the origin or
+        the destination is the simulated airport.
+
+    Returns
+    -------
+    Tuple[str, str, int, str, str]
+        Callsign, operator, ground speed, origin and destination.
+    """
+    rng = rng_streams.stream(seed, rng_streams.METADATA, aircraft_id)
+    callsign = f"{rng.choice(ICAO_CODES)}{rng.randint(100, 999)}"
+    operator = rng.choice(string.ascii_uppercase) + rng.choice(string.ascii_uppercase)
+    ground_speed = rng.randint(300, 600)
+
+    if flight_type == "INBOUND":
+        return callsign, operator, ground_speed, _rand_airport(rng), "SIMULATED_AIRPORT"
+    return callsign, operator, ground_speed, "SIMULATED_AIRPORT", _rand_airport(rng)
 
 
 class Aircraft:
@@ -33,8 +126,26 @@ class Aircraft:
     Inbound aircraft originate from a randomly generated airport and
     arrive at the simulated airport. Outbound aircraft depart from the
     simulated airport and are assigned a random destination airport.
+
+    The metadata is only used for display, so it is generated on first
+    access, from the run seed and aircraft id. The class uses
+    ``__slots__`` to keep large batch runs small in memory.
     """
 
+    __slots__ = (
+        "id",
+        "type",
+        "scheduledTime",
+        "fuelRemaining",
+        "altitude",
+        "emergency",
+        "enteredHoldingAt",
+        "joinedTakeoffQueueAt",
+        "aircraft_class",
+        "_seed",
+        "_metadata",
+    )
+
     def __init__(
         self,
         aircraft_id: str,
@@ -46,6 +157,8 @@ class Aircraft:
         altitude: int = 0,
         enteredHoldingAt: Optional[int] = None,
         joinedTakeoffQueueAt: Optional[int] = None,
+        aircraft_class: str = DEFAULT_CLASS,
+        seed: Optional[int] = None,
     ):
         """Initialise an aircraft object.
 
@@ -67,6 +180,11 @@ class Aircraft:
             Time the aircraft entered the holding queue.
         joinedTakeoffQueueAt : Optional[int], optional
             Time the aircraft joined the takeoff queue.
+        aircraft_class : str, optional
+            Size class, one of ``AIRCRAFT_CLASSES``. Default is ``MEDIUM``.
+        seed : Optional[int], optional
+            Run seed from which the flight metadata is derived, together
+            with the aircraft id. If None the metadata is not reproducible.
         """
         self.id = aircraft_id
         self.type = flight_type
@@ -77,37 +195,41 @@ class Aircraft:
 
         self.enteredHoldingAt = enteredHoldingAt
         self.joinedTakeoffQueueAt = joinedTakeoffQueueAt
-
-        icao_code = [
-            "Boeing ",
-            "Airbus ",
-            "RYANAIR ",
-            "Speedbird ",
-            "Emirates ",
-            "EASY ",
-            "Oceanic ",
-            "Virgin ",
-            "Delta ",
-            "United ",
-        ]
-        self.callsign = f"{random.choice(icao_code)}{random.randint(100, 999)}"
-        self.operator = (
-            random.choice(string.ascii_uppercase)
-            + random.choice(string.ascii_uppercase)
-        )
-        self.ground_speed = random.randint(300, 600)
-
-        if self.type == "INBOUND":
-            self.origin = self._rand_airport()
-            self.destination = "SIMULATED_AIRPORT"
-        else:
-            self.origin = "SIMULATED_AIRPORT"
-            self.destination = self._rand_airport()
-
-    @staticmethod
-    def _rand_airport() -> str:
-        """Generate a random three-letter airport code."""
-        return "".join(random.choice(string.ascii_uppercase) for _ in range(3))
+        self.aircraft_class = aircraft_class
+
+        self._seed = seed
+        self._metadata: Optional[Tuple[str, str, int, str, str]] = None
+
+    def _generate_metadata(self) -> Tuple[str, str, int, str, str]:
+        """Generate (callsign, operator, ground speed, origin, destination) once."""
+        if self._metadata is None:
+            self._metadata = flight_metadata(self._seed, self.id, self.type)
+        return self._metadata
+
+    @property
+    def callsign(self) -> str:
+        """Displayed callsign, e.g. ``Speedbird 123``."""
+        return self._generate_metadata()[0]
+
+    @property
+    def operator(self) -> str:
+        """Two-letter operator code."""
+        return self._generate_metadata()[1]
+
+    @property
+    def ground_speed(self) -> int:
+        """Ground speed in knots."""
+        return self._generate_metadata()[2]
+
+    @property
+    def origin(self) -> str:
+        """Origin airport code."""
+        return self._generate_metadata()[3]
+
+    @property
+    def destination(self) -> str:
+        """Destination airport code."""
+        return self._generate_metadata()[4]
 
     def isEmergency(self) -> bool:
         """Return whether the aircraft currently has an emergency."""
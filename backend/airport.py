@@ -1,39 +1,179 @@
-from typing import List
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
 
 #from .aircraft import aircraft
+from .changes import ChangeFeed
+from .occupancy import OccupancyTable
+from .policies import GreedyPolicy
 from .queues import HoldingQueue, TakeOffQueue
 from .runway import Runway
+from .separation import clear_at
 from .SimulationEngine import SimTime
 from .statistics import Statistics
 
-
 """
 - The airport class utilises the runways and the two queues so that the aircraft objects can move between them accordingly
 - It also records any statistics by using an object that is an instance of the Statistics class
 - Its only attributes are the runways, the takeoff and holding queue and the statistics class object because the aircraft objects can only move between them accordingly in an aircraft
+- It keeps an index of the runways so that it never has to scan all of them: for each operation, a min-heap of the preference ranks of the free runways, and a min-heap of occupiedUntil release times
+- The free heaps are checked lazily: a runway that was taken or closed is popped when it reaches the head of a heap
+- Runways are added back when they are released by updateRunways, or when their status or mode is assigned (e.g. reopened from the UI), since runways report those to _runway_changed
+- A free runway only takes the next aircraft once the wake separation behind its last operation has passed (see separation.py); the runway remembers that operation, so the check is one lookup
+- If a ChangeFeed is attached to changes (see changes.py), every aircraft entering a queue, runway assignment and release, and runway change is reported to it, so the UI can redraw only what changed
 """
 class Airport:
-    def __init__(self, runways: list[Runway], holding: HoldingQueue, takeoff: TakeOffQueue, stats: Statistics):
-        self.runways = runways
+    def __init__(self, runways: list[Runway], holding: HoldingQueue, takeoff: TakeOffQueue, stats: Statistics, policy=None):
+        self._runways: List[Runway] = []
         self.holding = holding
         self.takeoff = takeoff
         self.stats = stats
+        self.policy = policy if policy is not None else GreedyPolicy()   # Decides which waiting aircraft get which free runways
+        self.changes: Optional[ChangeFeed] = None   # Optional change feed for the UI
+        self.runways = runways
+
+    """
+    - Assigning a new runway list (e.g. when the UI adds or removes runways) rebuilds the whole index
+    """
+    @property
+    def runways(self) -> List[Runway]:
+        return self._runways
+
+    @runways.setter
+    def runways(self, runways: List[Runway]) -> None:
+        for runway in self._runways:
+            if runway not in runways:
+                runway._listener = None
+        if self.changes is not None:
+            for runway in self._runways + [r for r in runways if r not in self._runways]:
+                self.changes.runway_changed(runway)
+        self._runways = runways
+        self._rebuild_index()
 
     """
-    - This method below returns the runways for landing by looping through the list of runways and assigning 0 to any landing runways, 1 to any mixed runways and 2 to anything else
-    - We then sort the list based on these assigned numbers so that the landing and mixed runways all end up at the start
+    - This method below returns the runways for landing: landing runways first, then mixed runways, then anything else
+    - The order is computed once when the runways or their modes change, and reused
     """
     def _runways_for_landing(self):
         # LANDING-only first, then MIXED
-        return sorted(self.runways, key=lambda r: 0 if r.mode == "LANDING" else (1 if r.mode == "MIXED" else 2))
+        return list(self._order["LANDING"])
 
     """
-    - This method below returns the runways for takeoff by looping through the list of runways and assigning 0 to any takeoff runways, 1 to any mixed runways and 2 to anything else
-    - We then sort the list based on these assigned numbers so that the takeoff and mixed runways all end up at the start
+    - This method below returns the runways for takeoff: takeoff runways first, then mixed runways, then anything else
+    - The order is computed once when the runways or their modes change, and reused
     """
     def _runways_for_takeoff(self):
         # TAKEOFF-only first, then MIXED
-        return sorted(self.runways, key=lambda r: 0 if r.mode == "TAKEOFF" else (1 if r.mode == "MIXED" else 2))
+        return list(self._order["TAKEOFF"])
+
+    """
+    - This method below recomputes the preference orders and re-indexes every runway
+    - It is only needed when the runway list or a runway's mode changes
+    """
+    def _rebuild_index(self) -> None:
+        landing = {"LANDING": 0, "MIXED": 1}
+        takeoff = {"TAKEOFF": 0, "MIXED": 1}
+        self._order: Dict[str, List[Runway]] = {
+            "LANDING": sorted(self._runways, key=lambda r: landing.get(r.mode, 2)),
+            "TAKEOFF": sorted(self._runways, key=lambda r: takeoff.get(r.mode, 2)),
+        }
+        # Min-heaps of the ranks of free runways, and the ranks currently in each heap
+        self._free: Dict[str, List[int]] = {"LANDING": [], "TAKEOFF": []}
+        self._listed: Dict[str, Set[int]] = {"LANDING": set(), "TAKEOFF": set()}
+        # For each runway, the (operation, rank) pairs of the operations it is eligible for
+        self._slots: Dict[Runway, List[Tuple[str, int]]] = {r: [] for r in self._runways}
+        for op, order in self._order.items():
+            for rank, runway in enumerate(order):
+                if runway.mode in (op, "MIXED"):
+                    self._slots[runway].append((op, rank))
+        self._modes: Dict[Runway, str] = {}
+        self._release_heap: List[Tuple[int, int, Runway]] = []
+        self._release_at: Dict[Runway, int] = {}
+        self._release_seq = 0
+        self._occupancy = OccupancyTable(self._runways)   # Occupancy minutes per runway, aircraft class and operation
+
+        for runway in self._runways:
+            runway._listener = self._runway_changed
+            self._modes[runway] = runway.mode
+            self._index_runway(runway)
+
+    """
+    - This method below is called by a runway whenever its mode or status is assigned
+    - A mode change alters the preference orders, so everything is rebuilt; otherwise only this runway is re-indexed
+    """
+    def _runway_changed(self, runway: Runway) -> None:
+        mode = self._modes.get(runway)
+        if mode is None:
+            return
+        if self.changes is not None:
+            self.changes.runway_changed(runway)
+        if runway.mode != mode:
+            self._rebuild_index()
+        else:
+            self._index_runway(runway)
+
+    """
+    - This method below lists a free runway in the free heaps of its operations, or files the release time of an occupied one
+    - Calling it again for the same runway state changes nothing
+    """
+    def _index_runway(self, runway: Runway) -> None:
+        if runway.isAvailable() and runway.currentAircraft is None:
+            for op, rank in self._slots[runway]:
+                if rank not in self._listed[op]:
+                    self._listed[op].add(rank)
+                    heapq.heappush(self._free[op], rank)
+        elif runway.occupancy == "OCCUPIED" and self._release_at.get(runway) != runway.occupiedUntil:
+            self._file_release(runway)
+
+    """
+    - This method below pushes the release time of an occupied runway onto the release heap
+    """
+    def _file_release(self, runway: Runway) -> None:
+        self._release_at[runway] = runway.occupiedUntil
+        self._release_seq += 1
+        heapq.heappush(self._release_heap, (runway.occupiedUntil, self._release_seq, runway))
+
+    """
+    - This method below returns the most preferred free runway for an operation, or None
+    - Runways at the head of the heap that are no longer free are popped from it
+    """
+    def _first_free(self, op: str) -> Optional[Runway]:
+        free_ranks = self._free[op]
+        order = self._order[op]
+        while free_ranks:
+            runway = order[free_ranks[0]]
+            if runway.status == "AVAILABLE" and runway.occupancy == "FREE" and runway.currentAircraft is None:
+                return runway
+            self._listed[op].discard(heapq.heappop(free_ranks))
+        return None
+
+    """
+    - This method below returns every free runway for an operation, most preferred first
+    """
+    def freeRunways(self, op: str) -> List[Runway]:
+        order = self._order[op]
+        return [
+            order[rank] for rank in sorted(self._free[op])
+            if order[rank].status == "AVAILABLE" and order[rank].occupancy == "FREE" and order[rank].currentAircraft is None
+        ]
+
+    """
+    - This method below says whether any runway is free for an operation ("LANDING" or "TAKEOFF")
+    """
+    def hasFreeRunway(self, op: str) -> bool:
+        return op in self._free and self._first_free(op) is not None
+
+    """
+    - This method below returns the earliest occupiedUntil time among occupied runways, or None if no runway is occupied
+    - Stale heap entries (for runways that were freed or rescheduled) are dropped on the way
+    """
+    def nextRelease(self) -> Optional[SimTime]:
+        heap = self._release_heap
+        while heap:
+            until, _, runway = heap[0]
+            if self._release_at.get(runway) == until and runway.occupancy == "OCCUPIED":
+                return until
+            heapq.heappop(heap)
+        return None
 
     """
     - This method below records the entry of an aircraft into the holding queue at a specific time
@@ -42,6 +182,7 @@ class Airport:
     def handleInbound(self, aircraft, time: int):
         self.stats.record_holding_entry(aircraft, time)
         self.holding.enqueue(aircraft, time)
+        if self.changes is not None: self.changes.aircraft_added(aircraft)
 
     """
     - This method below records the entry of an aircraft into the takeoff queue at a specific time
@@ -50,46 +191,112 @@ class Airport:
     def handleOutbound(self, aircraft, time: int):
         self.stats.record_takeoff_enqueue(aircraft, time)
         self.takeoff.enqueue(aircraft, time)
+        if self.changes is not None: self.changes.aircraft_added(aircraft)
 
     """
-    - The method below just assigns as many inbound aircraft as possible to eligible available runways.
+    - This method below returns the most preferred free runway on which a plane is clear of wake separation at a given time, or None
+    - Usually that is the first free runway, so the rest of the list is only looked at when it is still separated
+    - With dedicated=True only runways whose mode is op are considered; they come first in the preference order
     """
-    def assignLanding(self, time: SimTime) -> None:
-        for runway in self.runways:
-            if not (runway.isAvailable() and runway.canLand()):
-                continue
+    def _first_clear(self, op: str, plane, time: SimTime, dedicated: bool = False) -> Optional[Runway]:
+        runway = self._first_free(op)
+        if runway is None or (dedicated and runway.mode != op): return None
+        clear = clear_at(runway, plane, op)
+        if clear is None or clear <= time: return runway
 
-            plane = self.holding.dequeue() # Takes a plane out of the holding queue
-            if plane is None: return       # Checks if there's actually a plane. If there isn't, we return
+        order = self._order[op]
+        for rank in sorted(self._free[op])[1:]:
+            runway = order[rank]
+            if dedicated and runway.mode != op: return None
+            if runway.status == "AVAILABLE" and runway.occupancy == "FREE" and runway.currentAircraft is None:
+                clear = clear_at(runway, plane, op)
+                if clear is None or clear <= time: return runway
+        return None
 
-            # The following lines of code below just assigns the plane to the runway that is available for landing. We also record data for the statistics class object at the end
-            duration = 3
-            runway.assign(plane, "LANDING", time, duration)
-            runway.startTime = time                              # Needs to store Start Time 
-            runway.duration = duration                           # Needs to store Duration
-            runway.occupancy = "OCCUPIED"
-            self.stats.record_landing(plane, time)
-            self.stats.record_runway_busy(runway, duration)
+    """
+    - This method below returns the earliest time (not before the given time) at which the next aircraft of a queue ("LANDING" or "TAKEOFF") can start on one of the free runways
+    - It returns None if that queue is empty or no runway is free
+    """
+    def nextClearance(self, op: str, time: SimTime) -> Optional[SimTime]:
+        plane = (self.holding if op == "LANDING" else self.takeoff).peek()
+        if plane is None or self._first_free(op) is None: return None
+
+        order = self._order[op]
+        earliest = None
+        for rank in sorted(self._free[op]):
+            runway = order[rank]
+            if runway.status == "AVAILABLE" and runway.occupancy == "FREE" and runway.currentAircraft is None:
+                clear = clear_at(runway, plane, op)
+                if clear is None or clear <= time: return time
+                if earliest is None or clear < earliest: earliest = clear
+        return earliest
+
+    """
+    - This method below returns how many minutes a plane would occupy a runway for an operation ("LANDING" or "TAKEOFF"), without assigning it
+    - Assignment policies use it to plan ahead with the same occupancy table as assignTo
+    """
+    def occupancyOf(self, runway: Runway, plane, op: str) -> int:
+        return self._occupancy.lookup(runway, plane, op)
+
+    """
+    - The method below just assigns as many inbound aircraft as possible to eligible available runways.
+    - Aircraft keep their queue order: if the next one is still separated on every free runway, nobody lands this tick
+    - With dedicated=True only LANDING runways are used, leaving the MIXED ones to the caller (e.g. an assignment policy)
+    """
+    def assignLanding(self, time: SimTime, dedicated: bool = False) -> None:
+        while True:
+            plane = self.holding.peek()
+            if plane is None: return                          # No plane waiting
+            runway = self._first_clear("LANDING", plane, time, dedicated)  # Most preferred free runway that is clear of wake
+            if runway is None: return
+            self.assignTo(runway, "LANDING", time)
 
     """
     - Description of method: Assigns as many outbound aircraft as possible to eligible available runways.
+    - With dedicated=True only TAKEOFF runways are used, leaving the MIXED ones to the caller (e.g. an assignment policy)
     """
-    def assignTakeOff(self, time: SimTime) -> None:
-        for runway in self.runways:
-            if not (runway.isAvailable() and runway.canTakeOff()):
-                continue
+    def assignTakeOff(self, time: SimTime, dedicated: bool = False) -> None:
+        while True:
+            plane = self.takeoff.peek()
+            if plane is None: return                          # No plane waiting
+            runway = self._first_clear("TAKEOFF", plane, time, dedicated)  # Most preferred free runway that is clear of wake
+            if runway is None: return
+            self.assignTo(runway, "TAKEOFF", time)
 
-            plane = self.takeoff.dequeue()  # Takes a plane out of the takeoff queue
-            if plane is None: return        # Checks if there's actually a plane. If there isn't, we return
+    """
+    - The method below lets the assignment policy hand out the free runways for this tick (by default: landings first, then takeoffs)
+    """
+    def assignRunways(self, time: SimTime) -> None:
+        self.policy.assign(self, time)
 
-            # The following lines of code below just assigns the plane to the runway that is available for takeoff. We also record data for the statistics class object at the end
-            duration = 3
-            runway.assign(plane, "TAKEOFF", time, duration)
-            runway.startTime = time # Needs to store Start Time
-            runway.duration = duration # Needs to store Duration
-            runway.occupancy = "OCCUPIED"
+    """
+    - The method below assigns the next aircraft of the matching queue to a given free runway, for "LANDING" or "TAKEOFF"
+    - It returns False (and changes nothing) if that queue is empty or the wake separation behind the runway's last operation has not passed yet
+    """
+    def assignTo(self, runway: Runway, op: str, time: SimTime) -> bool:
+        queue = self.holding if op == "LANDING" else self.takeoff
+        plane = queue.peek()
+        if plane is None: return False # Checks if there's actually a plane
+        clear = clear_at(runway, plane, op)
+        if clear is not None and clear > time: return False   # Still separated from the previous operation
+        queue.dequeue()                # Takes the plane out of the holding or takeoff queue
+
+        # The following lines of code below just assigns the plane to the runway. We also record data for the statistics class object at the end
+        duration = self._occupancy.lookup(runway, plane, op)   # Depends on aircraft class, operation and runway length
+        runway.assign(plane, op, time, duration)
+        self._file_release(runway)
+        runway.startTime = time                              # Needs to store Start Time
+        runway.duration = duration                           # Needs to store Duration
+        runway.occupancy = "OCCUPIED"
+        if op == "LANDING":
+            self.stats.record_landing(plane, time)
+        else:
             self.stats.record_takeoff(plane, time)
-            self.stats.record_runway_busy(runway, duration)
+        self.stats.record_runway_busy(runway, duration)
+        if self.changes is not None:
+            self.changes.aircraft_changed(plane)
+            self.changes.runway_changed(runway)
+        return True
 
     """
     - This method returns a list of all the avaiable runways for landing or for takeoff by iterating through the list and finding which ones are landing, takeoff or mixed
@@ -103,11 +310,42 @@ class Airport:
     
     """
     - This method updates the runways so that the runways whose time has passed can be freed for future aircraft to land in
+    - Only runways at the top of the release heap are looked at
     """   
     def updateRunways(self,time: SimTime) -> None:
-        for runway in self.runways:
-            if runway.occupiedUntil <= time and runway.occupancy == "OCCUPIED":
-                runway.occupancy = "FREE"
-                runway.occupiedUntil = 0
-                runway.currentAircraft = None
-                runway.currentOperation = None
\ No newline at end of file
+        heap = self._release_heap
+        while heap and heap[0][0] <= time:
+            until, _, runway = heapq.heappop(heap)
+            if self._release_at.get(runway) != until or runway.occupancy != "OCCUPIED":
+                continue    # Stale entry: the runway was freed or rescheduled since
+            del self._release_at[runway]
+            if self.changes is not None:
+                if runway.currentAircraft is not None: self.changes.aircraft_removed(runway.currentAircraft)
+                self.changes.runway_changed(runway)
+            runway.release()
+            self._index_runway(runway)
+
+    """
+    - This method below frees and reopens every runway when the simulation restarts (e.g. the UI reset), and rebuilds the index
+    - Pending releases are dropped with the old index, so no runway is left out of the free heaps
+    """
+    def resetRunways(self) -> None:
+        for runway in self._runways:
+            if self.changes is not None:
+                self.changes.runway_changed(runway)
+            runway.reset()
+        self._rebuild_index()
+
+    """
+    - This method below removes every aircraft from the queues and the runways when the simulation restarts (e.g. the UI reset), then resets the runways
+    - Each discarded aircraft is reported to the change feed as removed, so the UI drops it instead of keeping a stale copy
+    """
+    def clearAircraft(self) -> None:
+        if self.changes is not None:
+            for plane in self.holding.to_list() + self.takeoff.to_list():
+                self.changes.aircraft_removed(plane)
+            for runway in self._runways:
+                if runway.currentAircraft is not None: self.changes.aircraft_removed(runway.currentAircraft)
+        self.holding = HoldingQueue()
+        self.takeoff = TakeOffQueue()
+        self.resetRunways()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Optional
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """
+    What changed in the simulation over some interval.
+
+    Attributes
+    ----------
+    added : FrozenSet[str]
+        Ids of aircraft that entered a queue.
+    removed : FrozenSet[str]
+        Ids of aircraft that left the simulation (landed, took off,
+        diverted or cancelled). An aircraft added and removed within the
+        same interval appears in neither set.
+    changed : FrozenSet[str]
+        Ids of aircraft, not in ``added`` or ``removed``, whose state
+        changed: moved onto a runway or declared a fuel emergency.
+    runways : FrozenSet[Any]
+        Ids of runways that were assigned, released, switched, opened,
+        closed, added or removed.
+    """
+
+    added: FrozenSet[str] = frozenset()
+    removed: FrozenSet[str] = frozenset()
+    changed: FrozenSet[str] = frozenset()
+    runways: FrozenSet[Any] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.runways)
+
+    def then(self, later: "ChangeSet") -> "ChangeSet":
+        """
+        Combine this change set with one that follows it.
+
+        Parameters
+        ----------
+        later : ChangeSet
+            Changes of the interval right after this one.
+
+        Returns
+        -------
+        ChangeSet
+            The changes over both intervals.
+        """
+        added = (self.added - later.removed) | later.added
+        removed = (self.removed | later.removed) - self.added
+        changed = ((self.changed | later.changed) - added) - removed
+        return ChangeSet(frozenset(added), frozenset(removed), frozenset(changed), self.runways | later.runways)
+
+
+EMPTY = ChangeSet()
+
+
+class ChangeFeed:
+    """
+    Collects aircraft and runway changes as the simulation makes them.
+
+    Attach a feed to ``Airport.changes`` to enable it: the airport reports
+    aircraft entering queues, runway assignments and releases, and runway
+    mode and status changes, and the engine reports fuel emergencies,
+    diversions and cancellations. ``drain`` hands out everything collected
+    since the previous call, so a consumer such as the UI only needs to look
+    at what changed instead of re-reading every aircraft and runway. With no
+    feed attached (the default) nothing is collected.
+
+    Fuel remaining and take-off wait follow from the simulation time alone
+    and are not reported as changes.
+    """
+
+    __slots__ = ("_added", "_removed", "_changed", "_runways")
+
+    def __init__(self) -> None:
+        self._added = set()
+        self._removed = set()
+        self._changed = set()
+        self._runways = set()
+
+    def aircraft_added(self, aircraft: Any) -> None:
+        """Record an aircraft entering the holding or take-off queue."""
+        self._added.add(aircraft.id)
+
+    def aircraft_removed(self, aircraft: Any) -> None:
+        """Record an aircraft leaving the simulation."""
+        aid = aircraft.id
+        self._changed.discard(aid)
+        if aid in self._added:
+            self._added.discard(aid)
+        else:
+            self._removed.add(aid)
+
+    def aircraft_changed(self, aircraft: Any) -> None:
+        """Record a change to an aircraft already in the simulation."""
+        aid = aircraft.id
+        if aid not in self._added:
+            self._changed.add(aid)
+
+    def runway_changed(self, runway: Any) -> None:
+        """Record a change to a runway, or its addition or removal."""
+        self._runways.add(runway.id)
+
+    def drain(self, before: Optional[ChangeSet] = None) -> ChangeSet:
+        """
+        Return the changes collected since the last drain and start afresh.
+
+        Parameters
+        ----------
+        before : ChangeSet, optional
+            Earlier changes a consumer has not seen yet; they are combined
+            with the new ones.
+
+        Returns
+        -------
+        ChangeSet
+            The collected changes.
+        """
+        changes = ChangeSet(frozenset(self._added), frozenset(self._removed), frozenset(self._changed), frozenset(self._runways))
+        self._added.clear()
+        self._removed.clear()
+        self._changed.clear()
+        self._runways.clear()
+        return before.then(changes) if before is not None else changes
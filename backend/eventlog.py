@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Union
+import json
+
+# Event kinds, in the order an aircraft usually goes through them
+SPAWN = "spawn"
+ENTER_HOLDING = "hold"
+FUEL_EMERGENCY = "fuel"
+LAND = "land"
+ENQUEUE_TAKEOFF = "enqueue"
+TAKEOFF = "takeoff"
+DIVERT = "divert"
+CANCEL = "cancel"
+
+EVENT_KINDS = (SPAWN, ENTER_HOLDING, FUEL_EMERGENCY, LAND, ENQUEUE_TAKEOFF, TAKEOFF, DIVERT, CANCEL)
+
+# Lines held in memory before they are written out
+DEFAULT_BUFFER_EVENTS = 4096
+
+
+class EventLog:
+    """
+    Append-only, newline-delimited JSON log of per-aircraft events.
+
+    Each event is one compact JSON object per line, e.g.
+    ``{"t":12,"ev":"land","id":"I3"}``, with extra fields for some kinds.
+    Lines are collected in a fixed-size buffer and written out in one call
+    when it fills, so memory stays bounded however long the run is.
+
+    Attach a log to ``Statistics.event_log`` to enable it. With no log
+    attached (the default) nothing is formatted or written.
+
+    Parameters
+    ----------
+    target : str or Path or text file
+        File to write to. A path is opened (truncated) by the log and closed
+        by ``close``; an open file is only flushed.
+    buffer_events : int, optional
+        Number of events held in memory before writing. Default is 4096.
+    """
+
+    def __init__(self, target: Union[str, Path, IO[str]], buffer_events: int = DEFAULT_BUFFER_EVENTS) -> None:
+        if buffer_events < 1:
+            raise ValueError("buffer_events must be >= 1.")
+        if isinstance(target, (str, Path)):
+            self._file: IO[str] = open(target, "w", encoding="utf-8", newline="\n")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self._buffer: List[str] = []
+        self._capacity = int(buffer_events)
+        self.count = 0
+
+    def emit(self, kind: str, time: int, aircraft: Any = None, **fields: Any) -> None:
+        """
+        Append one event.
+
+        Parameters
+        ----------
+        kind : str
+            One of ``EVENT_KINDS``.
+        time : int
+            Simulation time of the event.
+        aircraft : Any, optional
+            The aircraft concerned; its ``id`` is logged.
+        **fields : Any
+            Extra JSON-serialisable values for this event.
+        """
+        event: Dict[str, Any] = {"t": int(time), "ev": kind}
+        if aircraft is not None:
+            event["id"] = getattr(aircraft, "id", None)
+        if fields:
+            event.update(fields)
+        self._buffer.append(json.dumps(event, separators=(",", ":")))
+        self.count += 1
+        if len(self._buffer) >= self._capacity:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        """Write the buffered lines out and empty the buffer."""
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+
+    def flush(self) -> None:
+        """Write out buffered events and flush the file."""
+        self._write_buffer()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush, and close the file if the log opened it."""
+        if self._file.closed:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def read_events(path: Union[str, Path], kind: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the events of a log file one at a time.
+
+    Parameters
+    ----------
+    path : str or Path
+        Event log written by ``EventLog``.
+    kind : str, optional
+        Only yield events of this kind.
+
+    Yields
+    ------
+    Dict[str, Any]
+        One event per line.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if kind is None or event["ev"] == kind:
+                yield event
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Tuple
+
+# Values below EXACT_LIMIT get a bucket each; above it every power of two is
+# split into SUB_BUCKETS buckets, so a bucket is at most 1/SUB_BUCKETS of its value wide
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+EXACT_LIMIT = 2 * SUB_BUCKETS
+
+
+def bucket_index(value: int) -> int:
+    """
+    Map a non-negative integer to its histogram bucket.
+
+    Parameters
+    ----------
+    value : int
+        The value to bucket. Negative values count as 0.
+
+    Returns
+    -------
+    int
+        Bucket index; buckets are ordered by value.
+    """
+    if value < EXACT_LIMIT:
+        return max(0, value)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return EXACT_LIMIT + (shift - 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """
+    Return the smallest and largest value that fall into a bucket.
+
+    Parameters
+    ----------
+    index : int
+        Bucket index from ``bucket_index``.
+
+    Returns
+    -------
+    Tuple[int, int]
+        Inclusive (low, high) bounds of the bucket.
+    """
+    if index < EXACT_LIMIT:
+        return index, index
+    shift, sub = divmod(index - EXACT_LIMIT, SUB_BUCKETS)
+    shift += 1
+    mantissa = sub + SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Streaming histogram of non-negative integer durations (minutes).
+
+    An HDR-style log-linear histogram: values below ``EXACT_LIMIT`` are
+    counted exactly, larger ones in buckets whose width is at most
+    1/``SUB_BUCKETS`` (about 3%) of their value. Memory depends only on the
+    range of the values, never on how many were recorded, and two histograms
+    merge exactly by adding their bucket counts.
+
+    Attributes
+    ----------
+    counts : Dict[int, int]
+        Number of values recorded per bucket index.
+    count : int
+        Total number of values recorded.
+    max : int
+        Largest value recorded.
+    """
+
+    __slots__ = ("counts", "count", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.max = 0
+
+    def record(self, value: int, n: int = 1) -> None:
+        """
+        Record ``value`` ``n`` times.
+
+        Parameters
+        ----------
+        value : int
+            Value to record. Negative values count as 0.
+        n : int, optional
+            Number of occurrences. Default is 1.
+        """
+        index = value if 0 <= value < EXACT_LIMIT else bucket_index(value)   # Exact range inlined: it is the common case
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + n
+        self.count += n
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add the counts of another histogram to this one.
+
+        Parameters
+        ----------
+        other : Histogram
+            Histogram to fold in; it is left unchanged.
+        """
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Return the value at quantile ``q`` (nearest rank).
+
+        Exact for values below ``EXACT_LIMIT``; above it the result is the
+        top of the value's bucket, capped at the largest recorded value.
+
+        Parameters
+        ----------
+        q : float
+            Quantile in [0, 1], e.g. 0.99 for the 99th percentile.
+
+        Returns
+        -------
+        float
+            The quantile, or 0.0 if nothing was recorded.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1].")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return float(min(bucket_bounds(index)[1], self.max))
+        return float(self.max)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Histogram):
+            return NotImplemented
+        return self.counts == other.counts and self.count == other.count and self.max == other.max
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> Tuple[Dict[int, int], int, int]:
+        return self.counts, self.count, self.max
+
+    def __setstate__(self, state: Tuple[Dict[int, int], int, int]) -> None:
+        self.counts, self.count, self.max = state
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, max={self.max})"
@@ -0,0 +1,87 @@
+"""
+Runway occupancy times by aircraft class, operation and runway length.
+
+An aircraft occupies a runway for a base time that depends on its class and
+operation. If the runway is shorter than the class needs, each started
+``SHORTFALL_STEP_M`` metres of shortfall adds a minute (longer roll-out or
+take-off run). ``OccupancyTable`` evaluates this once per runway when the
+runway set is built, so assignments are a dictionary lookup.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .aircraft import AIRCRAFT_CLASSES, DEFAULT_CLASS
+
+OPERATIONS = ("LANDING", "TAKEOFF")
+
+# Base occupancy in minutes on a long enough runway
+BASE_OCCUPANCY_MIN: Dict[Tuple[str, str], int] = {
+    ("LIGHT", "LANDING"): 2,
+    ("LIGHT", "TAKEOFF"): 2,
+    ("MEDIUM", "LANDING"): 3,
+    ("MEDIUM", "TAKEOFF"): 3,
+    ("HEAVY", "LANDING"): 4,
+    ("HEAVY", "TAKEOFF"): 4,
+}
+
+# Runway length (metres) each class needs to achieve its base occupancy
+REQUIRED_LENGTH_M: Dict[str, int] = {"LIGHT": 1200, "MEDIUM": 2000, "HEAVY": 3000}
+
+SHORTFALL_STEP_M = 500
+
+
+def occupancy_minutes(aircraft_class: str, operation: str, runway_length: Optional[int]) -> int:
+    """
+    Compute the runway occupancy of one operation.
+
+    Parameters
+    ----------
+    aircraft_class : str
+        One of ``AIRCRAFT_CLASSES``.
+    operation : str
+        ``LANDING`` or ``TAKEOFF``.
+    runway_length : int, optional
+        Runway length in metres. None means long enough.
+
+    Returns
+    -------
+    int
+        Occupancy in minutes.
+    """
+    minutes = BASE_OCCUPANCY_MIN[(aircraft_class, operation)]
+    if runway_length is not None:
+        shortfall = REQUIRED_LENGTH_M[aircraft_class] - runway_length
+        if shortfall > 0:
+            minutes += math.ceil(shortfall / SHORTFALL_STEP_M)
+    return minutes
+
+
+class OccupancyTable:
+    """
+    Precomputed occupancy minutes for every runway, class and operation.
+
+    Parameters
+    ----------
+    runways : Iterable[Any]
+        Runways of the scenario. Their ``length`` is read once, here.
+    """
+
+    def __init__(self, runways: Iterable[Any]) -> None:
+        self._table: Dict[Any, Dict[Tuple[str, str], int]] = {
+            runway: {
+                (cls, op): occupancy_minutes(cls, op, getattr(runway, "length", None))
+                for cls in AIRCRAFT_CLASSES
+                for op in OPERATIONS
+            }
+            for runway in runways
+        }
+
+    def lookup(self, runway: Any, aircraft: Any, operation: str) -> int:
+        """
+        Return the occupancy of ``aircraft`` performing ``operation`` on ``runway``.
+
+        Aircraft without an ``aircraft_class`` attribute count as ``MEDIUM``.
+        """
+        return self._table[runway][(getattr(aircraft, "aircraft_class", DEFAULT_CLASS), operation)]
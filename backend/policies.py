@@ -0,0 +1,337 @@
+"""
+Runway assignment policies.
+
+Each tick, ``Airport.assignRunways`` asks its policy to hand the free runways
+to waiting aircraft. A policy is any object with an
+``assign(airport, time)`` method that uses the airport's ``freeRunways``,
+``assignTo``, ``assignLanding`` and ``assignTakeOff`` operations.
+
+``GreedyPolicy`` is the original behaviour: land as many aircraft as
+possible (dedicated LANDING runways first, then MIXED ones), then fill the
+remaining runways with takeoffs. ``OptimizingPolicy`` instead decides how
+many free MIXED runways go to landings and how many to takeoffs, by rolling
+each option forward and picking the one with the lowest projected delay and
+diversion/cancellation penalty.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import time as _time
+from collections import deque
+from typing import Any, Callable, List, Optional, Tuple
+
+from .aircraft import DEFAULT_CLASS
+from .separation import clear_at
+
+
+class _PlannedRunway:
+    """A runway as simulated in a rollout: when it is free again and its last operation."""
+
+    __slots__ = ("runway", "mode", "free_at", "lastOperation", "lastOperationAt", "lastClass")
+
+    def __init__(self, runway: Any, free_at: int) -> None:
+        self.runway = runway
+        self.mode = runway.mode
+        self.free_at = free_at
+        self.lastOperation = getattr(runway, "lastOperation", None)
+        self.lastOperationAt = getattr(runway, "lastOperationAt", None)
+        self.lastClass = getattr(runway, "lastClass", None)
+
+    def start(self, aircraft: Any, op: str, time: int, occupancy: Callable[[Any, Any, str], int]) -> bool:
+        """Start ``op`` at ``time`` if the runway is clear of wake separation; return whether it started."""
+        clear = clear_at(self, aircraft, op)
+        if clear is not None and clear > time:
+            return False
+        self.free_at = time + occupancy(self.runway, aircraft, op)
+        self.lastOperation = op
+        self.lastOperationAt = time
+        self.lastClass = getattr(aircraft, "aircraft_class", DEFAULT_CLASS)
+        return True
+
+
+class GreedyPolicy:
+    """Landings first, then takeoffs, each on the most preferred free runway."""
+
+    name = "greedy"
+
+    def assign(self, airport: Any, time: int) -> None:
+        """
+        Assign waiting aircraft to free runways.
+
+        Parameters
+        ----------
+        airport : Airport
+            The airport whose runways and queues are used.
+        time : int
+            Current simulation time.
+        """
+        airport.assignLanding(time)
+        airport.assignTakeOff(time)
+
+
+class OptimizingPolicy:
+    """
+    Rollout policy choosing the landing/takeoff split on MIXED runways.
+
+    Dedicated runways are always used greedily. When more aircraft are
+    waiting than there are free MIXED runways, each split ``k`` (``k``
+    MIXED runways for landings, the rest for takeoffs) is evaluated by
+    simulating the next ``lookahead_min`` minutes with the greedy policy,
+    ignoring new arrivals. Each simulated operation occupies its runway for
+    as long as ``Airport.occupancyOf`` says it would in the simulation (by
+    aircraft class, operation and runway length), and an aircraft only starts
+    once it is clear of the wake separation behind the runway's previous
+    operation (``separation.clear_at``), as ``Airport.assignTo`` requires.
+    The cost of a rollout is the total minutes waited
+    plus a penalty per projected diversion and cancellation. The split with
+    the lowest cost is applied. The policy is work-conserving: no runway is
+    left idle while an aircraft it can serve is waiting.
+
+    Parameters
+    ----------
+    fuel_min_min : int, optional
+        Fuel (minutes) at which an aircraft diverts. Default is 10.
+    max_takeoff_wait_min : int, optional
+        Longest wait before a departure is cancelled. Default is 30.
+    tick_size_min : int, optional
+        Simulation tick length. Default is 1.
+    occupancy_min : int, optional
+        Minutes a runway is occupied per operation, used only for airports
+        without ``occupancyOf``. Default is 3.
+    lookahead_min : int, optional
+        Rollout horizon. Default is 30.
+    diversion_cost : float, optional
+        Penalty per projected diversion, in minutes of delay. Default is 120.
+    cancellation_cost : float, optional
+        Penalty per projected cancellation, in minutes of delay. Default is 60.
+    budget_steps : int, optional
+        Per-tick compute budget, as rollout steps (ticks simulated). Splits
+        are evaluated greedy-first until the budget runs out. Default is
+        2000. The result is deterministic.
+    budget_s : float, optional
+        Optional additional per-tick wall-clock budget in seconds. Runs that
+        hit it are not reproducible. Default is None.
+    """
+
+    name = "optimizing"
+
+    def __init__(
+        self,
+        fuel_min_min: int = 10,
+        max_takeoff_wait_min: int = 30,
+        tick_size_min: int = 1,
+        occupancy_min: int = 3,
+        lookahead_min: int = 30,
+        diversion_cost: float = 120.0,
+        cancellation_cost: float = 60.0,
+        budget_steps: int = 2000,
+        budget_s: Optional[float] = None,
+    ) -> None:
+        self.fuel_min_min = fuel_min_min
+        self.max_takeoff_wait_min = max_takeoff_wait_min
+        self.tick_size_min = tick_size_min
+        self.occupancy_min = occupancy_min
+        self.lookahead_min = lookahead_min
+        self.diversion_cost = diversion_cost
+        self.cancellation_cost = cancellation_cost
+        self.budget_steps = budget_steps
+        self.budget_s = budget_s
+
+    @classmethod
+    def from_params(cls, params: Any, **kwargs: Any) -> "OptimizingPolicy":
+        """
+        Build a policy whose thresholds match the simulation parameters.
+
+        Parameters
+        ----------
+        params : SimulationParams
+            Simulation configuration.
+        **kwargs : Any
+            Further constructor arguments, e.g. ``budget_steps``.
+
+        Returns
+        -------
+        OptimizingPolicy
+            The configured policy.
+        """
+        return cls(
+            fuel_min_min=params.fuel_min_min,
+            max_takeoff_wait_min=params.max_takeoff_wait_min,
+            tick_size_min=params.tick_size_min,
+            **kwargs,
+        )
+
+    def assign(self, airport: Any, time: int) -> None:
+        """
+        Assign waiting aircraft to free runways.
+
+        Parameters
+        ----------
+        airport : Airport
+            The airport whose runways and queues are used.
+        time : int
+            Current simulation time.
+        """
+        # Dedicated runways: exactly what GreedyPolicy does on them
+        airport.assignLanding(time, dedicated=True)
+        airport.assignTakeOff(time, dedicated=True)
+
+        mixed = [r for r in airport.freeRunways("LANDING") if r.mode == "MIXED"]
+        if not mixed:
+            return
+
+        landings = airport.holding.size()
+        takeoffs = airport.takeoff.size()
+        k = min(len(mixed), landings)
+        if landings and takeoffs and landings + takeoffs > len(mixed):
+            k = self._choose_split(airport, time, mixed)
+
+        for i, runway in enumerate(mixed):
+            first, second = ("LANDING", "TAKEOFF") if i < k else ("TAKEOFF", "LANDING")
+            if not airport.assignTo(runway, first, time):
+                airport.assignTo(runway, second, time)
+
+    def _choose_split(self, airport: Any, time: int, mixed: List[Any]) -> int:
+        """Return how many of the free MIXED runways should take landings."""
+        dt = self.tick_size_min
+        fuel_out = {id(a): t for t, a in airport.holding.fuel_out_times()}
+        # (latest tick at which the aircraft can still be served, landing position, aircraft) for each waiting arrival
+        landings = [
+            (fuel_out[id(a)] - dt - self.fuel_min_min if id(a) in fuel_out else math.inf, i, a)
+            for i, a in enumerate(airport.holding.landing_order())
+        ]
+        deadlines = list(landings)
+        heapq.heapify(deadlines)
+        # Departures in queue order; they joined in that order, so their deadlines never decrease
+        takeoffs = [(a.joinedTakeoffQueueAt + self.max_takeoff_wait_min, a) for a in airport.takeoff.to_list()]
+        # (runway, first tick at which it is free) for the available runways not being decided now
+        others = [
+            (r, max(time + dt, r.occupiedUntil) if r.occupancy == "OCCUPIED" else time + dt)
+            for r in airport.runways
+            if r.status == "AVAILABLE" and r.mode in ("LANDING", "TAKEOFF", "MIXED") and r not in mixed
+        ]
+        occupancy = getattr(airport, "occupancyOf", None) or (lambda runway, plane, op: self.occupancy_min)
+
+        greedy = min(len(mixed), len(landings))
+        candidates = [greedy] + [k for k in range(len(mixed), -1, -1) if k != greedy]
+        steps_per_rollout = max(1, self.lookahead_min // dt)
+        steps_left = self.budget_steps
+        started = _time.perf_counter()
+
+        best_k, best_cost = greedy, math.inf
+        for k in candidates:
+            if steps_left < steps_per_rollout and best_cost < math.inf:
+                break
+            if self.budget_s is not None and best_cost < math.inf and _time.perf_counter() - started > self.budget_s:
+                break
+            steps_left -= steps_per_rollout
+            cost = self._rollout(k, mixed, landings, deadlines, takeoffs, others, occupancy, time)
+            if cost < best_cost:
+                best_k, best_cost = k, cost
+        return best_k
+
+    def _rollout(
+        self,
+        k: int,
+        mixed: List[Any],
+        landing_queue: List[Tuple[float, int, Any]],
+        landing_deadlines: List[Tuple[float, int, Any]],
+        takeoff_queue: List[Tuple[int, Any]],
+        others: List[Tuple[Any, int]],
+        occupancy: Callable[[Any, Any, str], int],
+        time: int,
+    ) -> float:
+        """
+        Projected cost of giving ``k`` of the free MIXED runways to landings.
+
+        Arrivals are served from a deque in landing order and divert from a
+        min-heap of their deadlines. An arrival leaving one of them is only
+        marked as gone and dropped from the other when it surfaces there, so
+        every step is O(log n) like the holding queue's fuel index.
+        """
+        dt = self.tick_size_min
+        end = time + self.lookahead_min
+        landings = deque(landing_queue)
+        deadlines = list(landing_deadlines)   # A copy of a heap is a heap
+        takeoffs = deque(takeoff_queue)
+        gone = set()                          # Landing positions served or diverted
+        waiting = len(landings)
+        cost = 0.0
+
+        def land(state: _PlannedRunway, t: int) -> bool:
+            nonlocal waiting
+            while landings and landings[0][1] in gone:
+                landings.popleft()
+            if not landings or not state.start(landings[0][2], "LANDING", t, occupancy):
+                return False
+            gone.add(landings.popleft()[1])
+            waiting -= 1
+            return True
+
+        def take_off(state: _PlannedRunway, t: int) -> bool:
+            if not takeoffs or not state.start(takeoffs[0][1], "TAKEOFF", t, occupancy):
+                return False
+            takeoffs.popleft()
+            return True
+
+        # Decision at `time`: k landings, the rest takeoffs, leftovers either way
+        runways = [_PlannedRunway(r, free_at) for r, free_at in others]
+        for i, runway in enumerate(mixed):
+            state = _PlannedRunway(runway, time + dt)
+            if i < k:
+                land(state, time) or take_off(state, time)
+            else:
+                take_off(state, time) or land(state, time)
+            runways.append(state)
+
+        t = time + dt
+        while t <= end and (waiting or takeoffs):
+            # Constraints: aircraft past their deadline divert or are cancelled
+            while deadlines and deadlines[0][0] <= t:
+                position = heapq.heappop(deadlines)[1]
+                if position not in gone:
+                    gone.add(position)
+                    waiting -= 1
+                    cost += self.diversion_cost
+            while takeoffs and takeoffs[0][0] < t:
+                takeoffs.popleft()
+                cost += self.cancellation_cost
+
+            # Each free runway takes the next landing, or else the next takeoff, once it is clear of wake
+            for state in runways:
+                if state.free_at > t:
+                    continue
+                if not (state.mode != "TAKEOFF" and land(state, t)) and state.mode != "LANDING":
+                    take_off(state, t)
+
+            # Everyone still waiting accrues another tick of delay
+            cost += (waiting + len(takeoffs)) * dt
+            t += dt
+        return cost
+
+
+def make_policy(name: str, params: Any = None) -> Any:
+    """
+    Create a policy by name.
+
+    Parameters
+    ----------
+    name : str
+        ``"greedy"`` or ``"optimizing"``.
+    params : SimulationParams, optional
+        Used to configure the optimizing policy's thresholds.
+
+    Returns
+    -------
+    GreedyPolicy | OptimizingPolicy
+        The policy.
+    """
+    if name == GreedyPolicy.name:
+        return GreedyPolicy()
+    if name == OptimizingPolicy.name:
+        return OptimizingPolicy.from_params(params) if params is not None else OptimizingPolicy()
+    raise ValueError(f"unknown policy {name!r}; expected 'greedy' or 'optimizing'.")
+
+
+POLICIES = (GreedyPolicy.name, OptimizingPolicy.name)
@@ -1,6 +1,7 @@
 from .aircraft import Aircraft
 from collections import deque
-from queue import PriorityQueue
+from itertools import islice
+import heapq
 
 
 class HoldingQueue:
@@ -9,14 +10,41 @@ class HoldingQueue:
     Aircraft are prioritised based on emergency status. Emergency aircraft
     are placed before non-emergency aircraft. Within the same priority level,
     aircraft follow FIFO ordering using an arrival counter.
+
+    The queue is backed by plain ``heapq`` lists rather than
+    ``queue.PriorityQueue``: the engine is single-threaded, so no locking is
+    needed. There are only two priority levels, so each has its own heap keyed
+    by arrival order. Queue entries are ``[priority, order, aircraft]`` lists,
+    which lets a fuel emergency flip an entry's priority in place and file it
+    in the emergency heap. The stale slot in the normal heap is skipped when
+    it surfaces.
+
+    The queue also indexes every aircraft by the time its fuel runs out
+    (entry time plus the fuel it entered with). The engine uses these min-heaps
+    to find aircraft crossing a fuel threshold without scanning the queue.
+    Removed entries are discarded lazily when they surface.
     """
 
     def __init__(self):
         """Initialise an empty holding queue."""
-        self.items = PriorityQueue()
         self.arrival_order = 0
         self.orderingRule = "Emergency-first"
 
+        # (order, seq, entry) heaps, one per priority level
+        self._emergency = []
+        self._normal = []
+        self._next_seq = 0
+
+        # Live queue entry for each arrival order
+        self._entries = {}
+        # Fuel index: (fuel_out_at, ticket, order, aircraft) min-heaps
+        self._fuel_out = []
+        self._fuel_alerts = []
+        self._tickets = {}
+        self._next_ticket = 0
+        # Fuel-out time of each indexed arrival order
+        self._fuel_due = {}
+
     def __len__(self):
         """Return the number of aircraft in the queue."""
         return self.size()
@@ -36,7 +64,8 @@ class HoldingQueue:
         else:
             emergency_priority = 1
 
-        self.items.put((emergency_priority, self.arrival_order, a))
+        self._put([emergency_priority, self.arrival_order, a])
+        self._index_fuel(a, time, self.arrival_order)
         self.arrival_order += 1
 
         a.enteredHoldingAt = time
@@ -62,7 +91,8 @@ class HoldingQueue:
         else:
             emergency_priority = 1
 
-        self.items.put((emergency_priority, order, a))
+        self._put([emergency_priority, order, a])
+        self._index_fuel(a, time, order)
         a.enteredHoldingAt = time
 
     def dequeue_with_order(self):
@@ -73,9 +103,13 @@ class HoldingQueue:
         tuple | None
             Tuple of (priority, order, aircraft) or None if queue empty.
         """
-        if self.items.empty():
+        entry = self._head()
+        if entry is None:
             return None
-        emergency_priority, order, aircraft = self.items.get()
+
+        heapq.heappop(self._emergency if entry[0] == 0 else self._normal)
+        emergency_priority, order, aircraft = entry
+        self._discard(order)
         return emergency_priority, order, aircraft
 
     def dequeue(self) -> Aircraft | None:
@@ -86,25 +120,232 @@ class HoldingQueue:
         Aircraft | None
             The next aircraft or None if the queue is empty.
         """
-        if self.items.empty():
+        item = self.dequeue_with_order()
+        if item is None:
             return None
 
-        _, _, aircraft_obj = self.items.get()
+        _, _, aircraft_obj = item
         return aircraft_obj
 
     def peek(self) -> Aircraft | None:
         """Return the next aircraft without removing it."""
-        if self.items.empty():
-            return None
-        return self.items.queue[0][2]
+        entry = self._head()
+        return None if entry is None else entry[2]
 
     def size(self) -> int:
         """Return the number of aircraft in the holding queue."""
-        return self.items.qsize()
+        return len(self._entries)
 
     def to_list(self):
-        """Return a list snapshot of the queue for UI or debugging."""
-        return [t[2] for t in list(self.items.queue)]
+        """Return the queued aircraft in no particular order.
+
+        Use ``landing_order`` when the order matters, e.g. for display.
+        """
+        return [
+            item[2][2]
+            for priority, heap in ((0, self._emergency), (1, self._normal))
+            for item in heap
+            if self._is_live(item[2], priority)
+        ]
+
+    def landing_order(self):
+        """Return the queued aircraft in the order they would be dequeued."""
+        return [entry[2] for entry in sorted(self._entries.values(), key=lambda entry: (entry[0], entry[1]))]
+
+    def head(self, n: int | None = None):
+        """Return the first ``n`` aircraft in landing order with their fuel-out times.
+
+        Only the heap entries ahead of the ``n``-th aircraft (and the stale
+        slots among them) are visited, so the cost depends on ``n`` rather
+        than on the length of the queue. Nothing is modified.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of aircraft. Defaults to the whole queue.
+
+        Returns
+        -------
+        list
+            List of (fuel_out_at, aircraft) tuples; fuel_out_at is None for
+            aircraft without fuel state.
+        """
+        if n is None:
+            n = len(self._entries)
+        entries = self._first_live(self._emergency, 0, n)
+        entries += self._first_live(self._normal, 1, n - len(entries))
+        return [(self._fuel_due.get(entry[1]), entry[2]) for entry in entries]
+
+    def remove(self, order: int) -> None:
+        """Remove the aircraft with the given arrival order from the queue.
+
+        Parameters
+        ----------
+        order : int
+            Arrival order of the aircraft to remove.
+        """
+        if order in self._entries:
+            self._discard(order)
+
+    def promote(self, order: int) -> None:
+        """Move a queued aircraft to emergency priority, keeping its FIFO position.
+
+        The entry's priority is changed in place; it keeps its arrival order,
+        so it lines up behind earlier emergencies and ahead of later ones.
+
+        Parameters
+        ----------
+        order : int
+            Arrival order of the aircraft that declared an emergency.
+        """
+        entry = self._entries.get(order)
+        if entry is None or entry[0] == 0:
+            return
+
+        entry[0] = 0
+        self._push(self._emergency, entry)
+
+    def pop_fuel_alerts(self, cutoff: int):
+        """Return aircraft whose fuel runs out at or before ``cutoff``.
+
+        Each aircraft is reported at most once, so the caller can use this
+        to declare fuel emergencies. The aircraft stay in the queue.
+
+        Parameters
+        ----------
+        cutoff : int
+            Latest fuel-out time to report.
+
+        Returns
+        -------
+        list
+            List of (fuel_out_at, order, aircraft) tuples.
+        """
+        due = []
+        heap = self._fuel_alerts
+        while heap and heap[0][0] <= cutoff:
+            fuel_out_at, ticket, order, aircraft = heapq.heappop(heap)
+            if self._tickets.get(order) == ticket:
+                due.append((fuel_out_at, order, aircraft))
+        return due
+
+    def remove_fuel_out(self, cutoff: int):
+        """Remove and return aircraft whose fuel runs out at or before ``cutoff``.
+
+        Parameters
+        ----------
+        cutoff : int
+            Latest fuel-out time to remove.
+
+        Returns
+        -------
+        list
+            List of (fuel_out_at, order, aircraft) tuples, earliest first.
+        """
+        due = []
+        heap = self._fuel_out
+        while heap and heap[0][0] <= cutoff:
+            fuel_out_at, ticket, order, aircraft = heapq.heappop(heap)
+            if self._tickets.get(order) == ticket:
+                self._discard(order)
+                due.append((fuel_out_at, order, aircraft))
+        return due
+
+    def next_fuel_out(self, alerts: bool = False) -> int | None:
+        """Return the earliest fuel-out time among queued aircraft.
+
+        Parameters
+        ----------
+        alerts : bool, optional
+            If True, only consider aircraft not yet reported by
+            ``pop_fuel_alerts``.
+
+        Returns
+        -------
+        int | None
+            Earliest fuel-out time, or None if no aircraft is indexed.
+        """
+        heap = self._fuel_alerts if alerts else self._fuel_out
+        while heap and self._tickets.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def fuel_out_times(self):
+        """Return (fuel_out_at, aircraft) pairs for every indexed aircraft in the queue."""
+        return [
+            (fuel_out_at, aircraft)
+            for fuel_out_at, ticket, order, aircraft in self._fuel_out
+            if self._tickets.get(order) == ticket
+        ]
+
+    def _put(self, entry) -> None:
+        """File a queue entry under its priority and make it live for its arrival order."""
+        self._entries[entry[1]] = entry
+        self._push(self._emergency if entry[0] == 0 else self._normal, entry)
+
+    def _push(self, heap, entry) -> None:
+        """Push an entry onto one of the priority heaps."""
+        heapq.heappush(heap, (entry[1], self._next_seq, entry))
+        self._next_seq += 1
+
+    def _head(self):
+        """Return the live entry at the front of the queue, dropping stale slots."""
+        if not self._entries:
+            return None
+        for priority, heap in ((0, self._emergency), (1, self._normal)):
+            while heap and not self._is_live(heap[0][2], priority):
+                heapq.heappop(heap)
+            if heap:
+                return heap[0][2]
+        return None
+
+    def _is_live(self, entry, priority: int) -> bool:
+        """Return whether an entry in the given priority heap is still queued there."""
+        return entry[0] == priority and self._entries.get(entry[1]) is entry
+
+    def _discard(self, order: int) -> None:
+        """Forget an arrival order; its heap entries are dropped lazily."""
+        del self._entries[order]
+        self._tickets.pop(order, None)
+        self._fuel_due.pop(order, None)
+
+    def _first_live(self, heap, priority: int, n: int):
+        """Return the first ``n`` live entries of a priority heap in order, without popping.
+
+        Walks the heap best-first from the root: a slot's children can only
+        come after it, so they are only looked at once the slot is reached.
+        """
+        found = []
+        frontier = [(heap[0], 0)] if heap and n > 0 else []
+        while frontier and len(found) < n:
+            item, i = heapq.heappop(frontier)
+            if self._is_live(item[2], priority):
+                found.append(item[2])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+    def _index_fuel(self, a: Aircraft, time: int, order: int) -> None:
+        """Index an aircraft by the time its fuel runs out.
+
+        Aircraft without fuel state are not indexed.
+        """
+        fuel = getattr(a, "fuelRemaining", None)
+        if fuel is None:
+            return
+
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._tickets[order] = ticket
+
+        fuel_out_at = int(time) + int(fuel)
+        self._fuel_due[order] = fuel_out_at
+        heapq.heappush(self._fuel_out, (fuel_out_at, ticket, order, a))
+
+        emergency = getattr(a, "emergency", None)
+        if not getattr(emergency, "fuel_emergency", False):
+            heapq.heappush(self._fuel_alerts, (fuel_out_at, ticket, order, a))
 
 
 class TakeOffQueue:
@@ -144,6 +385,31 @@ class TakeOffQueue:
             return None
         return self.items[0]
 
+    def expire(self, now: int, max_wait: int) -> list[Aircraft]:
+        """Remove and return the aircraft that have waited longer than ``max_wait``.
+
+        Aircraft join in time order, so ``joinedTakeoffQueueAt`` never
+        decreases along the queue. Only the head is examined and popped; the
+        rest of the queue is left untouched.
+
+        Parameters
+        ----------
+        now : int
+            Current simulation time.
+        max_wait : int
+            Longest permitted wait in the queue.
+
+        Returns
+        -------
+        list[Aircraft]
+            The expired aircraft, oldest first.
+        """
+        items = self.items
+        expired = []
+        while items and now - items[0].joinedTakeoffQueueAt > max_wait:
+            expired.append(items.popleft())
+        return expired
+
     def size(self) -> int:
         """Return the number of aircraft in the queue."""
         return len(self.items)
@@ -156,3 +422,7 @@ class TakeOffQueue:
         """Return a list snapshot of the queue for UI or debugging."""
         return list(self.items)
 
+    def head(self, n: int | None = None):
+        """Return the first ``n`` aircraft in queue order (all if ``n`` is None)."""
+        return list(islice(self.items, n))
+
@@ -0,0 +1,248 @@
+"""
+Monte Carlo replications of a simulation configuration.
+
+``run_replications`` runs N independent copies of one ``SimulationParams``
+configuration, each with its own derived seed, across a process pool. The
+per-run ``Statistics`` objects are merged into pooled statistics, and each
+report metric is summarised across runs with its mean, confidence interval
+and percentiles.
+"""
+from __future__ import annotations
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence
+
+from .SimulationParameters import SimulationParams
+from .run import build_engine
+from .statistics import Statistics
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    """
+    Summary of one report metric across replications.
+
+    Parameters
+    ----------
+    mean : float
+        Sample mean across replications.
+    stdev : float
+        Sample standard deviation (0 for a single replication).
+    ci_low : float
+        Lower bound of the confidence interval for the mean.
+    ci_high : float
+        Upper bound of the confidence interval for the mean.
+    percentiles : Dict[float, float]
+        Requested percentiles of the per-replication values.
+    """
+    mean: float
+    stdev: float
+    ci_low: float
+    ci_high: float
+    percentiles: Dict[float, float]
+
+
+@dataclass
+class ReplicationResult:
+    """
+    Outcome of a batch of replications.
+
+    Parameters
+    ----------
+    seeds : List[int]
+        Seed used by each replication, in order.
+    reports : List[Dict[str, float]]
+        ``Statistics.report()`` of each replication, in the same order.
+    pooled : Statistics
+        All replications merged into one ``Statistics`` object.
+    summary : Dict[str, MetricSummary]
+        Per-metric summary across replications.
+    """
+    seeds: List[int]
+    reports: List[Dict[str, float]]
+    pooled: Statistics
+    summary: Dict[str, MetricSummary] = field(default_factory=dict)
+
+
+def derive_seeds(seed: Optional[int], n: int) -> List[int]:
+    """
+    Derive independent per-replication seeds from one base seed.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Base seed. None draws a fresh base seed from the operating system.
+    n : int
+        Number of seeds to derive.
+
+    Returns
+    -------
+    List[int]
+        ``n`` seeds. The i-th seed depends only on the base seed and i.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(63) for _ in range(n)]
+
+
+def run_replication(
+    params: SimulationParams,
+    duration_min: int,
+    seed: int,
+    runway_modes: Optional[Sequence[str]] = None,
+) -> Statistics:
+    """
+    Run a single replication and return its statistics.
+
+    This is the unit of work sent to pool workers, so it must stay a
+    module-level function.
+    """
+    engine = build_engine(params, seed=seed, runway_modes=runway_modes)
+    engine.run_for(duration_min)
+    return engine.stats
+
+
+def t_quantile(p: float, dof: int) -> float:
+    """
+    Return the ``p`` quantile of Student's t distribution.
+
+    Exact for one and two degrees of freedom. Otherwise a Cornish-Fisher
+    expansion around the normal quantile is used, which is accurate to about
+    1e-3 for three or more degrees of freedom.
+    """
+    if dof == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if dof == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = NormalDist().inv_cdf(p)
+    return (
+        z
+        + (z ** 3 + z) / (4 * dof)
+        + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+        + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+    )
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Return the ``q``-th percentile (0-100) of already sorted values.
+
+    Uses linear interpolation between the closest ranks.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100.0
+    lo = math.floor(rank)
+    hi = math.ceil(rank)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+
+def summarise(
+    values: Sequence[float],
+    confidence: float = 0.95,
+    percentiles: Sequence[float] = (5, 50, 95),
+) -> MetricSummary:
+    """
+    Summarise one metric's values across replications.
+
+    Parameters
+    ----------
+    values : Sequence[float]
+        One value per replication.
+    confidence : float, optional
+        Confidence level of the interval for the mean. Default is 0.95.
+    percentiles : Sequence[float], optional
+        Percentiles (0-100) to report. Default is (5, 50, 95).
+
+    Returns
+    -------
+    MetricSummary
+        Mean, standard deviation, confidence interval and percentiles.
+    """
+    n = len(values)
+    if n == 0:
+        raise ValueError("cannot summarise an empty sample.")
+
+    mean = sum(values) / n
+    if n > 1:
+        stdev = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+        half_width = t_quantile(0.5 + confidence / 2, n - 1) * stdev / math.sqrt(n)
+    else:
+        stdev = 0.0
+        half_width = 0.0
+
+    ordered = sorted(values)
+    return MetricSummary(
+        mean=mean,
+        stdev=stdev,
+        ci_low=mean - half_width,
+        ci_high=mean + half_width,
+        percentiles={q: percentile(ordered, q) for q in percentiles},
+    )
+
+
+def run_replications(
+    params: SimulationParams,
+    n: int,
+    duration_min: int = 1440,
+    seed: Optional[int] = None,
+    runway_modes: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    confidence: float = 0.95,
+    percentiles: Sequence[float] = (5, 50, 95),
+) -> ReplicationResult:
+    """
+    Run ``n`` independent replications of a configuration in parallel.
+
+    Parameters
+    ----------
+    params : SimulationParams
+        Configuration shared by all replications.
+    n : int
+        Number of replications.
+    duration_min : int, optional
+        Simulated minutes per replication. Default is one day.
+    seed : int, optional
+        Base seed from which per-replication seeds are derived.
+    runway_modes : Sequence[str], optional
+        Mode of each runway. Defaults to all MIXED.
+    max_workers : int, optional
+        Size of the process pool. ``1`` runs serially in this process;
+        None lets ``ProcessPoolExecutor`` choose.
+    confidence : float, optional
+        Confidence level for the intervals. Default is 0.95.
+    percentiles : Sequence[float], optional
+        Percentiles (0-100) to report per metric. Default is (5, 50, 95).
+
+    Returns
+    -------
+    ReplicationResult
+        Per-run reports, pooled statistics and per-metric summaries.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1.")
+    params.validate()
+
+    seeds = derive_seeds(seed, n)
+    args = ([params] * n, [duration_min] * n, seeds, [runway_modes] * n)
+
+    if max_workers == 1:
+        runs = list(map(run_replication, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            runs = list(pool.map(run_replication, *args, chunksize=max(1, n // 64)))
+
+    pooled = Statistics()
+    for stats in runs:
+        pooled.merge(stats)
+
+    reports = [stats.report() for stats in runs]
+    summary = {
+        metric: summarise([r[metric] for r in reports], confidence, percentiles)
+        for metric in reports[0]
+    }
+    return ReplicationResult(seeds=seeds, reports=reports, pooled=pooled, summary=summary)
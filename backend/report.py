@@ -3,9 +3,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from contextlib import contextmanager
 import csv
+import io
 import json
+import os
+import sqlite3
+import time
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 
 @dataclass
@@ -71,14 +83,11 @@ def _ensure_parent_dir(csv_path: str) -> None:
     Path(csv_path).expanduser().resolve().parent.mkdir(parents=True, exist_ok=True)
 
 
-def append_report_csv(report: Dict[str, Any], sim_time_min: int, csv_path: str = DEFAULT_STATS_CSV_PATH) -> str:
+def _csv_row(report: Dict[str, Any], sim_time_min: int) -> Dict[str, Any]:
     """
-    Append a single simulation report snapshot to a persistent CSV file.
+    Lay a report out in the stable CSV column schema.
 
-    This function ensures the report data is saved using a stable column schema.
-    Any unknown or extra fields present in the report dictionary are serialized
-    and stored in an `extra_json` column to prevent data loss without breaking
-    the CSV structure.
+    Unknown keys are serialized into the `extra_json` column.
 
     Parameters
     ----------
@@ -86,18 +95,12 @@ def append_report_csv(report: Dict[str, Any], sim_time_min: int, csv_path: str =
         The dictionary containing the statistical metrics to save.
     sim_time_min : int
         The simulation time (in minutes) at which this report was generated.
-    csv_path : str, optional
-        The file path to the destination CSV. Defaults to DEFAULT_STATS_CSV_PATH.
 
     Returns
     -------
-    str
-        The resolved absolute path to the written CSV file.
+    Dict[str, Any]
+        One value per column of CSV_COLUMNS.
     """
-    _ensure_parent_dir(csv_path)
-    p = Path(csv_path).expanduser().resolve()
-    file_exists = p.exists()
-
     # Fill known columns
     row: Dict[str, Any] = {c: "" for c in CSV_COLUMNS}
     row["saved_at_utc"] = datetime.now(timezone.utc).isoformat()
@@ -111,14 +114,160 @@ def append_report_csv(report: Dict[str, Any], sim_time_min: int, csv_path: str =
             extras[k] = v
 
     row["extra_json"] = json.dumps(extras, ensure_ascii=False) if extras else ""
+    return row
+
+
+@contextmanager
+def _locked(fd: int) -> Iterator[None]:
+    """Hold an exclusive lock on an open file while appending to it."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class ReportSink:
+    """
+    Buffered writer appending reports to a statistics CSV file.
+
+    Rows are formatted into an in-memory buffer and written in one append
+    when ``max_rows`` rows are waiting, when the oldest waiting row is
+    ``max_delay_s`` seconds old (checked on each append), on ``flush`` and
+    when the sink is closed or its ``with`` block exits. The file is opened
+    once, in append mode, and kept open.
+
+    Each write takes an exclusive lock on the file, writes the header if the
+    file is still empty, and appends the whole buffer. Several processes can
+    therefore share one CSV file: their batches never interleave and the
+    header is written exactly once.
+
+    Parameters
+    ----------
+    csv_path : str, optional
+        The destination CSV file. Defaults to DEFAULT_STATS_CSV_PATH.
+    max_rows : int, optional
+        Rows buffered before they are written. Default is 256.
+    max_delay_s : float, optional
+        Longest time a row is held back, in seconds. Default is 5.
+    """
+
+    def __init__(self, csv_path: str = DEFAULT_STATS_CSV_PATH, max_rows: int = 256, max_delay_s: float = 5.0) -> None:
+        if max_rows < 1:
+            raise ValueError("max_rows must be >= 1.")
+        self.path = Path(csv_path).expanduser().resolve()
+        self.max_rows = int(max_rows)
+        self.max_delay_s = float(max_delay_s)
+        self._fd: Optional[int] = None
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=CSV_COLUMNS)
+        self._pending = 0
+        self._oldest = 0.0
+
+    def append(self, report: Dict[str, Any], sim_time_min: int) -> None:
+        """
+        Buffer one report, writing the buffer out if it is due.
+
+        Parameters
+        ----------
+        report : Dict[str, Any]
+            The dictionary containing the statistical metrics to save.
+        sim_time_min : int
+            The simulation time (in minutes) at which this report was generated.
+        """
+        if self._pending == 0:
+            self._oldest = time.monotonic()
+        self._writer.writerow(_csv_row(report, sim_time_min))
+        self._pending += 1
+        if self._pending >= self.max_rows or time.monotonic() - self._oldest >= self.max_delay_s:
+            self.flush()
+
+    def extend(self, reports: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        """
+        Buffer many reports, e.g. every run of a sweep.
+
+        Parameters
+        ----------
+        reports : Iterable[Tuple[Dict[str, Any], int]]
+            (report, sim_time_min) pairs.
+        """
+        for report, sim_time_min in reports:
+            self.append(report, sim_time_min)
+
+    def flush(self) -> None:
+        """Append every buffered row to the file in one locked write."""
+        if self._pending == 0:
+            return
+        if self._fd is None:
+            _ensure_parent_dir(str(self.path))
+            self._fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+
+        data = self._buffer.getvalue().encode("utf-8")
+        with _locked(self._fd):
+            if os.fstat(self._fd).st_size == 0:
+                header = io.StringIO()
+                csv.DictWriter(header, fieldnames=CSV_COLUMNS).writeheader()
+                data = header.getvalue().encode("utf-8") + data
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pending = 0
+
+    def close(self) -> None:
+        """Flush buffered rows and close the file."""
+        try:
+            self.flush()
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def __enter__(self) -> "ReportSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def append_report_csv(report: Dict[str, Any], sim_time_min: int, csv_path: str = DEFAULT_STATS_CSV_PATH) -> str:
+    """
+    Append a single simulation report snapshot to a persistent CSV file.
 
-    with p.open("a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        if not file_exists:
-            w.writeheader()
-        w.writerow(row)
+    This function ensures the report data is saved using a stable column schema.
+    Any unknown or extra fields present in the report dictionary are serialized
+    and stored in an `extra_json` column to prevent data loss without breaking
+    the CSV structure. To save many reports, use a ``ReportSink`` instead,
+    which keeps the file open and writes them in batches.
 
-    return str(p)
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        The dictionary containing the statistical metrics to save.
+    sim_time_min : int
+        The simulation time (in minutes) at which this report was generated.
+    csv_path : str, optional
+        The file path to the destination CSV. Defaults to DEFAULT_STATS_CSV_PATH.
+
+    Returns
+    -------
+    str
+        The resolved absolute path to the written CSV file.
+    """
+    with ReportSink(csv_path) as sink:
+        sink.append(report, sim_time_min)
+    return str(sink.path)
 
 
 def read_reports_csv(csv_path: str = DEFAULT_STATS_CSV_PATH) -> List[Dict[str, Any]]:
@@ -144,38 +293,282 @@ def read_reports_csv(csv_path: str = DEFAULT_STATS_CSV_PATH) -> List[Dict[str, A
         return []
 
     with p.open("r", newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        rows = []
-        for raw in r:
-            row: Dict[str, Any] = dict(raw)
-            # Coerce some known fields
+        return [_coerce_row(raw) for raw in csv.DictReader(f)]
+
+
+def _coerce_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert one raw CSV row into a report dictionary.
+
+    Known numeric fields are coerced to int or float and the data stored in
+    the `extra_json` column is merged back into the row.
+
+    Parameters
+    ----------
+    raw : Dict[str, Any]
+        Row as read by ``csv.DictReader``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The parsed report dictionary.
+    """
+    row: Dict[str, Any] = dict(raw)
+    # Coerce some known fields
+    try:
+        row["sim_time_min"] = int(float(row.get("sim_time_min") or 0))
+    except Exception:
+        row["sim_time_min"] = 0
+
+    for k in ["maxHoldingQueue", "avgHoldingQueue", "maxArrivalDelay", "avgHoldingTime",
+              "maxTakeoffQueue", "avgTakeoffQueue", "maxTakeoffWait", "avgTakeoffWait",
+              "avgArrivalDelay", "diversions", "cancellations"]:
+        if k in row and row[k] != "":
             try:
-                row["sim_time_min"] = int(float(row.get("sim_time_min") or 0))
+                row[k] = float(row[k])
             except Exception:
-                row["sim_time_min"] = 0
-
-            for k in ["maxHoldingQueue", "avgHoldingQueue", "maxArrivalDelay", "avgHoldingTime",
-                      "maxTakeoffQueue", "avgTakeoffQueue", "maxTakeoffWait", "avgTakeoffWait",
-                      "avgArrivalDelay", "diversions", "cancellations"]:
-                if k in row and row[k] != "":
-                    try:
-                        row[k] = float(row[k])
-                    except Exception:
-                        pass
-
-            # Merge extras (non-destructively)
-            extra = row.get("extra_json") or ""
-            if extra:
-                try:
-                    extra_obj = json.loads(extra)
-                    if isinstance(extra_obj, dict):
-                        for ek, ev in extra_obj.items():
-                            row.setdefault(ek, ev)
-                except Exception:
-                    pass
-            rows.append(row)
-
-    return rows
+                pass
+
+    # Merge extras (non-destructively)
+    extra = row.get("extra_json") or ""
+    if extra:
+        try:
+            extra_obj = json.loads(extra)
+            if isinstance(extra_obj, dict):
+                for ek, ev in extra_obj.items():
+                    row.setdefault(ek, ev)
+        except Exception:
+            pass
+    return row
+
+
+class ReportHistory:
+    """
+    SQLite index of the reports saved in a statistics CSV file.
+
+    The CSV file stays the file that reports are appended to; the index is
+    kept in a SQLite database next to it (same name, ``.sqlite3`` suffix)
+    and remembers how many bytes of the CSV it has already imported. Every
+    query first imports the rows appended since (by this or any other
+    process), so existing CSV files are migrated on first use and only new
+    rows are ever parsed again. Queries then read just the rows they return,
+    through the primary key or the index on ``saved_at_utc``.
+
+    Parameters
+    ----------
+    csv_path : str, optional
+        The statistics CSV file. Defaults to DEFAULT_STATS_CSV_PATH.
+    """
+
+    def __init__(self, csv_path: str = DEFAULT_STATS_CSV_PATH) -> None:
+        self.csv_path = Path(csv_path).expanduser().resolve()
+        self.db_path = self.csv_path.with_suffix(".sqlite3")
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating its tables on first use."""
+        if self._db is None:
+            _ensure_parent_dir(str(self.db_path))
+            self._db = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS reports (
+                    id INTEGER PRIMARY KEY,
+                    saved_at_utc TEXT NOT NULL,
+                    sim_time_min INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS reports_saved_at ON reports (saved_at_utc);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+                """
+            )
+        return self._db
+
+    def sync(self) -> int:
+        """
+        Import the CSV rows appended since the last sync.
+
+        Along with the byte offset it has imported up to, the index keeps a
+        checksum of the CSV header and of the last bytes before that offset.
+        If the CSV file is gone, shorter than what was imported or no longer
+        matches the checksum (it was replaced or rewritten), the index is
+        rebuilt from scratch. A row that another process is still writing (no
+        trailing newline yet) is left for the next sync.
+
+        Returns
+        -------
+        int
+            Number of rows imported.
+        """
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            offset = meta.get("csv_offset", 0)
+            try:
+                f = self.csv_path.open("rb")
+            except FileNotFoundError:
+                f = io.BytesIO()
+
+            imported = 0
+            with f:
+                size = f.seek(0, os.SEEK_END)
+                if offset and (size < offset or meta.get("csv_check") != _fingerprint(f, offset)):
+                    db.execute("DELETE FROM reports")
+                    offset = 0
+
+                if size > offset:
+                    f.seek(0)
+                    header = f.readline()
+                    f.seek(max(offset, len(header)))
+                    data = f.read(size - f.tell())
+                    data = data[: data.rfind(b"\n") + 1]   # Only complete rows
+                    text = header.decode("utf-8") + data.decode("utf-8")
+                    rows = [_coerce_row(raw) for raw in csv.DictReader(io.StringIO(text, newline=""))]
+                    db.executemany(
+                        "INSERT INTO reports (saved_at_utc, sim_time_min, data) VALUES (?, ?, ?)",
+                        [(row.get("saved_at_utc") or "", row["sim_time_min"], json.dumps(row)) for row in rows],
+                    )
+                    imported = len(rows)
+                    offset = max(offset, len(header)) + len(data)
+                check = _fingerprint(f, offset)
+
+            db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("csv_offset", offset), ("csv_check", check)],
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return imported
+
+    def _query(self, sql: str, args: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        """Sync, then return the ``data`` column of the selected rows as dictionaries."""
+        self.sync()
+        return [json.loads(data) for (data,) in self._db.execute(sql, tuple(args))]
+
+    def last(self, n: int = 1) -> List[Dict[str, Any]]:
+        """
+        Return the ``n`` most recently saved reports, newest first.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of reports. Default is 1.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Parsed report dictionaries, as ``read_reports_csv`` returns them.
+        """
+        return self._query("SELECT data FROM reports ORDER BY id DESC LIMIT ?", (int(n),))
+
+    def between(self, start: Union[str, datetime, None] = None, end: Union[str, datetime, None] = None) -> List[Dict[str, Any]]:
+        """
+        Return the reports saved in ``[start, end)``, oldest first.
+
+        Parameters
+        ----------
+        start, end : str or datetime, optional
+            UTC bounds, as ISO strings or timezone-aware datetimes. A missing
+            bound is open.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Parsed report dictionaries.
+        """
+        clauses, args = [], []
+        if start is not None:
+            clauses.append("saved_at_utc >= ?")
+            args.append(_utc_iso(start))
+        if end is not None:
+            clauses.append("saved_at_utc < ?")
+            args.append(_utc_iso(end))
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        return self._query(f"SELECT data FROM reports {where}ORDER BY saved_at_utc, id", args)
+
+    def count(self) -> int:
+        """Return the number of saved reports."""
+        self.sync()
+        return self._db.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the index database."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> "ReportHistory":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _utc_iso(value: Union[str, datetime]) -> str:
+    """Format a range bound like the ``saved_at_utc`` column."""
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).isoformat()
+    return str(value)
+
+
+# Bytes before the imported offset covered by the index checksum
+_CHECK_BYTES = 4096
+
+# Block size used when reading a CSV file backwards
+_TAIL_BLOCK = 64 * 1024
+
+
+def _fingerprint(f: Any, offset: int) -> int:
+    """Checksum the header and the last ``_CHECK_BYTES`` bytes before ``offset`` of an open CSV file."""
+    if offset == 0:
+        return 0
+    f.seek(0)
+    header = f.readline()
+    start = max(len(header), offset - _CHECK_BYTES)
+    f.seek(start)
+    return zlib.crc32(header + f.read(max(offset - start, 0)))
+
+
+def _read_tail(csv_path: Path, n: int) -> List[Dict[str, Any]]:
+    """
+    Parse the last ``n`` complete rows of a CSV file without an index.
+
+    The file is read backwards in blocks until enough rows are found, so the
+    cost does not grow with the length of the history.
+
+    Parameters
+    ----------
+    csv_path : Path
+        The statistics CSV file.
+    n : int
+        Number of rows to return.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Parsed report dictionaries, newest first.
+    """
+    if n <= 0:
+        return []
+    with csv_path.open("rb") as f:
+        header = f.readline()
+        start = f.seek(0, os.SEEK_END)
+        tail = b""
+        while start > len(header) and tail.count(b"\n") <= n:
+            step = min(_TAIL_BLOCK, start - len(header))
+            start -= step
+            f.seek(start)
+            tail = f.read(step) + tail
+
+    if start > len(header):
+        tail = tail[tail.index(b"\n") + 1:]     # First row is cut off
+    tail = tail[: tail.rfind(b"\n") + 1]        # Only complete rows
+    text = header.decode("utf-8") + tail.decode("utf-8")
+    rows = [_coerce_row(raw) for raw in csv.DictReader(io.StringIO(text, newline=""))]
+    return rows[::-1][:n]
 
 
 def read_last_report(csv_path: str = DEFAULT_STATS_CSV_PATH) -> Optional[Dict[str, Any]]:
@@ -192,5 +585,35 @@ def read_last_report(csv_path: str = DEFAULT_STATS_CSV_PATH) -> Optional[Dict[st
     Optional[Dict[str, Any]]
         The most recent report dictionary, or None if the file is empty or does not exist.
     """
-    rows = read_reports_csv(csv_path)
-    return rows[-1] if rows else None
\ No newline at end of file
+    rows = read_recent_reports(1, csv_path)
+    return rows[0] if rows else None
+
+
+def read_recent_reports(n: int, csv_path: str = DEFAULT_STATS_CSV_PATH) -> List[Dict[str, Any]]:
+    """
+    Retrieve the ``n`` most recent report snapshots, newest first.
+
+    The reports are read through the ``ReportHistory`` index. If the index
+    cannot be opened or written (e.g. the CSV sits in a read-only directory),
+    the last rows of the CSV file are parsed directly instead.
+
+    Parameters
+    ----------
+    n : int
+        Number of reports to return.
+    csv_path : str, optional
+        The file path to the CSV to read. Defaults to DEFAULT_STATS_CSV_PATH.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Parsed report dictionaries, newest first.
+    """
+    p = Path(csv_path).expanduser().resolve()
+    if not p.exists():
+        return []
+    try:
+        with ReportHistory(str(p)) as history:
+            return history.last(n)
+    except (sqlite3.Error, OSError):
+        return _read_tail(p, n)
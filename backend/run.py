@@ -0,0 +1,324 @@
+"""
+Headless batch runner for the airport simulation.
+
+Runs ``SimulationEngine.run_for`` for a given duration and prints (or writes)
+the resulting ``Statistics.report()``. Nothing here imports the Tk frontend or
+PIL, so it can run on machines without a display::
+
+    python -m backend.run --num-runways 2 --inbound-rate-per-hour 30 \\
+        --outbound-rate-per-hour 30 --duration 1440 --seed 1
+
+Parameters can also be read from a JSON config file holding
+``SimulationParams`` fields. Command line flags override the config file.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from . import rng
+from .SimulationEngine import SimulationEngine
+from .SimulationParameters import SimulationParams
+from .airport import Airport
+from .eventlog import EventLog
+from .policies import POLICIES, make_policy
+from .queues import HoldingQueue, TakeOffQueue
+from .report import append_report_csv
+from .runway import Runway
+from .statistics import Statistics
+from .timeseries import DEFAULT_CAPACITY, TimeSeries
+
+# Importing this module must stay under this many seconds (checked in tests)
+STARTUP_BUDGET_S = 0.25
+
+RUNWAY_MODES = ("LANDING", "TAKEOFF", "MIXED")
+
+_FIELD_TYPES = {"int": int, "float": float}
+
+
+def build_engine(
+    params: SimulationParams,
+    seed: Optional[int] = None,
+    runway_modes: Optional[Sequence[str]] = None,
+    event_driven: bool = False,
+    policy: str = "greedy",
+    event_log: Optional[EventLog] = None,
+    timeseries_every: Optional[int] = None,
+    timeseries_capacity: int = DEFAULT_CAPACITY,
+) -> SimulationEngine:
+    """
+    Assemble a SimulationEngine and its backend components from parameters.
+
+    Parameters
+    ----------
+    params : SimulationParams
+        Simulation configuration.
+    seed : int, optional
+        Random seed for reproducible runs.
+    runway_modes : Sequence[str], optional
+        Mode of each runway. Defaults to ``params.num_runways`` MIXED runways.
+    event_driven : bool, optional
+        Whether ``run_for`` should jump between events. Default is False.
+    policy : str, optional
+        Runway assignment policy, ``"greedy"`` or ``"optimizing"``.
+        Default is ``"greedy"``.
+    event_log : EventLog, optional
+        Per-event log to attach to the statistics. Default is None (off).
+    timeseries_every : int, optional
+        If given, record a ``TimeSeries`` of queue sizes and runway
+        utilisation with buckets of this many minutes. Default is None (off).
+    timeseries_capacity : int, optional
+        Number of buckets the time series keeps. Default is 1440.
+
+    Returns
+    -------
+    SimulationEngine
+        A fully initialised engine.
+    """
+    if runway_modes is None:
+        runway_modes = ["MIXED"] * params.num_runways
+    if len(runway_modes) != params.num_runways:
+        raise ValueError("runway_modes must have one entry per runway.")
+
+    stats = Statistics(event_log=event_log)
+    runways = [
+        Runway(runway_id=i + 1, runway_mode=mode, rng=rng.stream(seed, rng.METADATA, "runway", i + 1))
+        for i, mode in enumerate(runway_modes)
+    ]
+    if timeseries_every is not None:
+        stats.timeseries = TimeSeries([r.id for r in runways], every=timeseries_every, capacity=timeseries_capacity)
+    airport = Airport(
+        runways=runways,
+        holding=HoldingQueue(),
+        takeoff=TakeOffQueue(),
+        stats=stats,
+        policy=make_policy(policy, params),
+    )
+
+    return SimulationEngine(params=params, airport=airport, stats=stats, seed=seed, event_driven=event_driven)
+
+
+def run_simulation(
+    params: SimulationParams,
+    duration_min: int,
+    seed: Optional[int] = None,
+    runway_modes: Optional[Sequence[str]] = None,
+    event_driven: bool = False,
+    policy: str = "greedy",
+    event_log: Optional[str] = None,
+    timeseries: Optional[str] = None,
+    timeseries_every: int = 15,
+) -> Dict[str, float]:
+    """
+    Run one simulation and return its statistics report.
+
+    Parameters
+    ----------
+    params : SimulationParams
+        Simulation configuration.
+    duration_min : int
+        Simulated minutes to run for.
+    seed : int, optional
+        Random seed for reproducible runs.
+    runway_modes : Sequence[str], optional
+        Mode of each runway. Defaults to all MIXED.
+    event_driven : bool, optional
+        Use the event-driven time advance. Results are identical to the
+        tick-based run; it is only faster when traffic is light enough for
+        ticks to be skipped. Default is False.
+    policy : str, optional
+        Runway assignment policy, ``"greedy"`` or ``"optimizing"``.
+    event_log : str, optional
+        Write every aircraft event to this newline-delimited JSON file.
+    timeseries : str, optional
+        Write queue sizes and runway utilisation over time to this CSV file.
+    timeseries_every : int, optional
+        Bucket width of the time series in minutes. Default is 15.
+
+    Returns
+    -------
+    Dict[str, float]
+        The engine's ``Statistics.report()``.
+    """
+    capacity = DEFAULT_CAPACITY
+    if timeseries:
+        if timeseries_every < 1:
+            raise ValueError("timeseries_every must be >= 1.")
+        capacity = -(-int(duration_min) // timeseries_every) + 1   # Whole run, partial first and last buckets included
+
+    log = EventLog(event_log) if event_log else None
+    try:
+        engine = build_engine(
+            params,
+            seed=seed,
+            runway_modes=runway_modes,
+            event_driven=event_driven,
+            policy=policy,
+            event_log=log,
+            timeseries_every=timeseries_every if timeseries else None,
+            timeseries_capacity=capacity,
+        )
+        engine.run_for(duration_min)
+        if timeseries:
+            engine.stats.timeseries.to_csv(timeseries)
+        return engine.get_report()
+    finally:
+        if log is not None:
+            log.close()
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Read SimulationParams fields from a JSON config file.
+
+    Parameters
+    ----------
+    path : str
+        Path to a JSON file containing a single object.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The parameter values found in the file.
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold an object or names unknown parameters.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    if not isinstance(config, dict):
+        raise ValueError(f"{path}: config must be a JSON object.")
+
+    known = {f.name for f in dataclasses.fields(SimulationParams)}
+    unknown = sorted(set(config) - known)
+    if unknown:
+        raise ValueError(f"{path}: unknown parameters: {', '.join(unknown)}")
+    return config
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the command line parser, with one flag per SimulationParams field."""
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.run",
+        description="Run the airport simulation headless and print its statistics report.",
+    )
+    parser.add_argument("--config", help="JSON file with SimulationParams fields.")
+    parser.add_argument("--duration", type=int, default=1440, help="Simulated minutes to run (default: 1440).")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for a reproducible run.")
+    parser.add_argument(
+        "--runway-modes",
+        help="Comma-separated runway modes, e.g. LANDING,TAKEOFF (default: all MIXED).",
+    )
+    parser.add_argument(
+        "--policy",
+        choices=POLICIES,
+        default="greedy",
+        help="Runway assignment policy (default: greedy).",
+    )
+    parser.add_argument(
+        "--event-driven",
+        action="store_true",
+        help="Jump between events instead of advancing one tick at a time (faster for light traffic).",
+    )
+    parser.add_argument("--output", help="Write the report as JSON to this file instead of stdout.")
+    parser.add_argument("--event-log", help="Write every aircraft event to this newline-delimited JSON file.")
+    parser.add_argument("--timeseries", help="Write queue sizes and runway utilisation over time to this CSV file.")
+    parser.add_argument(
+        "--timeseries-every",
+        type=int,
+        default=15,
+        help="Bucket width of --timeseries in minutes (default: 15).",
+    )
+    parser.add_argument("--append-csv", help="Also append the report to this statistics CSV file.")
+
+    params = parser.add_argument_group("simulation parameters")
+    for f in dataclasses.fields(SimulationParams):
+        params.add_argument(
+            "--" + f.name.replace("_", "-"),
+            dest=f.name,
+            type=_FIELD_TYPES[f.type],
+            default=None,
+        )
+    return parser
+
+
+def _parse_runway_modes(value: Optional[str]) -> Optional[List[str]]:
+    """Split and validate the ``--runway-modes`` flag."""
+    if value is None:
+        return None
+    modes = [m.strip().upper() for m in value.split(",") if m.strip()]
+    for mode in modes:
+        if mode not in RUNWAY_MODES:
+            raise ValueError(f"unknown runway mode {mode!r}; expected one of {', '.join(RUNWAY_MODES)}.")
+    return modes
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        Arguments to parse. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Process exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.timeseries_every < 1:
+        parser.error("--timeseries-every must be >= 1.")
+
+    try:
+        values = load_config(args.config) if args.config else {}
+        for f in dataclasses.fields(SimulationParams):
+            flag = getattr(args, f.name)
+            if flag is not None:
+                values[f.name] = flag
+
+        runway_modes = _parse_runway_modes(args.runway_modes)
+        if "num_runways" not in values and runway_modes is not None:
+            values["num_runways"] = len(runway_modes)
+
+        try:
+            params = SimulationParams(**values)
+        except TypeError as e:
+            parser.error(f"missing simulation parameters: {e}")
+        params.validate()
+        report = run_simulation(
+            params,
+            duration_min=args.duration,
+            seed=args.seed,
+            runway_modes=runway_modes,
+            event_driven=args.event_driven,
+            policy=args.policy,
+            event_log=args.event_log,
+            timeseries=args.timeseries,
+            timeseries_every=args.timeseries_every,
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.append_csv:
+        append_report_csv(report, args.duration, args.append_csv)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,19 @@
 import random
+from operator import attrgetter
+
+from .aircraft import DEFAULT_CLASS
+
+
+def _tracked(name: str) -> property:
+    """Attribute that notifies the runway's listener whenever it is assigned."""
+    slot = "_" + name
+
+    def setter(self, value) -> None:
+        self.__dict__[slot] = value
+        if self._listener is not None:
+            self._listener(self)
+
+    return property(attrgetter(slot), setter)
 
 
 class Runway:
@@ -7,9 +22,20 @@ class Runway:
     A runway stores its operational mode, availability, occupancy state,
     currently assigned aircraft, and additional metadata such as runway
     length and bearing.
+
+    The start time, operation and aircraft class of the last operation are
+    kept after release, so the owning ``Airport`` can enforce wake separation
+    against the next one.
+
+    Assigning ``mode`` or ``status`` calls the runway's listener (set by the
+    ``Airport`` that owns it), so the airport can re-index the runway when it
+    is switched or reopened, e.g. from the UI.
     """
 
-    def __init__(self, runway_id, runway_mode) -> None:
+    mode = _tracked("mode")
+    status = _tracked("status")
+
+    def __init__(self, runway_id, runway_mode, rng=None) -> None:
         """Initialise a runway.
 
         Parameters
@@ -18,7 +44,11 @@ class Runway:
             Unique identifier for the runway.
         runway_mode
             Runway capability, typically ``LANDING``, ``TAKEOFF``, or ``MIXED``.
+        rng : random.Random, optional
+            Generator for the runway length and bearing. Defaults to the
+            global ``random`` module, which is not reproducible.
         """
+        self._listener = None
         self.id = runway_id
         self.mode = runway_mode
         self.status = "AVAILABLE"
@@ -26,8 +56,12 @@ class Runway:
         self.currentOperation = None
         self.occupiedUntil = 0
         self.currentAircraft = None
-        self.length = random.randint(2000, 4000)
-        self.bearing = random.randint(1, 36)
+        self.lastOperation = None
+        self.lastOperationAt = None
+        self.lastClass = None
+        rng = rng or random
+        self.length = rng.randint(2000, 4000)
+        self.bearing = rng.randint(1, 36)
 
     def isAvailable(self) -> bool:
         """Return whether the runway is currently available.
@@ -63,6 +97,30 @@ class Runway:
         self.currentOperation = operationMode
         self.occupiedUntil = time + duration
         self.occupancy = "OCCUPIED"
+        self.lastOperation = operationMode
+        self.lastOperationAt = time
+        self.lastClass = getattr(aircraft, "aircraft_class", DEFAULT_CLASS)
+
+    def release(self) -> None:
+        """Free the runway once its current operation has finished."""
+        self.occupancy = "FREE"
+        self.occupiedUntil = 0
+        self.currentAircraft = None
+        self.currentOperation = None
+
+    def reset(self) -> None:
+        """Free and reopen the runway and forget its last operation.
+
+        Used when the simulation clock restarts, so that no operation or
+        wake separation carries over from before the restart.
+        """
+        self.release()
+        self.status = "AVAILABLE"
+        self.lastOperation = None
+        self.lastOperationAt = None
+        self.lastClass = None
+        self.startTime = 0
+        self.duration = 0
 
     def canLand(self) -> bool:
         """Return whether the runway can currently accept a landing.
@@ -0,0 +1,77 @@
+"""
+Wake-turbulence separation between consecutive operations on a runway.
+
+A follower may start its operation on a runway no earlier than
+``leader start + separation`` (and, as before, not while the leader still
+occupies the runway). The separation depends on the leader's and follower's
+aircraft class and on the kind of the two operations:
+
+* arrival after arrival, departure after departure and arrival after
+  departure use the wake table ``WAKE_SEPARATION_MIN``;
+* a departure after an arrival needs no wake spacing, only a clear runway.
+  On a MIXED runway this lets departures be interleaved into the gaps the
+  wake table leaves between arrivals.
+
+Pairs not in the wake table only need the runway to be clear. The full
+table over all classes and operations is precomputed in ``SEPARATION_MIN``,
+so a check is one dictionary lookup against the runway's last operation.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+from .aircraft import AIRCRAFT_CLASSES, DEFAULT_CLASS
+from .occupancy import OPERATIONS
+
+# Minutes between the starts of a leader's and a follower's operation, by (leader, follower) class
+WAKE_SEPARATION_MIN: Dict[Tuple[str, str], int] = {
+    ("HEAVY", "HEAVY"): 4,
+    ("HEAVY", "MEDIUM"): 5,
+    ("HEAVY", "LIGHT"): 6,
+    ("MEDIUM", "LIGHT"): 4,
+}
+
+
+def separation_minutes(leader_op: str, leader_class: str, follower_op: str, follower_class: str) -> int:
+    """
+    Return the minimum time between the starts of two consecutive operations.
+
+    Parameters
+    ----------
+    leader_op, follower_op : str
+        ``LANDING`` or ``TAKEOFF``.
+    leader_class, follower_class : str
+        One of ``AIRCRAFT_CLASSES``.
+
+    Returns
+    -------
+    int
+        Separation in minutes; 0 means only a clear runway is needed.
+    """
+    if leader_op == "LANDING" and follower_op == "TAKEOFF":
+        return 0
+    return WAKE_SEPARATION_MIN.get((leader_class, follower_class), 0)
+
+
+SEPARATION_MIN: Dict[Tuple[str, str, str, str], int] = {
+    (lop, lcls, fop, fcls): separation_minutes(lop, lcls, fop, fcls)
+    for lop in OPERATIONS
+    for lcls in AIRCRAFT_CLASSES
+    for fop in OPERATIONS
+    for fcls in AIRCRAFT_CLASSES
+}
+
+
+def clear_at(runway: Any, aircraft: Any, operation: str) -> Optional[int]:
+    """
+    Return the earliest time ``aircraft`` may start ``operation`` on ``runway``.
+
+    Only the separation from the runway's last operation is considered, not
+    its occupancy. Returns None if the runway has not been used yet.
+    """
+    last_op = runway.lastOperation
+    if last_op is None:
+        return None
+    return runway.lastOperationAt + SEPARATION_MIN[
+        (last_op, runway.lastClass, operation, getattr(aircraft, "aircraft_class", DEFAULT_CLASS))
+    ]
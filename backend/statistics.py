@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 import random
 
+from . import eventlog, rng
+from .histogram import Histogram
+from .timeseries import TimeSeries
+
 SimTime = int
 
+# Percentiles of holding time, takeoff wait and arrival delay included in the report
+PERCENTILES = (50, 90, 99)
+
 @dataclass
 class Statistics:
     """
@@ -13,6 +20,15 @@ class Statistics:
 
     Records the queue sizes, delay times, diversions, and cancellations. Also serves 
     as the main random number generator for normal-distributed aircraft spawns.
+
+    Holding time, takeoff wait and arrival delay are also kept in streaming
+    histograms, so the report includes their 50th, 90th and 99th
+    percentiles. The histograms use bounded memory and merge exactly.
+
+    If ``event_log`` is set to an ``EventLog``, every recorded event is also
+    appended to it. If ``timeseries`` is set to a ``TimeSeries``, every queue
+    snapshot is also added to it. Both are None by default, which leaves
+    recording unchanged.
     """
     # Configuration (set via configure_from_params)
     _arrival_stddev_min: int = 0
@@ -41,6 +57,11 @@ class Statistics:
     arrival_count: int = 0
     max_arrival_delay: SimTime = 0
 
+    # Distributions (for percentiles)
+    holding_time_hist: Histogram = field(default_factory=Histogram)
+    takeoff_wait_hist: Histogram = field(default_factory=Histogram)
+    arrival_delay_hist: Histogram = field(default_factory=Histogram)
+
     # Exceptions
     diversions: int = 0
     cancellations: int = 0
@@ -48,6 +69,11 @@ class Statistics:
     # Runway Usage
     runway_busy_time: Dict[Any, int] = field(default_factory=dict)
 
+    # Optional per-event stream (off by default)
+    event_log: Optional[eventlog.EventLog] = field(default=None, repr=False, compare=False)
+    # Optional queue / runway history (off by default)
+    timeseries: Optional[TimeSeries] = field(default=None, repr=False, compare=False)
+
     def configure_from_params(self, params: Any, seed: Optional[int] = None) -> None:
         """
         Extract statistical parameters and seed the RNG from the main simulation config.
@@ -57,14 +83,15 @@ class Statistics:
         params : Any
             The simulation parameters object containing stddev and tick size data.
         seed : int, optional
-            A seed for the random number generator to ensure reproducible results.
+            Run seed. The jitter generator is re-seeded with the run's
+            arrivals stream so results are reproducible.
         """
         self._arrival_stddev_min = int(getattr(params, "arrival_stddev_min", 0))
         self._departure_stddev_min = int(getattr(params, "departure_stddev_min", 0))
         self._tick_size_min = int(getattr(params, "tick_size_min", 1)) or 1
 
         if seed is not None:
-            self._rng.seed(int(seed))
+            self._rng = rng.stream(seed, rng.ARRIVALS)
 
     def _round_to_tick(self, minutes: float) -> int:
         """
@@ -121,10 +148,20 @@ class Statistics:
         spawn = int(round(int(scheduled_time_min) + jitter))
         return max(0, spawn)
 
-    def snapshot_queues(self, holding_size: int, takeoff_size: int, time: int) -> None:
+    def snapshot_queues(
+        self,
+        holding_size: int,
+        takeoff_size: int,
+        time: int,
+        ticks: int = 1,
+        runways_busy: Optional[Sequence[bool]] = None,
+    ) -> None:
         """
         Record current queue sizes to calculate running maximums and averages.
 
+        Event-driven runs record several idle ticks with identical queue sizes
+        in one call by passing ``ticks``.
+
         Parameters
         ----------
         holding_size : int
@@ -133,12 +170,18 @@ class Statistics:
             The current number of aircraft in the take-off queue.
         time : int
             The current simulation time in minutes.
+        ticks : int, optional
+            Number of ticks this snapshot stands for. Default is 1.
+        runways_busy : Sequence[bool], optional
+            Busy state of each runway, only used by ``timeseries``.
         """
-        self.snapshots += 1
+        self.snapshots += int(ticks)
         self.max_holding_size = max(self.max_holding_size, int(holding_size))
         self.max_takeoff_size = max(self.max_takeoff_size, int(takeoff_size))
-        self.holding_size_sum += int(holding_size)
-        self.takeoff_size_sum += int(takeoff_size)
+        self.holding_size_sum += int(holding_size) * int(ticks)
+        self.takeoff_size_sum += int(takeoff_size) * int(ticks)
+        if self.timeseries is not None:
+            self.timeseries.record(time, holding_size, takeoff_size, runways_busy or (), ticks, self._tick_size_min)
 
     def record_holding_entry(self, aircraft: Any, time: SimTime) -> None:
         """
@@ -153,6 +196,8 @@ class Statistics:
         """
         # Always set; no need to guard with hasattr
         setattr(aircraft, "enteredHoldingAt", int(time))
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.ENTER_HOLDING, time, aircraft, fuel=getattr(aircraft, "fuelRemaining", None))
 
     def record_landing(self, aircraft: Any, time: SimTime) -> None:
         """
@@ -172,6 +217,7 @@ class Statistics:
             ht = max(0, t - int(entered))
             self.holding_time_sum += ht
             self.holding_count += 1
+            self.holding_time_hist.record(ht)
 
         sched = getattr(aircraft, "scheduledTime", None)
         if sched is not None:
@@ -179,6 +225,10 @@ class Statistics:
             self.arrival_delay_sum += delay
             self.arrival_count += 1
             self.max_arrival_delay = max(self.max_arrival_delay, delay)
+            self.arrival_delay_hist.record(delay)
+
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.LAND, t, aircraft)
 
     def record_takeoff_enqueue(self, aircraft: Any, time: SimTime) -> None:
         """
@@ -192,6 +242,8 @@ class Statistics:
             The timestamp of entry.
         """
         setattr(aircraft, "joinedTakeoffQueueAt", int(time))
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.ENQUEUE_TAKEOFF, time, aircraft)
 
     def record_takeoff(self, aircraft: Any, time: SimTime) -> None:
         """
@@ -204,6 +256,9 @@ class Statistics:
         time : SimTime
             The simulation time at departure.
         """
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.TAKEOFF, time, aircraft)
+
         joined = getattr(aircraft, "joinedTakeoffQueueAt", None)
         if joined is None:
             return
@@ -211,6 +266,7 @@ class Statistics:
         wait = max(0, int(time) - int(joined))
         self.takeoff_wait_sum += wait
         self.takeoff_count += 1
+        self.takeoff_wait_hist.record(wait)
 
         self.max_takeoff_wait = max(self.max_takeoff_wait, wait)
 
@@ -226,6 +282,8 @@ class Statistics:
             The timestamp of the diversion.
         """
         self.diversions += 1
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.DIVERT, time, aircraft)
 
     def record_cancellation(self, aircraft: Any = None, time: SimTime = 0) -> None:
         """
@@ -239,11 +297,67 @@ class Statistics:
             The timestamp of the cancellation.
         """
         self.cancellations += 1
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.CANCEL, time, aircraft)
+
+    def record_cancellations(self, aircraft: Sequence[Any], time: SimTime = 0) -> None:
+        """
+        Record several cancellations at once.
+
+        Parameters
+        ----------
+        aircraft : Sequence[Any]
+            The aircraft being cancelled.
+        time : SimTime, optional
+            The timestamp of the cancellations.
+        """
+        self.cancellations += len(aircraft)
+        if self.event_log is not None:
+            for a in aircraft:
+                self.event_log.emit(eventlog.CANCEL, time, a)
+
+    def record_spawn(self, aircraft: Any, time: SimTime) -> None:
+        """
+        Log an aircraft appearing in the simulation (event log only).
+
+        Parameters
+        ----------
+        aircraft : Any
+            The aircraft that spawned.
+        time : SimTime
+            The spawn time.
+        """
+        if self.event_log is not None:
+            self.event_log.emit(
+                eventlog.SPAWN,
+                time,
+                aircraft,
+                type=getattr(aircraft, "type", None),
+                scheduled=getattr(aircraft, "scheduledTime", None),
+                cls=getattr(aircraft, "aircraft_class", None),
+            )
+
+    def record_fuel_emergency(self, aircraft: Any, time: SimTime) -> None:
+        """
+        Log an aircraft declaring a fuel emergency (event log only).
+
+        Parameters
+        ----------
+        aircraft : Any
+            The aircraft declaring the emergency.
+        time : SimTime
+            The timestamp of the declaration.
+        """
+        if self.event_log is not None:
+            self.event_log.emit(eventlog.FUEL_EMERGENCY, time, aircraft, fuel=getattr(aircraft, "fuelRemaining", None))
 
     def record_runway_busy(self, runway: Any, duration_min: int) -> None:
         """
         Accumulate active usage time for a specific runway.
 
+        Busy time is keyed by runway id rather than the runway object, so that
+        statistics from separate runs (or processes) can be merged.
+
         Parameters
         ----------
         runway : Any
@@ -251,7 +365,48 @@ class Statistics:
         duration_min : int
             The operational duration to add to the runway's total busy time.
         """
-        self.runway_busy_time[runway] = self.runway_busy_time.get(runway, 0) + int(duration_min)
+        key = getattr(runway, "id", runway)
+        self.runway_busy_time[key] = self.runway_busy_time.get(key, 0) + int(duration_min)
+
+    def merge(self, other: "Statistics") -> None:
+        """
+        Fold the metrics of another run into this one.
+
+        Sums, counts, histograms and per-runway busy time are added and
+        maxima are combined, so merging is exact: the merged report is the report of
+        all recorded events pooled together. Configuration and the random
+        number generator are left untouched.
+
+        Parameters
+        ----------
+        other : Statistics
+            Statistics of another (independent) run.
+        """
+        self.max_holding_size = max(self.max_holding_size, other.max_holding_size)
+        self.max_takeoff_size = max(self.max_takeoff_size, other.max_takeoff_size)
+        self.max_takeoff_wait = max(self.max_takeoff_wait, other.max_takeoff_wait)
+        self.max_arrival_delay = max(self.max_arrival_delay, other.max_arrival_delay)
+
+        self.holding_size_sum += other.holding_size_sum
+        self.takeoff_size_sum += other.takeoff_size_sum
+        self.snapshots += other.snapshots
+
+        self.holding_time_sum += other.holding_time_sum
+        self.holding_count += other.holding_count
+        self.takeoff_wait_sum += other.takeoff_wait_sum
+        self.takeoff_count += other.takeoff_count
+        self.arrival_delay_sum += other.arrival_delay_sum
+        self.arrival_count += other.arrival_count
+
+        self.holding_time_hist.merge(other.holding_time_hist)
+        self.takeoff_wait_hist.merge(other.takeoff_wait_hist)
+        self.arrival_delay_hist.merge(other.arrival_delay_hist)
+
+        self.diversions += other.diversions
+        self.cancellations += other.cancellations
+
+        for key, busy in other.runway_busy_time.items():
+            self.runway_busy_time[key] = self.runway_busy_time.get(key, 0) + busy
 
     def report(self) -> Dict[str, float]:
         """
@@ -260,16 +415,17 @@ class Statistics:
         Returns
         -------
         Dict[str, float]
-            A dictionary containing the calculated maximums, averages, and totals
-            for rendering in the UI or exporting to a log file.
+            A dictionary containing the calculated maximums, averages,
+            percentiles (e.g. ``p90HoldingTime``) and totals for rendering in
+            the UI or exporting to a log file.
         """
-        avg_holding_q = round((self.holding_size_sum / self.snapshots) if self.snapshots else 0.0)
-        avg_takeoff_q = round((self.takeoff_size_sum / self.snapshots) if self.snapshots else 0.0)
-        avg_hold_time = round((self.holding_time_sum / self.holding_count) if self.holding_count else 0.0)
-        avg_takeoff_wait = round((self.takeoff_wait_sum / self.takeoff_count) if self.takeoff_count else 0.0)
-        avg_arrival_delay = round((self.arrival_delay_sum / self.arrival_count) if self.arrival_count else 0.0)
+        avg_holding_q = (self.holding_size_sum / self.snapshots) if self.snapshots else 0.0
+        avg_takeoff_q = (self.takeoff_size_sum / self.snapshots) if self.snapshots else 0.0
+        avg_hold_time = (self.holding_time_sum / self.holding_count) if self.holding_count else 0.0
+        avg_takeoff_wait = (self.takeoff_wait_sum / self.takeoff_count) if self.takeoff_count else 0.0
+        avg_arrival_delay = (self.arrival_delay_sum / self.arrival_count) if self.arrival_count else 0.0
 
-        return {
+        report = {
             "maxHoldingQueue": float(self.max_holding_size),
             "avgHoldingQueue": float(avg_holding_q),
             "maxTakeoffQueue": float(self.max_takeoff_size),
@@ -281,4 +437,12 @@ class Statistics:
             "maxArrivalDelay": float(self.max_arrival_delay),
             "diversions": float(self.diversions),
             "cancellations": float(self.cancellations),
-        }
\ No newline at end of file
+        }
+        for name, hist in (
+            ("HoldingTime", self.holding_time_hist),
+            ("TakeoffWait", self.takeoff_wait_hist),
+            ("ArrivalDelay", self.arrival_delay_hist),
+        ):
+            for p in PERCENTILES:
+                report[f"p{p}{name}"] = hist.quantile(p / 100)
+        return report
\ No newline at end of file
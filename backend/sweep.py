@@ -0,0 +1,360 @@
+"""
+Parameter sweeps over ``SimulationParams`` grids.
+
+``run_sweep`` expands a grid of parameter values into grid points, runs a
+number of seeded replications of each point across a process pool and
+appends one JSON line per (point, replication) to a results file. Work that
+is already in the results file is skipped, so an interrupted sweep resumes
+where it stopped when run again::
+
+    python -m backend.sweep --grid num_runways=1,2,3 \\
+        --grid inbound_rate_per_hour=20:60:10 --grid outbound_rate_per_hour=30 \\
+        --replications 5 --seed 1 --output sweep.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .SimulationParameters import SimulationParams
+from .replications import derive_seeds
+from .report import ReportSink
+from .run import _FIELD_TYPES, load_config, run_simulation
+
+_FIELDS = {f.name: f for f in dataclasses.fields(SimulationParams)}
+
+
+def expand_grid(base: Dict[str, Any], grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into a list of grid points.
+
+    Parameters
+    ----------
+    base : Dict[str, Any]
+        Parameter values shared by every point.
+    grid : Dict[str, Sequence[Any]]
+        Values to sweep for each parameter. Values override ``base``.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One complete parameter dict per combination, in grid order (the last
+        parameter varies fastest).
+
+    Raises
+    ------
+    ValueError
+        If a parameter is unknown or a point fails ``SimulationParams.validate``.
+    """
+    unknown = sorted((set(base) | set(grid)) - set(_FIELDS))
+    if unknown:
+        raise ValueError(f"unknown parameters: {', '.join(unknown)}")
+
+    names = list(grid)
+    points = []
+    for combo in itertools.product(*(grid[name] for name in names)):
+        point = dict(base)
+        point.update(zip(names, combo))
+        try:
+            SimulationParams(**point).validate()
+        except TypeError as e:
+            raise ValueError(f"missing simulation parameters: {e}") from None
+        except ValueError as e:
+            raise ValueError(f"invalid grid point {point}: {e}") from None
+        points.append(point)
+    return points
+
+
+def _point_key(point: Dict[str, Any], replication: int, seed: int) -> Tuple[str, int, int]:
+    """Identify a (grid point, replication, seed) run in the results file."""
+    return json.dumps(point, sort_keys=True), replication, seed
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the rows of a sweep results file.
+
+    A missing file reads as empty, and a partially written last line (from a
+    crash mid-write) is ignored.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON lines results file.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One row per completed (point, replication).
+    """
+    if not os.path.exists(path):
+        return []
+
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return rows
+
+
+def _run_point(point: Dict[str, Any], duration_min: int, seed: int) -> Dict[str, float]:
+    """Run one replication of a grid point; module level so it can be pickled."""
+    return run_simulation(SimulationParams(**point), duration_min=duration_min, seed=seed)
+
+
+def run_sweep(
+    base: Dict[str, Any],
+    grid: Dict[str, Sequence[Any]],
+    output: str,
+    replications: int = 1,
+    duration_min: int = 1440,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    append_csv: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run every grid point and replication not already in ``output``.
+
+    Each row of the results table holds the grid point's parameters, the
+    replication index, its seed, the duration and the ``Statistics.report()``
+    metrics. Replication ``i`` uses the same seed at every grid point, so
+    points are compared under common random numbers.
+
+    Parameters
+    ----------
+    base : Dict[str, Any]
+        Parameter values shared by every point.
+    grid : Dict[str, Sequence[Any]]
+        Values to sweep for each parameter.
+    output : str
+        JSON lines results file. Rows are appended as runs finish.
+    replications : int, optional
+        Replications per grid point. Default is 1.
+    duration_min : int, optional
+        Simulated minutes per run. Default is one day.
+    seed : int, optional
+        Base seed from which replication seeds are derived. Only rows run
+        with the same replication seeds are resumed, so a sweep without a
+        base seed always runs afresh.
+    max_workers : int, optional
+        Size of the process pool. ``1`` runs serially in this process.
+    append_csv : str, optional
+        Also append each new report to this statistics CSV file, through a
+        buffered ``ReportSink``.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Rows for every requested (point, replication), in grid order.
+    """
+    if replications < 1:
+        raise ValueError("replications must be >= 1.")
+
+    points = expand_grid(base, grid)
+    seeds = derive_seeds(seed, replications)
+
+    done = {}
+    for row in load_results(output):
+        # Rows of another duration or base seed belong to a different sweep
+        if row.get("duration") == duration_min and row.get("seed") in seeds:
+            done[_point_key(row["point"], row["replication"], row["seed"])] = row
+
+    todo = [
+        (point, i)
+        for point in points
+        for i in range(replications)
+        if _point_key(point, i, seeds[i]) not in done
+    ]
+
+    if todo:
+        with open(output, "a+", encoding="utf-8") as f, _sink(append_csv) as sink:
+            # Terminate a line left half written by an interrupted sweep
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                if f.read(1) != "\n":
+                    f.write("\n")
+
+            for point, i, report in _run_all(todo, duration_min, seeds, max_workers):
+                row = {"point": point, "replication": i, "seed": seeds[i], "duration": duration_min}
+                row.update(report)
+                f.write(json.dumps(row) + "\n")
+                f.flush()
+                if sink is not None:
+                    sink.append(report, duration_min)
+                done[_point_key(point, i, seeds[i])] = row
+
+    return [done[_point_key(point, i, seeds[i])] for point in points for i in range(replications)]
+
+
+@contextlib.contextmanager
+def _sink(path: Optional[str]) -> Iterator[Optional[ReportSink]]:
+    """A ``ReportSink`` for ``path`` that is closed on exit, or None without a path."""
+    if path is None:
+        yield None
+        return
+    with ReportSink(path) as sink:
+        yield sink
+
+
+def _run_all(
+    todo: List[Tuple[Dict[str, Any], int]],
+    duration_min: int,
+    seeds: List[int],
+    max_workers: Optional[int],
+) -> Iterable[Tuple[Dict[str, Any], int, Dict[str, float]]]:
+    """Yield (point, replication, report) as runs complete."""
+    if max_workers == 1:
+        for point, i in todo:
+            yield point, i, _run_point(point, duration_min, seeds[i])
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_run_point, point, duration_min, seeds[i]): (point, i) for point, i in todo}
+        for future in as_completed(futures):
+            point, i = futures[future]
+            yield point, i, future.result()
+
+
+def table(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Flatten sweep rows into a tidy table, one flat dict per row.
+
+    Parameters
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        Rows as returned by ``run_sweep``.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Rows with the grid point's parameters as top-level columns.
+    """
+    flat = []
+    for row in rows:
+        record = dict(row["point"])
+        record.update((k, v) for k, v in row.items() if k != "point")
+        flat.append(record)
+    return flat
+
+
+def parse_values(name: str, text: str) -> List[Any]:
+    """
+    Parse a ``--grid`` value list for one parameter.
+
+    Accepts a comma-separated list (``1,2,3``) or an inclusive range
+    ``start:stop:step`` (``20:60:10``).
+
+    Parameters
+    ----------
+    name : str
+        SimulationParams field name, used to pick the value type.
+    text : str
+        The values as written on the command line.
+
+    Returns
+    -------
+    List[Any]
+        The parsed values.
+    """
+    if name not in _FIELDS:
+        raise ValueError(f"unknown parameter {name!r}.")
+    kind = _FIELD_TYPES[_FIELDS[name].type]
+
+    if ":" in text:
+        parts = text.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"{name}: ranges must look like start:stop:step.")
+        # Decimal arithmetic, so 0:0.3:0.1 gives 0.3 rather than 0.30000000000000004
+        try:
+            start, stop, step = (Decimal(kind(p)) if kind is int else Decimal(p.strip()) for p in parts)
+        except InvalidOperation:
+            raise ValueError(f"{name}: invalid range {text!r}.") from None
+        if not step > 0:
+            raise ValueError(f"{name}: range step must be > 0.")
+        count = int((stop - start) // step) + 1
+        return [kind(start + k * step) for k in range(max(0, count))]
+
+    return [kind(v) for v in text.split(",") if v.strip()]
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.sweep",
+        description="Sweep SimulationParams over a grid and append per-run reports to a JSON lines file.",
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="FIELD=VALUES",
+        help="Values for one parameter: a comma list (1,2,3) or an inclusive range (20:60:10). Repeatable.",
+    )
+    parser.add_argument("--config", help="JSON file with base SimulationParams fields.")
+    parser.add_argument("--output", required=True, help="JSON lines results file; existing rows are reused.")
+    parser.add_argument("--replications", type=int, default=1, help="Replications per grid point (default: 1).")
+    parser.add_argument("--duration", type=int, default=1440, help="Simulated minutes per run (default: 1440).")
+    parser.add_argument("--seed", type=int, default=None, help="Base seed for reproducible, resumable sweeps.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core).")
+    parser.add_argument("--append-csv", help="Also append every new report to this statistics CSV file.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point. Prints the tidy table as JSON lines.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        Arguments to parse. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Process exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        base = load_config(args.config) if args.config else {}
+        grid = {}
+        for spec in args.grid:
+            name, sep, text = spec.partition("=")
+            if not sep:
+                raise ValueError(f"--grid {spec!r}: expected FIELD=VALUES.")
+            name = name.strip().replace("-", "_")
+            grid[name] = parse_values(name, text)
+
+        rows = run_sweep(
+            base,
+            grid,
+            args.output,
+            replications=args.replications,
+            duration_min=args.duration,
+            seed=args.seed,
+            max_workers=args.workers,
+            append_csv=args.append_csv,
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    for record in table(rows):
+        print(json.dumps(record))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
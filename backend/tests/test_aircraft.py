@@ -95,4 +95,37 @@ def test_scheduledTime_and_fuelRemaining_cast_to_int():
     assert isinstance(a.scheduledTime, int)
     assert isinstance(a.fuelRemaining, int)
     assert a.scheduledTime == 15
-    assert a.fuelRemaining == 40
\ No newline at end of file
+    assert a.fuelRemaining == 40
+
+#lazy metadata and slots
+
+def test_metadata_is_deterministic_from_seed_and_id():
+    a = Aircraft("I7", "INBOUND", 10, 50, seed=3)
+    b = Aircraft("I7", "INBOUND", 99, 20, seed=3)
+    c = Aircraft("I8", "INBOUND", 10, 50, seed=3)
+
+    assert a._metadata is None
+    assert (a.callsign, a.operator, a.ground_speed, a.origin) == (b.callsign, b.operator, b.ground_speed, b.origin)
+    assert a._metadata is not None
+    assert (a.callsign, a.origin) != (c.callsign, c.origin)
+    assert 300 <= a.ground_speed <= 600
+    assert len(a.operator) == 2 and len(a.origin) == 3
+
+
+def test_aircraft_has_no_instance_dict():
+    a = Aircraft("A14", "INBOUND", 10, 50)
+
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.unknown_attribute = 1
+
+
+def test_emergency_type_flags_behave_like_booleans():
+    e = EmergencyType(passenger_illness=True)
+
+    assert e.passenger_illness is True and e.fuel_emergency is False
+    e.fuel_emergency = True
+    assert e.flags == EmergencyType.PASSENGER_ILLNESS | EmergencyType.FUEL_EMERGENCY
+    e.passenger_illness = False
+    assert e == EmergencyType(fuel_emergency=True)
+    assert not EmergencyType()
@@ -252,3 +252,138 @@ class TestAirport:
         assert r.occupancy == "OCCUPIED"
         assert r.currentAircraft is not None
 
+
+
+    #runway index
+
+    def test_assignLanding_prefers_landing_runway_over_mixed(self):
+        mixed = Runway("R1", "MIXED")
+        landing = Runway("R2", "LANDING")
+        airport = Airport([mixed, landing], self.holding, self.takeOff, self.stats)
+
+        a = TempAircraft("IN7")
+        airport.holding.enqueue(a, time=0)
+        airport.assignLanding(time=1)
+
+        assert landing.currentAircraft == a
+        assert mixed.currentAircraft is None
+        assert airport._runways_for_landing() == [landing, mixed]
+
+    def test_index_follows_runway_changes_made_outside_the_airport(self):
+        r = Runway("R1", "TAKEOFF")
+        airport = Airport([r], self.holding, self.takeOff, self.stats)
+        assert not airport.hasFreeRunway("LANDING")
+
+        r.mode = "LANDING"
+        assert airport.hasFreeRunway("LANDING")
+        assert not airport.hasFreeRunway("TAKEOFF")
+
+        r.status = "Runway Inspection"
+        assert not airport.hasFreeRunway("LANDING")
+
+        r.status = "AVAILABLE"
+        a = TempAircraft("IN8")
+        airport.holding.enqueue(a, time=0)
+        airport.assignLanding(time=2)
+        assert r.currentAircraft == a
+
+    def test_replacing_runway_list_rebuilds_index(self):
+        r1 = Runway("R1", "LANDING")
+        r2 = Runway("R2", "LANDING")
+        airport = Airport([r1], self.holding, self.takeOff, self.stats)
+
+        airport.runways = [r2]
+        r1.occupancy = "OCCUPIED"   # detached runways no longer notify the airport
+
+        airport.holding.enqueue(TempAircraft("IN9"), time=0)
+        airport.assignLanding(time=0)
+        assert r2.currentAircraft is not None
+
+    def test_updateRunways_releases_in_time_order(self):
+        r1 = Runway("R1", "MIXED")
+        r2 = Runway("R2", "MIXED")
+        airport = Airport([r1, r2], self.holding, self.takeOff, self.stats)
+
+        airport.holding.enqueue(TempAircraft("A1"), time=0)
+        airport.assignLanding(time=0)
+        airport.holding.enqueue(TempAircraft("A2"), time=2)
+        airport.assignLanding(time=2)
+        assert airport.nextRelease() == 3
+
+        airport.updateRunways(time=4)
+        assert r1.occupancy == "FREE" and r2.occupancy == "OCCUPIED"
+        assert airport.nextRelease() == 5
+        assert airport.hasFreeRunway("TAKEOFF")
+
+    def test_assignTo_occupancy_depends_on_aircraft_class(self):
+        r = Runway("R1", "MIXED")
+        r.length = 3000
+        airport = Airport([r], self.holding, self.takeOff, self.stats)
+
+        heavy = TempAircraft("H1")
+        heavy.aircraft_class = "HEAVY"
+        airport.holding.enqueue(heavy, time=0)
+        airport.assignLanding(time=0)
+
+        assert r.occupiedUntil == 4
+        assert airport.nextRelease() == 4
+
+    def test_assignLanding_waits_for_wake_separation(self):
+        r = Runway("R1", "LANDING")
+        r.length = 3000
+        airport = Airport([r], self.holding, self.takeOff, self.stats)
+
+        heavy = TempAircraft("H1")
+        heavy.aircraft_class = "HEAVY"
+        light = TempAircraft("L1")
+        light.aircraft_class = "LIGHT"
+        airport.holding.enqueue(heavy, time=0)
+        airport.holding.enqueue(light, time=0)
+        airport.assignLanding(time=0)
+
+        airport.updateRunways(time=4)
+        airport.assignLanding(time=4)
+        assert r.occupancy == "FREE"
+        assert airport.nextClearance("LANDING", 4) == 6
+
+        airport.assignLanding(time=6)
+        assert r.currentAircraft is light
+
+    def test_departure_interleaves_behind_arrival_on_mixed_runway(self):
+        r = Runway("R1", "MIXED")
+        r.length = 3000
+        airport = Airport([r], self.holding, self.takeOff, self.stats)
+
+        heavy = TempAircraft("H1")
+        heavy.aircraft_class = "HEAVY"
+        light = TempAircraft("L1")
+        light.aircraft_class = "LIGHT"
+        departure = TempAircraft("O1")
+        airport.holding.enqueue(heavy, time=0)
+        airport.holding.enqueue(light, time=0)
+        airport.takeoff.enqueue(departure, time=0)
+        airport.assignLanding(time=0)
+
+        airport.updateRunways(time=4)
+        airport.assignLanding(time=4)
+        airport.assignTakeOff(time=4)
+        assert r.currentAircraft is departure
+
+    def test_resetRunways_frees_occupied_runways_for_a_restarted_clock(self):
+        r = Runway("R1", "MIXED")
+        airport = Airport([r], self.holding, self.takeOff, self.stats)
+        airport.holding.enqueue(TempAircraft("A1"), time=1000)
+        airport.assignLanding(time=1000)
+        r.status = "Runway Inspection"
+
+        # The UI reset: the clock restarts at 0 with the runway still occupied until after 1000
+        airport.resetRunways()
+        assert r.isAvailable() and r.currentAircraft is None
+        assert airport.nextRelease() is None
+
+        a = TempAircraft("A2")
+        airport.holding.enqueue(a, time=0)
+        airport.assignLanding(time=0)
+        assert r.currentAircraft is a
+        airport.updateRunways(time=r.occupiedUntil)
+        assert airport.hasFreeRunway("TAKEOFF")
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+from backend.SimulationParameters import SimulationParams
+from backend.changes import EMPTY, ChangeFeed, ChangeSet
+from backend.run import build_engine
+
+
+def plane(id):
+    return SimpleNamespace(id=id)
+
+
+def test_feed_collects_and_drains():
+    feed = ChangeFeed()
+    feed.aircraft_added(plane("A"))
+    feed.aircraft_changed(plane("A"))     # Already reported as added
+    feed.aircraft_changed(plane("B"))
+    feed.aircraft_removed(plane("C"))
+    feed.runway_changed(SimpleNamespace(id=1))
+
+    changes = feed.drain()
+    assert changes == ChangeSet(frozenset({"A"}), frozenset({"C"}), frozenset({"B"}), frozenset({1}))
+    assert not feed.drain()
+    assert not EMPTY
+
+
+def test_added_then_removed_cancels_out():
+    feed = ChangeFeed()
+    feed.aircraft_added(plane("A"))
+    feed.aircraft_removed(plane("A"))
+    assert not feed.drain()
+
+
+def test_then_merges_consecutive_change_sets():
+    first = ChangeSet(added=frozenset({"A", "B"}), changed=frozenset({"C"}))
+    second = ChangeSet(removed=frozenset({"A", "C"}), changed=frozenset({"B", "D"}), runways=frozenset({2}))
+
+    merged = first.then(second)
+    assert merged.added == {"B"}
+    assert merged.removed == {"C"}
+    assert merged.changed == {"D"}
+    assert merged.runways == {2}
+
+    feed = ChangeFeed()
+    feed.aircraft_removed(plane("A"))
+    feed.aircraft_removed(plane("C"))
+    for id in ("B", "D"):
+        feed.aircraft_changed(plane(id))
+    feed.runway_changed(SimpleNamespace(id=2))
+    assert feed.drain(before=first) == merged
+
+
+def test_airport_and_engine_report_every_queue_change():
+    engine = build_engine(SimulationParams(num_runways=2, inbound_rate_per_hour=40, outbound_rate_per_hour=40), seed=3)
+    feed = engine.airport.changes = ChangeFeed()
+
+    seen = set()
+    for _ in range(300):
+        before = {a.id for a in engine.get_holding_queue() + engine.get_takeoff_queue()}
+        before |= {r.currentAircraft.id for r in engine.get_runways() if r.currentAircraft}
+        engine.run_for(1)
+        after = {a.id for a in engine.get_holding_queue() + engine.get_takeoff_queue()}
+        after |= {r.currentAircraft.id for r in engine.get_runways() if r.currentAircraft}
+
+        changes = feed.drain()
+        assert changes.added == after - before
+        assert changes.removed == before - after
+        seen |= changes.changed
+    assert seen
+
+
+def test_no_feed_by_default():
+    engine = build_engine(SimulationParams(num_runways=1, inbound_rate_per_hour=20, outbound_rate_per_hour=20), seed=3)
+    engine.run_for(60)
+    assert engine.airport.changes is None
@@ -63,6 +63,27 @@ def test_update_constraints_diverts_low_fuel_aircraft():
     assert airport.holding.size() == 0  # Plane is successfully removed from queue
 
 
+def test_update_constraints_fuel_emergency_jumps_queue():
+    params = TempParams()
+    airport = TempAirport()
+    stats = TempStats()
+    engine = SimulationEngine(params=params, airport=airport, stats=stats)
+
+    a1 = TempAircraft("A1", fuelRemaining=50, joined_time=0)
+    a2 = TempAircraft("A2", fuelRemaining=20, joined_time=0)
+    airport.holding.enqueue(a1, time=0)
+    airport.holding.enqueue(a2, time=0)
+
+    #At the end of tick 4, A2 has 15 fuel left: fuel emergency, no diversion
+    engine.update_constraints(now=4, dt=1)
+
+    assert stats.diversions == 0
+    assert a2.fuelRemaining == 15
+    assert a2.emergency.fuel_emergency is True
+    assert a1.emergency is None
+    assert airport.holding.peek() is a2
+
+
 def test_update_constraints_cancels_long_wait_takeoff():
     params = TempParams()
     airport = TempAirport()
@@ -85,4 +106,103 @@ def test_update_constraints_cancels_long_wait_takeoff():
     engine.update_constraints(now=31, dt=1)
     
     assert stats.cancellations == 1
-    assert airport.takeoff.size() == 0  # Plane successfully removed from queue
\ No newline at end of file
+    assert airport.takeoff.size() == 0  # Plane successfully removed from queue
+
+def build_real_engine(seed: int, event_driven: bool, **overrides) -> SimulationEngine:
+    import random
+    from backend.SimulationParameters import SimulationParams
+    from backend.statistics import Statistics
+    from backend.runway import Runway
+    from backend.airport import Airport
+
+    params = SimulationParams(num_runways=2, **{"inbound_rate_per_hour": 30.0, "outbound_rate_per_hour": 25.0, **overrides})
+    stats = Statistics()
+    runways = [Runway("R1", "MIXED", rng=random.Random(seed)), Runway("R2", "LANDING", rng=random.Random(seed + 1))]
+    airport = Airport(runways, HoldingQueue(), TakeOffQueue(), stats)
+    return SimulationEngine(params=params, airport=airport, stats=stats, seed=seed, event_driven=event_driven)
+
+
+def test_event_driven_run_matches_tick_based_run():
+    tick_engine = build_real_engine(seed=7, event_driven=False)
+    event_engine = build_real_engine(seed=7, event_driven=True)
+
+    tick_engine.run_for(600)
+    event_engine.run_for(600)
+
+    assert event_engine.current_time == tick_engine.current_time
+    assert event_engine.stats.report() == tick_engine.stats.report()
+    assert event_engine.stats.holding_size_sum == tick_engine.stats.holding_size_sum
+    assert event_engine.stats.holding_time_sum == tick_engine.stats.holding_time_sum
+    assert event_engine.stats.takeoff_wait_sum == tick_engine.stats.takeoff_wait_sum
+    assert event_engine.stats.snapshots == tick_engine.stats.snapshots
+
+
+def test_event_driven_run_matches_tick_based_run_with_wake_separation():
+    tick_engine = build_real_engine(seed=7, event_driven=False, p_heavy=0.3, p_light=0.3)
+    event_engine = build_real_engine(seed=7, event_driven=True, p_heavy=0.3, p_light=0.3)
+
+    tick_engine.run_for(600)
+    event_engine.run_for(600)
+
+    assert event_engine.stats.report() == tick_engine.stats.report()
+    assert event_engine.stats.holding_time_sum == tick_engine.stats.holding_time_sum
+    assert event_engine.stats.snapshots == tick_engine.stats.snapshots
+
+
+def test_next_event_time_is_always_in_the_future():
+    engine = build_real_engine(seed=3, event_driven=True)
+
+    for _ in range(50):
+        now = engine.current_time
+        assert engine.next_event_time() > now
+        engine.advance()
+        assert engine.current_time > now
+
+
+def test_event_driven_run_backs_off_scanning_in_busy_traffic(monkeypatch):
+    tick_engine = build_real_engine(seed=5, event_driven=False, inbound_rate_per_hour=60.0, outbound_rate_per_hour=60.0)
+    event_engine = build_real_engine(seed=5, event_driven=True, inbound_rate_per_hour=60.0, outbound_rate_per_hour=60.0)
+    scans = []
+    real = event_engine.next_event_time
+    monkeypatch.setattr(event_engine, "next_event_time", lambda until=None: scans.append(until) or real(until))
+
+    tick_engine.run_for(600)
+    event_engine.run_for(600)
+
+    assert len(scans) < 600 // 4
+    assert event_engine.stats.report() == tick_engine.stats.report()
+    assert event_engine.stats.snapshots == tick_engine.stats.snapshots
+
+
+def test_event_driven_run_stops_at_requested_time():
+    engine = build_real_engine(seed=1, event_driven=True)
+
+    engine.run_for(95)
+
+    assert engine.current_time == 95
+    assert engine.stats.snapshots == 95
+
+
+def test_flush_pending_pops_only_due_aircraft_in_spawn_order():
+    class RecordingAirport(TempAirport):
+        def __init__(self):
+            super().__init__()
+            self.inbound = []
+
+        def handleInbound(self, aircraft, time):
+            self.inbound.append(aircraft.callsign)
+
+        def handleOutbound(self, aircraft, time):
+            pass
+
+    airport = RecordingAirport()
+    engine = SimulationEngine(params=TempParams(), airport=airport, stats=TempStats())
+
+    for callsign, spawn_time in [("A", 12), ("B", 5), ("C", 9), ("D", 5), ("E", 30)]:
+        engine._schedule(engine._pending_inbound, spawn_time, TempAircraft(callsign))
+
+    engine._flush_pending(now=10)
+
+    #equal spawn times keep their scheduling order
+    assert airport.inbound == ["B", "D", "C"]
+    assert sorted(t for t, _, _ in engine._pending_inbound) == [12, 30]
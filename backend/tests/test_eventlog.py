@@ -0,0 +1,61 @@
+import io
+from collections import Counter
+
+from backend.SimulationParameters import SimulationParams
+from backend.eventlog import EventLog, read_events
+from backend.run import run_simulation
+from backend.statistics import Statistics
+
+
+class TempAircraft:
+    def __init__(self, id: str):
+        self.id = id
+        self.scheduledTime = 0
+        self.enteredHoldingAt = None
+        self.joinedTakeoffQueueAt = None
+
+
+def test_buffer_is_written_only_when_full():
+    out = io.StringIO()
+    log = EventLog(out, buffer_events=3)
+
+    log.emit("land", 1, TempAircraft("I1"))
+    log.emit("land", 2, TempAircraft("I2"))
+    assert out.getvalue() == ""
+
+    log.emit("divert", 3, TempAircraft("I3"))
+    assert out.getvalue().count("\n") == 3
+    assert log._buffer == []
+
+    log.emit("cancel", 4, TempAircraft("O1"))
+    log.close()
+    assert out.getvalue().splitlines()[-1] == '{"t":4,"ev":"cancel","id":"O1"}'
+
+
+def test_statistics_records_events_only_when_a_log_is_attached():
+    quiet = Statistics()
+    quiet.record_diversion(TempAircraft("I1"), 5)
+    assert quiet.diversions == 1
+
+    out = io.StringIO()
+    stats = Statistics(event_log=EventLog(out))
+    stats.record_landing(TempAircraft("I2"), 7)
+    stats.record_cancellations([TempAircraft("O1"), TempAircraft("O2")], 9)
+    stats.event_log.flush()
+
+    assert [line.split(",")[1] for line in out.getvalue().splitlines()] == [
+        '"ev":"land"', '"ev":"cancel"', '"ev":"cancel"',
+    ]
+
+
+def test_run_event_log_matches_report(tmp_path):
+    path = tmp_path / "events.ndjson"
+    params = SimulationParams(num_runways=1, inbound_rate_per_hour=20, outbound_rate_per_hour=20)
+
+    report = run_simulation(params, duration_min=600, seed=2, event_log=str(path))
+    counts = Counter(e["ev"] for e in read_events(path))
+
+    assert counts["divert"] == report["diversions"]
+    assert counts["cancel"] == report["cancellations"]
+    assert counts["spawn"] == counts["hold"] + counts["enqueue"]
+    assert report == run_simulation(params, duration_min=600, seed=2)
@@ -0,0 +1,50 @@
+import pickle
+import random
+
+import pytest
+
+from backend.histogram import Histogram, bucket_bounds, bucket_index
+
+
+def test_buckets_are_contiguous_and_ordered():
+    previous_high = -1
+    for index in range(bucket_index(10 ** 6) + 1):
+        low, high = bucket_bounds(index)
+        assert low == previous_high + 1
+        assert bucket_index(low) == index and bucket_index(high) == index
+        previous_high = high
+
+
+def test_small_values_are_exact():
+    hist = Histogram()
+    for v in range(1, 101):
+        hist.record(v if v < 60 else 60)
+
+    assert hist.quantile(0.5) == 50
+    assert hist.quantile(0.99) == 60
+    assert hist.quantile(0.0) == 1
+
+
+def test_large_values_within_relative_error():
+    rng = random.Random(1)
+    values = sorted(rng.randint(0, 100000) for _ in range(5000))
+    hist = Histogram()
+    for v in values:
+        hist.record(v)
+
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert hist.quantile(q) == pytest.approx(exact, rel=1 / 16)
+    assert len(hist.counts) < 500
+
+
+def test_merge_equals_recording_everything_in_one():
+    a, b, both = Histogram(), Histogram(), Histogram()
+    for v in range(0, 3000, 7):
+        (a if v % 2 else b).record(v)
+        both.record(v)
+
+    a.merge(pickle.loads(pickle.dumps(b)))
+
+    assert a == both
+    assert a.quantile(0.9) == both.quantile(0.9)
@@ -0,0 +1,30 @@
+from backend.occupancy import OccupancyTable, occupancy_minutes
+from backend.runway import Runway
+
+
+class TempAircraft:
+    def __init__(self, aircraft_class: str):
+        self.aircraft_class = aircraft_class
+
+
+def test_occupancy_depends_on_class():
+    assert occupancy_minutes("LIGHT", "LANDING", None) == 2
+    assert occupancy_minutes("MEDIUM", "TAKEOFF", None) == 3
+    assert occupancy_minutes("HEAVY", "LANDING", None) == 4
+
+
+def test_short_runway_adds_a_minute_per_started_shortfall_step():
+    assert occupancy_minutes("HEAVY", "LANDING", 3000) == 4
+    assert occupancy_minutes("HEAVY", "LANDING", 2600) == 5
+    assert occupancy_minutes("HEAVY", "TAKEOFF", 2000) == 6
+    assert occupancy_minutes("LIGHT", "LANDING", 2000) == 2
+
+
+def test_table_lookup_uses_runway_length_and_defaults_to_medium():
+    r = Runway("R1", "MIXED")
+    r.length = 2400
+    table = OccupancyTable([r])
+
+    assert table.lookup(r, TempAircraft("HEAVY"), "LANDING") == 6
+    assert table.lookup(r, TempAircraft("LIGHT"), "TAKEOFF") == 2
+    assert table.lookup(r, object(), "LANDING") == 3
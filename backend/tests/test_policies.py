@@ -0,0 +1,112 @@
+import pytest
+
+from backend.SimulationParameters import SimulationParams
+from backend.aircraft import Aircraft
+from backend.airport import Airport
+from backend.policies import GreedyPolicy, OptimizingPolicy, make_policy
+from backend.queues import HoldingQueue, TakeOffQueue
+from backend.run import build_engine
+from backend.runway import Runway
+from backend.statistics import Statistics
+
+PARAMS = SimulationParams(num_runways=2, inbound_rate_per_hour=22, outbound_rate_per_hour=22)
+
+
+def build_airport(policy):
+    runway = Runway("R1", "MIXED")
+    airport = Airport([runway], HoldingQueue(), TakeOffQueue(), Statistics(), policy=policy)
+    # Plenty of fuel left for the arrivals, but the departure is about to be cancelled
+    for i in range(3):
+        airport.handleInbound(Aircraft(f"I{i}", "INBOUND", 0, 60), time=0)
+    airport.handleOutbound(Aircraft("O1", "OUTBOUND", 0, 60), time=0)
+    return airport, runway
+
+
+def test_airport_defaults_to_greedy_policy():
+    airport, runway = build_airport(None)
+
+    assert isinstance(airport.policy, GreedyPolicy)
+    airport.assignRunways(time=29)
+    assert runway.currentOperation == "LANDING"
+
+
+def test_optimizing_policy_saves_departure_close_to_cancellation():
+    airport, runway = build_airport(OptimizingPolicy(max_takeoff_wait_min=30))
+
+    airport.assignRunways(time=29)
+
+    assert runway.currentOperation == "TAKEOFF"
+    assert airport.holding.size() == 3
+
+
+def test_optimizing_policy_without_budget_is_greedy():
+    greedy = build_engine(PARAMS, seed=3, policy="greedy")
+    fallback = build_engine(PARAMS, seed=3)
+    fallback.airport.policy = OptimizingPolicy.from_params(PARAMS, budget_steps=0)
+
+    greedy.run_for(600)
+    fallback.run_for(600)
+
+    assert fallback.get_report() == greedy.get_report()
+
+
+def test_optimizing_policy_is_deterministic_in_both_time_modes():
+    tick = build_engine(PARAMS, seed=8, policy="optimizing")
+    event = build_engine(PARAMS, seed=8, event_driven=True, policy="optimizing")
+
+    tick.run_for(600)
+    event.run_for(600)
+
+    assert event.get_report() == tick.get_report()
+
+
+def test_optimizing_policy_uses_dedicated_runways_like_greedy():
+    def assigned(policy):
+        runways = [Runway("R1", "LANDING"), Runway("R2", "LANDING")]
+        # R1 is still in a heavy's wake: 6 minutes for a light, 4 for a heavy
+        runways[0].lastOperation, runways[0].lastOperationAt, runways[0].lastClass = "LANDING", 10, "HEAVY"
+        airport = Airport(runways, HoldingQueue(), TakeOffQueue(), Statistics(), policy=policy)
+        airport.handleInbound(Aircraft("I1", "INBOUND", 0, 60, aircraft_class="LIGHT"), time=0)
+        airport.handleInbound(Aircraft("I2", "INBOUND", 0, 60, aircraft_class="HEAVY"), time=0)
+        airport.assignRunways(time=14)
+        return [r.currentAircraft.id if r.currentAircraft else None for r in runways]
+
+    assert assigned(GreedyPolicy()) == ["I2", "I1"]
+    assert assigned(OptimizingPolicy()) == ["I2", "I1"]
+
+
+def test_make_policy_rejects_unknown_names():
+    assert isinstance(make_policy("optimizing", PARAMS), OptimizingPolicy)
+    with pytest.raises(ValueError):
+        make_policy("random")
+
+
+def test_optimizing_policy_plans_with_class_occupancy():
+    runway = Runway("R1", "MIXED")
+    runway.length = 4000
+    airport = Airport([runway], HoldingQueue(), TakeOffQueue(), Statistics(), policy=OptimizingPolicy())
+    # The heavy arrival diverts after 30 and the light departure is cancelled after 30
+    airport.handleInbound(Aircraft("I1", "INBOUND", 0, 41, aircraft_class="HEAVY"), time=0)
+    airport.handleOutbound(Aircraft("O1", "OUTBOUND", 0, 60, aircraft_class="LIGHT"), time=0)
+
+    # Landing first (4 min) loses the departure; the light departure (2 min) leaves time to land.
+    # With 3 minutes per operation either order would lose one of them.
+    airport.assignRunways(time=27)
+
+    assert runway.currentOperation == "TAKEOFF"
+    assert runway.occupiedUntil == 29
+
+
+def test_optimizing_policy_plans_with_wake_separation():
+    runway = Runway("R1", "MIXED")
+    runway.length = 4000
+    airport = Airport([runway], HoldingQueue(), TakeOffQueue(), Statistics(), policy=OptimizingPolicy())
+    # The medium arrival diverts at 33 and the heavy departure is cancelled after 30
+    airport.handleInbound(Aircraft("I1", "INBOUND", 0, 44, aircraft_class="MEDIUM"), time=0)
+    airport.handleOutbound(Aircraft("O1", "OUTBOUND", 0, 60, aircraft_class="HEAVY"), time=0)
+
+    # Taking off first would leave the runway free for the arrival at 32, but the
+    # heavy's wake holds it until 33, so it diverts; losing the departure is cheaper
+    airport.assignRunways(time=28)
+
+    assert runway.currentOperation == "LANDING"
@@ -86,6 +86,104 @@ def test_holding_queue_peek_does_not_remove():
     assert hq.dequeue().callsign == "A1"  #dequeue should match what peek returned
 
 
+class FuelAircraft(TempAircraft):
+    def __init__(self, callsign: str, fuelRemaining: int, emergency: bool = False):
+        super().__init__(callsign, emergency)
+        self.fuelRemaining = fuelRemaining
+
+
+def test_holding_queue_promote_keeps_fifo_among_emergencies():
+    hq = HoldingQueue()
+    e1 = TempAircraft("E1", emergency=True)
+    n1 = TempAircraft("N1")
+    n2 = TempAircraft("N2")
+
+    hq.enqueue(e1, time=1)
+    hq.enqueue(n1, time=2)
+    hq.enqueue(n2, time=3)
+
+    #N2 declares an emergency: it jumps N1 but stays behind the earlier E1
+    hq.promote(2)
+
+    assert hq.size() == 3
+    assert [hq.dequeue().callsign for _ in range(3)] == ["E1", "N2", "N1"]
+
+
+def test_holding_queue_remove_skips_removed_aircraft():
+    hq = HoldingQueue()
+    a1 = TempAircraft("A1")
+    a2 = TempAircraft("A2")
+
+    hq.enqueue(a1, time=1)
+    hq.enqueue(a2, time=2)
+    hq.remove(0)
+
+    assert hq.size() == 1
+    assert hq.to_list() == [a2]
+    assert hq.peek() is a2
+    assert hq.dequeue() is a2
+    assert hq.dequeue() is None
+
+
+def test_holding_queue_landing_order_matches_dequeue_order():
+    hq = HoldingQueue()
+    planes = [TempAircraft(f"A{i}", emergency=i % 4 == 3) for i in range(12)]
+    for t, a in enumerate(planes):
+        hq.enqueue(a, time=t)
+    hq.promote(5)
+    hq.remove(2)
+
+    order = hq.landing_order()
+    assert order[:4] == [planes[3], planes[5], planes[7], planes[11]]
+    assert sorted(order, key=id) == sorted(hq.to_list(), key=id)
+    assert order == [hq.dequeue() for _ in range(hq.size())]
+
+
+def test_holding_queue_head_is_a_window_of_the_landing_order():
+    hq = HoldingQueue()
+    planes = [TempAircraft(f"A{i}", emergency=i % 5 == 4) for i in range(20)]
+    for t, a in enumerate(planes):
+        a.fuelRemaining = 30 + t
+        hq.enqueue(a, time=t)
+    hq.promote(2)
+    hq.remove(9)
+    hq.dequeue()
+
+    order = hq.landing_order()
+    for n in (0, 1, 3, 7, 19, 50):
+        assert [a for _, a in hq.head(n)] == order[:n]
+    assert [(fuel_out_at, a) for fuel_out_at, a in hq.head()] == [(30 + 2 * planes.index(a), a) for a in order]
+    assert hq.landing_order() == order
+
+
+def test_holding_queue_fuel_index_reports_only_due_aircraft():
+    hq = HoldingQueue()
+    a1 = FuelAircraft("A1", fuelRemaining=30)
+    a2 = FuelAircraft("A2", fuelRemaining=20)
+
+    hq.enqueue(a1, time=0)   #fuel runs out at 30
+    hq.enqueue(a2, time=5)   #fuel runs out at 25
+
+    assert hq.next_fuel_out() == 25
+    assert [a for _, _, a in hq.pop_fuel_alerts(26)] == [a2]
+    assert hq.pop_fuel_alerts(26) == []        #reported only once
+    assert hq.next_fuel_out(alerts=True) == 30
+
+    assert [a for _, _, a in hq.remove_fuel_out(30)] == [a2, a1]
+    assert hq.size() == 0
+
+
+def test_holding_queue_fuel_index_ignores_landed_aircraft():
+    hq = HoldingQueue()
+    a1 = FuelAircraft("A1", fuelRemaining=20)
+
+    hq.enqueue(a1, time=0)
+    assert hq.dequeue() is a1
+
+    assert hq.next_fuel_out() is None
+    assert hq.remove_fuel_out(100) == []
+
+
 #TakeOffQueue tests
 
 def test_takeoff_queue_starts_empty():
@@ -119,3 +217,15 @@ def test_takeoff_queue_fifo_order():
     assert tq.dequeue().callsign == "T2"
     assert tq.dequeue() is None
     assert tq.isEmpty() is True
+
+
+def test_takeoff_queue_expire_pops_only_expired_head():
+    tq = TakeOffQueue()
+    planes = [TempAircraft(f"T{i}") for i in range(4)]
+    for i, a in enumerate(planes):
+        tq.enqueue(a, time=i * 10)
+
+    assert tq.expire(now=40, max_wait=30) == planes[:1]
+    assert tq.expire(now=40, max_wait=30) == []
+    assert tq.expire(now=55, max_wait=30) == planes[1:3]
+    assert tq.to_list() == planes[3:]
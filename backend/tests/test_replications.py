@@ -0,0 +1,96 @@
+import pytest
+
+from backend.SimulationParameters import SimulationParams
+from backend.replications import derive_seeds, percentile, run_replications, summarise, t_quantile
+from backend.statistics import Statistics
+
+
+class TempAircraft:
+    def __init__(self, scheduledTime=None):
+        self.scheduledTime = scheduledTime
+        self.enteredHoldingAt = None
+        self.joinedTakeoffQueueAt = None
+
+
+class TempRunway:
+    def __init__(self, id):
+        self.id = id
+
+
+PARAMS = SimulationParams(num_runways=1, inbound_rate_per_hour=20, outbound_rate_per_hour=15)
+
+
+#Statistics.merge
+
+def test_merge_is_exact():
+    a = Statistics()
+    b = Statistics()
+    pooled = Statistics()
+
+    for stats in (a, pooled):
+        stats.snapshot_queues(holding_size=2, takeoff_size=1, time=1)
+        plane = TempAircraft(scheduledTime=0)
+        plane.enteredHoldingAt = 3
+        stats.record_landing(plane, time=10)
+        stats.record_runway_busy(TempRunway(1), 3)
+        stats.record_diversion()
+
+    for stats in (b, pooled):
+        stats.snapshot_queues(holding_size=7, takeoff_size=0, time=1)
+        plane = TempAircraft()
+        plane.joinedTakeoffQueueAt = 2
+        stats.record_takeoff(plane, time=20)
+        stats.record_runway_busy(TempRunway(1), 3)
+        stats.record_runway_busy(TempRunway(2), 4)
+        stats.record_cancellation()
+
+    a.merge(b)
+
+    assert a.report() == pooled.report()
+    assert a.runway_busy_time == pooled.runway_busy_time == {1: 6, 2: 4}
+    assert a.snapshots == 2
+
+
+#Summary helpers
+
+def test_derive_seeds_is_deterministic_and_distinct():
+    seeds = derive_seeds(5, 100)
+    assert seeds == derive_seeds(5, 100)
+    assert derive_seeds(5, 10) == seeds[:10]
+    assert len(set(seeds)) == 100
+
+
+def test_t_quantile_matches_tables():
+    assert t_quantile(0.975, 1) == pytest.approx(12.706, abs=1e-3)
+    assert t_quantile(0.975, 2) == pytest.approx(4.303, abs=1e-3)
+    assert t_quantile(0.975, 5) == pytest.approx(2.571, abs=5e-3)
+    assert t_quantile(0.975, 30) == pytest.approx(2.042, abs=1e-3)
+
+
+def test_summarise_mean_ci_and_percentiles():
+    summary = summarise([1.0, 2.0, 3.0, 4.0], percentiles=(50, 100))
+
+    assert summary.mean == 2.5
+    assert summary.ci_low < 2.5 < summary.ci_high
+    assert summary.percentiles == {50: 2.5, 100: 4.0}
+    assert percentile([1.0, 2.0], 25) == 1.25
+
+
+#Replication runs
+
+def test_replications_are_reproducible_and_serial_matches_parallel():
+    serial = run_replications(PARAMS, n=4, duration_min=180, seed=11, max_workers=1)
+    parallel = run_replications(PARAMS, n=4, duration_min=180, seed=11, max_workers=2)
+
+    assert serial.seeds == parallel.seeds
+    assert serial.reports == parallel.reports
+    assert serial.pooled.report() == parallel.pooled.report()
+    assert serial.pooled.snapshots == 4 * 180
+
+
+def test_replication_summary_covers_every_metric():
+    result = run_replications(PARAMS, n=3, duration_min=120, seed=2, max_workers=1)
+
+    assert set(result.summary) == set(result.reports[0])
+    diversions = [r["diversions"] for r in result.reports]
+    assert result.summary["diversions"].mean == pytest.approx(sum(diversions) / 3)
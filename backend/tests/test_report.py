@@ -0,0 +1,137 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from backend import report
+
+from backend.report import (
+    ReportHistory,
+    ReportSink,
+    append_report_csv,
+    read_last_report,
+    read_recent_reports,
+    read_reports_csv,
+)
+
+
+def test_legacy_csv_is_migrated_and_queried(tmp_path):
+    path = str(tmp_path / "stats.csv")
+    for i in range(5):
+        append_report_csv({"diversions": i, "p90HoldingTime": 2.0 * i}, sim_time_min=10 * i, csv_path=path)
+
+    assert not (tmp_path / "stats.sqlite3").exists()
+    last = read_last_report(path)
+
+    assert last == read_reports_csv(path)[-1]
+    assert last["diversions"] == 4.0 and last["p90HoldingTime"] == 8.0
+    assert [r["sim_time_min"] for r in read_recent_reports(3, path)] == [40, 30, 20]
+
+
+def test_history_imports_only_new_rows(tmp_path):
+    path = str(tmp_path / "stats.csv")
+    append_report_csv({"diversions": 1}, sim_time_min=1, csv_path=path)
+
+    with ReportHistory(path) as history:
+        assert history.count() == 1
+        append_report_csv({"diversions": 2}, sim_time_min=2, csv_path=path)
+        append_report_csv({"diversions": 3}, sim_time_min=3, csv_path=path)
+        assert history.sync() == 2
+        assert history.sync() == 0
+        assert history.count() == 3
+
+
+def test_partial_row_waits_for_the_next_sync(tmp_path):
+    path = tmp_path / "stats.csv"
+    append_report_csv({"diversions": 1}, sim_time_min=1, csv_path=str(path))
+    with path.open("a", encoding="utf-8") as f:
+        f.write("2026-01-01T00:00:00+00:00,5")
+
+    with ReportHistory(str(path)) as history:
+        assert history.sync() == 1
+        with path.open("a", encoding="utf-8") as f:
+            f.write(",,,,,,,,,,,,\n")
+        assert history.sync() == 1
+        assert history.last()[0]["sim_time_min"] == 5
+
+
+def test_time_range_and_replaced_file(tmp_path):
+    path = tmp_path / "stats.csv"
+    header = "saved_at_utc,sim_time_min,diversions\n"
+    path.write_text(
+        header
+        + "2026-01-01T00:00:00+00:00,1,0\n"
+        + "2026-01-02T00:00:00+00:00,2,0\n"
+        + "2026-01-03T00:00:00+00:00,3,0\n"
+    )
+
+    with ReportHistory(str(path)) as history:
+        rows = history.between("2026-01-02", "2026-01-03")
+        assert [r["sim_time_min"] for r in rows] == [2]
+
+        path.write_text(header + "2026-02-01T00:00:00+00:00,9,0\n")
+        assert [r["sim_time_min"] for r in history.last(5)] == [9]
+
+
+
+def test_rewritten_file_of_the_same_or_larger_size_is_reindexed(tmp_path):
+    path = tmp_path / "stats.csv"
+    header = "saved_at_utc,sim_time_min,diversions\n"
+    path.write_text(header + "2026-01-01T00:00:00+00:00,1,0\n")
+
+    with ReportHistory(str(path)) as history:
+        assert history.count() == 1
+
+        path.write_text(header + "2026-01-01T00:00:00+00:00,7,0\n")
+        assert [r["sim_time_min"] for r in history.last(5)] == [7]
+
+        path.write_text(header + "2026-03-01T00:00:00+00:00,8,0\n" + "2026-03-02T00:00:00+00:00,9,0\n")
+        assert [r["sim_time_min"] for r in history.last(5)] == [9, 8]
+
+
+def test_recent_reports_fall_back_to_the_csv_when_the_index_cannot_be_written(tmp_path, monkeypatch):
+    path = str(tmp_path / "stats.csv")
+    with ReportSink(path) as sink:
+        sink.extend(({"diversions": i}, i) for i in range(50))
+    (tmp_path / "stats.sqlite3").mkdir()           # Not a database file
+    monkeypatch.setattr(report, "_TAIL_BLOCK", 100)
+
+    assert [r["sim_time_min"] for r in read_recent_reports(3, path)] == [49, 48, 47]
+    assert read_recent_reports(80, path) == read_reports_csv(path)[::-1]
+    assert read_last_report(path)["diversions"] == 49.0
+
+def test_sink_batches_rows_until_flush(tmp_path):
+    path = tmp_path / "stats.csv"
+
+    with ReportSink(str(path), max_rows=3) as sink:
+        sink.append({"diversions": 1}, 10)
+        sink.append({"diversions": 2}, 20)
+        assert not path.exists()
+        sink.append({"diversions": 3}, 30)
+        assert len(read_reports_csv(str(path))) == 3
+        sink.extend([({"diversions": 4}, 40)])
+        assert len(read_reports_csv(str(path))) == 3
+
+    assert [r["diversions"] for r in read_reports_csv(str(path))] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_sink_flushes_old_rows_on_append(tmp_path):
+    path = tmp_path / "stats.csv"
+
+    with ReportSink(str(path), max_rows=100, max_delay_s=0) as sink:
+        sink.append({"diversions": 1}, 10)
+        assert len(read_reports_csv(str(path))) == 1
+
+
+def _append_many(path, worker):
+    with ReportSink(path, max_rows=7) as sink:
+        sink.extend(({"diversions": worker, "extra": "x" * 500}, i) for i in range(50))
+
+
+def test_parallel_sinks_write_one_header_and_whole_rows(tmp_path):
+    path = str(tmp_path / "stats.csv")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_append_many, [path] * 4, range(4)))
+
+    rows = read_reports_csv(path)
+    assert len(rows) == 200
+    assert all(r["extra"] == "x" * 500 for r in rows)
+    with open(path, encoding="utf-8") as f:
+        assert f.read().count("saved_at_utc") == 1
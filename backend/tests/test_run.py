@@ -0,0 +1,184 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.SimulationParameters import SimulationParams
+from backend.run import STARTUP_BUDGET_S, build_engine, main, run_simulation
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+#Headless entry point must not drag in the GUI stack
+def test_import_does_not_load_gui_modules():
+    out = run_python(
+        "import sys, backend.run, main; "
+        "print(any(m in sys.modules for m in ('tkinter', 'PIL', 'frontend.frontend')))"
+    )
+    assert out == "False"
+
+
+def test_import_within_startup_budget():
+    out = run_python(
+        "import time; t = time.perf_counter(); import backend.run; print(time.perf_counter() - t)"
+    )
+    assert float(out) < STARTUP_BUDGET_S
+
+
+def test_build_engine_defaults_to_mixed_runways():
+    params = SimulationParams(num_runways=3, inbound_rate_per_hour=10, outbound_rate_per_hour=10)
+    engine = build_engine(params, seed=1)
+
+    assert [r.mode for r in engine.get_runways()] == ["MIXED", "MIXED", "MIXED"]
+
+
+def test_build_engine_rejects_wrong_number_of_modes():
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=10, outbound_rate_per_hour=10)
+    with pytest.raises(ValueError):
+        build_engine(params, runway_modes=["LANDING"])
+
+
+def test_run_simulation_is_reproducible():
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=20, outbound_rate_per_hour=20)
+
+    assert run_simulation(params, 300, seed=4) == run_simulation(params, 300, seed=4, event_driven=True)
+
+
+def test_main_reads_config_and_flags_override(tmp_path, capsys):
+    config = tmp_path / "params.json"
+    config.write_text(json.dumps({"num_runways": 1, "inbound_rate_per_hour": 5, "outbound_rate_per_hour": 5}))
+    output = tmp_path / "report.json"
+
+    status = main([
+        "--config", str(config), "--inbound-rate-per-hour", "12",
+        "--duration", "120", "--seed", "3", "--output", str(output),
+    ])
+
+    assert status == 0
+    report = json.loads(output.read_text())
+    expected = run_simulation(
+        SimulationParams(num_runways=1, inbound_rate_per_hour=12, outbound_rate_per_hour=5), 120, seed=3
+    )
+    assert report == expected
+
+
+def test_main_rejects_unknown_config_keys(tmp_path):
+    config = tmp_path / "params.json"
+    config.write_text(json.dumps({"num_runwayz": 1}))
+
+    with pytest.raises(SystemExit):
+        main(["--config", str(config)])
+
+
+def test_main_reports_missing_parameters(tmp_path, capsys):
+    config = tmp_path / "params.json"
+    config.write_text(json.dumps({"num_runways": 1}))
+
+    with pytest.raises(SystemExit):
+        main(["--config", str(config)])
+    assert "missing simulation parameters" in capsys.readouterr().err
+
+
+def test_main_does_not_hide_internal_type_errors(monkeypatch):
+    import backend.run as run
+
+    def broken(*args, **kwargs):
+        raise TypeError("internal")
+
+    monkeypatch.setattr(run, "run_simulation", broken)
+    with pytest.raises(TypeError, match="internal"):
+        main(["--num-runways", "1", "--inbound-rate-per-hour", "5", "--outbound-rate-per-hour", "5"])
+
+
+
+def test_main_rejects_non_positive_timeseries_buckets(capsys):
+    flags = ["--num-runways", "2", "--inbound-rate-per-hour", "10", "--outbound-rate-per-hour", "10"]
+    with pytest.raises(SystemExit):
+        main(flags + ["--timeseries-every", "0"])
+    assert "--timeseries-every must be >= 1" in capsys.readouterr().err
+
+    params = SimulationParams(num_runways=1, inbound_rate_per_hour=10, outbound_rate_per_hour=10)
+    assert run_simulation(params, duration_min=30, seed=1, timeseries_every=0) == run_simulation(params, duration_min=30, seed=1)
+    with pytest.raises(ValueError):
+        run_simulation(params, duration_min=30, seed=1, timeseries="unused.csv", timeseries_every=0)
+
+
+#Per-stream RNGs
+
+def fingerprint(params: SimulationParams, seed: int):
+    engine = build_engine(params, seed=seed)
+    engine.run_for(120)
+    planes = [a for _, _, a in engine._pending_inbound + engine._pending_outbound]
+    planes += engine.airport.holding.to_list() + engine.airport.takeoff.to_list()
+    return (
+        sorted((a.id, a.callsign, a.operator, a.ground_speed, a.origin, a.destination) for a in planes),
+        [(r.length, r.bearing) for r in engine.get_runways()],
+        engine.get_report(),
+    )
+
+
+def test_seeded_run_ignores_global_random_state():
+    import random
+
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=30, outbound_rate_per_hour=30)
+    random.seed(1)
+    first = fingerprint(params, seed=4)
+    random.seed(2)
+    second = fingerprint(params, seed=4)
+
+    assert first == second
+
+
+def test_gui_engine_runways_follow_the_seed():
+    import random
+    import main
+
+    random.seed(1)
+    first = [(r.length, r.bearing) for r in main.build_engine(seed=4).get_runways()]
+    random.seed(2)
+    second = [(r.length, r.bearing) for r in main.build_engine(seed=4).get_runways()]
+
+    assert first == second
+
+
+def test_seeded_run_matches_in_worker_process():
+    from concurrent.futures import ProcessPoolExecutor
+
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=30, outbound_rate_per_hour=30)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        remote = pool.submit(fingerprint, params, 9).result()
+
+    assert remote == fingerprint(params, seed=9)
+
+
+def test_emergency_rolls_do_not_shift_fuel_draws():
+    base = SimulationParams(num_runways=1, inbound_rate_per_hour=30, outbound_rate_per_hour=0)
+    calm = SimulationParams(
+        num_runways=1, inbound_rate_per_hour=30, outbound_rate_per_hour=0,
+        p_mechanical_failure=0.0, p_passenger_illness=0.0,
+    )
+
+    def fuels(params):
+        engine = build_engine(params, seed=3)
+        return [a.fuelRemaining for _, _, a in sorted(engine._pending_inbound)]
+
+    assert fuels(base) == fuels(calm)
+
+
+def test_heavy_mix_lengthens_queues():
+    medium = SimulationParams(num_runways=1, inbound_rate_per_hour=15, outbound_rate_per_hour=0)
+    heavy = SimulationParams(num_runways=1, inbound_rate_per_hour=15, outbound_rate_per_hour=0, p_heavy=1.0)
+
+    assert (
+        run_simulation(heavy, duration_min=600, seed=5)["avgHoldingTime"]
+        > run_simulation(medium, duration_min=600, seed=5)["avgHoldingTime"]
+    )
@@ -0,0 +1,31 @@
+from backend.runway import Runway
+from backend.separation import clear_at, separation_minutes
+
+
+class TempAircraft:
+    def __init__(self, aircraft_class: str):
+        self.aircraft_class = aircraft_class
+
+
+def test_wake_separation_depends_on_leader_and_follower_class():
+    assert separation_minutes("LANDING", "HEAVY", "LANDING", "LIGHT") == 6
+    assert separation_minutes("TAKEOFF", "HEAVY", "TAKEOFF", "MEDIUM") == 5
+    assert separation_minutes("LANDING", "LIGHT", "LANDING", "HEAVY") == 0
+    assert separation_minutes("LANDING", "MEDIUM", "LANDING", "MEDIUM") == 0
+
+
+def test_departure_behind_arrival_needs_no_wake_spacing():
+    assert separation_minutes("LANDING", "HEAVY", "TAKEOFF", "LIGHT") == 0
+    assert separation_minutes("TAKEOFF", "HEAVY", "LANDING", "LIGHT") == 6
+
+
+def test_clear_at_uses_the_runways_last_operation():
+    r = Runway("R1", "MIXED")
+    assert clear_at(r, TempAircraft("LIGHT"), "LANDING") is None
+
+    r.assign(TempAircraft("HEAVY"), "LANDING", time=10, duration=4)
+    r.release()
+
+    assert (r.lastOperation, r.lastOperationAt, r.lastClass) == ("LANDING", 10, "HEAVY")
+    assert clear_at(r, TempAircraft("LIGHT"), "LANDING") == 16
+    assert clear_at(r, TempAircraft("LIGHT"), "TAKEOFF") == 10
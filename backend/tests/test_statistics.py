@@ -33,6 +33,19 @@ def test_snapshot_queues_max_and_avg():
     assert rep["avgTakeoffQueue"] == pytest.approx((3 + 2 + 10) / 3)
 
 
+#Snapshot covering several idle ticks counts like repeated snapshots
+def test_snapshot_queues_multiple_ticks():
+    stats = Statistics()
+
+    stats.snapshot_queues(holding_size=2, takeoff_size=1, time=0)
+    stats.snapshot_queues(holding_size=3, takeoff_size=0, time=4, ticks=4)
+
+    assert stats.snapshots == 5
+    assert stats.holding_size_sum == 2 + 3 * 4
+    assert stats.takeoff_size_sum == 1
+    assert stats.max_holding_size == 3
+
+
 #Landing: holding time avg + arrival delay avg + max arrival delay
 def test_record_landing_updates_holding_and_delay():
     stats = Statistics()
@@ -87,6 +100,15 @@ def test_diversions_and_cancellations():
     assert rep["cancellations"] == 1.0
 
 
+def test_record_cancellations_counts_all():
+    stats = Statistics()
+
+    stats.record_cancellations([TempAircraft(), TempAircraft(), TempAircraft()], time=5)
+    stats.record_cancellations([], time=6)
+
+    assert stats.report()["cancellations"] == 3.0
+
+
 #Standard div tests
 
 #INBOUND
@@ -162,4 +184,21 @@ def test_outbound_sigma_zero_returns_scheduled():
     #arrival sigma is non-zero departure sigma is zero
     stats.configure_from_params(TempParams(arrival_stddev_min=5, departure_stddev_min=0), seed=1)
 
-    assert stats.sample_outbound_spawn_time(100) == 100
\ No newline at end of file
+    assert stats.sample_outbound_spawn_time(100) == 100
+
+#Percentiles come from the histograms and survive merging
+def test_report_percentiles_and_merge():
+    first, second = Statistics(), Statistics()
+    for i, wait in enumerate(range(1, 101)):
+        a = TempAircraft()
+        a.joinedTakeoffQueueAt = 0
+        (first if i % 2 else second).record_takeoff(a, time=wait)
+
+    first.merge(second)
+    rep = first.report()
+
+    assert rep["p50TakeoffWait"] == 50.0
+    # Values above 64 minutes share buckets, within ~3%
+    assert rep["p90TakeoffWait"] == pytest.approx(90, rel=1 / 32)
+    assert rep["p99TakeoffWait"] == pytest.approx(99, rel=1 / 32)
+    assert rep["p50HoldingTime"] == 0.0
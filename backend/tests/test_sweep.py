@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from backend.sweep import expand_grid, load_results, main, parse_values, run_sweep, table
+
+BASE = {"num_runways": 1, "outbound_rate_per_hour": 10}
+GRID = {"inbound_rate_per_hour": [10, 20], "max_takeoff_wait_min": [20, 30]}
+
+
+def test_expand_grid_is_cartesian_in_grid_order():
+    points = expand_grid(BASE, GRID)
+
+    assert len(points) == 4
+    assert points[0] == {**BASE, "inbound_rate_per_hour": 10, "max_takeoff_wait_min": 20}
+    assert points[1]["max_takeoff_wait_min"] == 30
+
+
+def test_expand_grid_rejects_unknown_and_invalid_points():
+    with pytest.raises(ValueError, match="unknown"):
+        expand_grid(BASE, {"runways": [1]})
+    with pytest.raises(ValueError, match="invalid grid point"):
+        expand_grid(BASE, {"inbound_rate_per_hour": [10], "fuel_min_min": [25]})
+
+
+def test_parse_values_lists_and_inclusive_ranges():
+    assert parse_values("num_runways", "1,2,3") == [1, 2, 3]
+    assert parse_values("inbound_rate_per_hour", "20:40:10") == [20.0, 30.0, 40.0]
+    assert parse_values("p_mechanical_failure", "0:0.3:0.1") == pytest.approx([0, 0.1, 0.2, 0.3])
+
+
+def test_fractional_range_steps_give_the_values_as_written():
+    assert parse_values("p_mechanical_failure", "0:0.3:0.1") == [0.0, 0.1, 0.2, 0.3]
+    assert parse_values("p_light", "0.05:0.35:0.15") == [0.05, 0.2, 0.35]
+    assert parse_values("inbound_rate_per_hour", "1.1:1.5:0.2") == parse_values("inbound_rate_per_hour", "1.1,1.3,1.5")
+    with pytest.raises(ValueError):
+        parse_values("p_light", "0:1:x")
+
+
+def test_sweep_writes_one_row_per_point_and_replication(tmp_path):
+    out = tmp_path / "sweep.jsonl"
+    rows = run_sweep(BASE, GRID, str(out), replications=2, duration_min=60, seed=1, max_workers=1)
+
+    assert len(rows) == 8
+    assert len(load_results(str(out))) == 8
+    assert [r["replication"] for r in rows[:2]] == [0, 1]
+    # Common random numbers: replication i has the same seed at every point
+    assert rows[0]["seed"] == rows[2]["seed"] != rows[1]["seed"]
+
+    flat = table(rows)
+    assert flat[0]["inbound_rate_per_hour"] == 10
+    assert "avgHoldingTime" in flat[0]
+
+
+def test_sweep_resumes_without_recomputing(tmp_path, monkeypatch):
+    out = tmp_path / "sweep.jsonl"
+    full = run_sweep(BASE, GRID, str(out), replications=2, duration_min=60, seed=1, max_workers=1)
+
+    # Simulate a crash: keep three complete rows and half of the fourth
+    lines = out.read_text().splitlines(keepends=True)
+    out.write_text("".join(lines[:3]) + lines[3][:10])
+
+    calls = []
+    import backend.sweep as sweep
+    real = sweep._run_point
+    monkeypatch.setattr(sweep, "_run_point", lambda *a: calls.append(a) or real(*a))
+
+    resumed = run_sweep(BASE, GRID, str(out), replications=2, duration_min=60, seed=1, max_workers=1)
+
+    assert len(calls) == 5
+    assert resumed == full
+    assert len(load_results(str(out))) == 8
+
+
+def test_sweep_with_another_seed_does_not_reuse_rows(tmp_path):
+    out = tmp_path / "sweep.jsonl"
+    first = run_sweep(BASE, GRID, str(out), duration_min=60, seed=1, max_workers=1)
+    second = run_sweep(BASE, GRID, str(out), duration_min=60, seed=2, max_workers=1)
+
+    assert [r["seed"] for r in first] != [r["seed"] for r in second]
+    assert second == run_sweep(BASE, GRID, str(tmp_path / "fresh.jsonl"), duration_min=60, seed=2, max_workers=1)
+    assert run_sweep(BASE, GRID, str(out), duration_min=60, seed=1, max_workers=1) == first
+    assert len(load_results(str(out))) == 2 * len(first)
+
+
+def test_sweep_appends_new_reports_to_csv(tmp_path):
+    from backend.report import read_reports_csv
+
+    out, csv_path = tmp_path / "sweep.jsonl", tmp_path / "stats.csv"
+    run_sweep(BASE, GRID, str(out), duration_min=60, seed=1, max_workers=1, append_csv=str(csv_path))
+    run_sweep(BASE, GRID, str(out), duration_min=60, seed=1, max_workers=1, append_csv=str(csv_path))
+
+    reports = read_reports_csv(str(csv_path))
+    assert len(reports) == 4
+    assert all(r["sim_time_min"] == 60 for r in reports)
+
+
+def test_sweep_runs_in_parallel(tmp_path):
+    serial = run_sweep(BASE, GRID, str(tmp_path / "a.jsonl"), duration_min=60, seed=3, max_workers=1)
+    parallel = run_sweep(BASE, GRID, str(tmp_path / "b.jsonl"), duration_min=60, seed=3, max_workers=2)
+
+    assert parallel == serial
+
+
+def test_cli_prints_table(tmp_path, capsys):
+    out = tmp_path / "sweep.jsonl"
+    status = main([
+        "--grid", "num_runways=1,2",
+        "--grid", "inbound-rate-per-hour=15",
+        "--grid", "outbound_rate_per_hour=15",
+        "--duration", "60",
+        "--seed", "2",
+        "--workers", "1",
+        "--output", str(out),
+    ])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert status == 0
+    assert [r["num_runways"] for r in records] == [1, 2]
@@ -0,0 +1,76 @@
+import csv
+
+import pytest
+
+from backend.SimulationParameters import SimulationParams
+from backend.run import build_engine, run_simulation
+from backend.timeseries import TimeSeries
+
+
+def test_buckets_average_queue_sizes_and_runway_busy_fraction():
+    ts = TimeSeries(["R1", "R2"], every=2)
+    ts.record(0, 1, 0, [True, False])
+    ts.record(1, 3, 2, [False, False])
+    ts.record(2, 5, 0, [True, True])
+
+    cols = ts.columns()
+    assert cols["time"] == [0, 2]
+    assert cols["holding"] == [2.0, 5.0]
+    assert cols["takeoff"] == [1.0, 0.0]
+    assert cols["busy"] == [[0.5, 1.0], [0.0, 1.0]]
+
+
+def test_multi_tick_snapshot_is_split_across_buckets():
+    ts = TimeSeries(["R1"], every=5)
+    single = TimeSeries(["R1"], every=5)
+    ts.record(12, 4, 1, [True], ticks=10)
+    for t in range(3, 13):
+        single.record(t, 4, 1, [True])
+
+    assert ts.columns() == single.columns()
+    assert ts.columns()["time"] == [0, 5, 10]
+
+
+def test_ring_keeps_the_latest_buckets():
+    ts = TimeSeries([], every=1, capacity=3)
+    for t in range(10):
+        ts.record(t, t, 0)
+
+    assert len(ts) == 3
+    assert ts.columns()["time"] == [7, 8, 9]
+    assert ts.columns()["holding"] == [7.0, 8.0, 9.0]
+
+
+def test_event_driven_series_matches_tick_based():
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=25, outbound_rate_per_hour=25)
+    series = []
+    for event_driven in (False, True):
+        engine = build_engine(params, seed=4, event_driven=event_driven, timeseries_every=10)
+        engine.run_for(300)
+        series.append(engine.stats.timeseries.columns())
+
+    assert series[0] == series[1]
+    assert max(max(column) for column in series[0]["busy"]) > 0
+
+
+def test_run_writes_timeseries_csv(tmp_path):
+    path = tmp_path / "series.csv"
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=25, outbound_rate_per_hour=25)
+
+    run_simulation(params, duration_min=120, seed=1, timeseries=str(path), timeseries_every=30)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(r["time"]) for r in rows] == [0, 30, 60, 90, 120]
+    assert set(rows[0]) == {"time", "holding", "takeoff", "runway_1_busy", "runway_2_busy"}
+
+
+def test_to_numpy_shapes():
+    np = pytest.importorskip("numpy")
+    ts = TimeSeries(["R1", "R2"])
+    ts.record(0, 1, 2, [True, False])
+    ts.record(1, 1, 2, [False, False])
+
+    arrays = ts.to_numpy()
+    assert arrays["busy"].shape == (2, 2)
+    assert arrays["time"].dtype == np.int64
@@ -0,0 +1,259 @@
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from backend.SimulationParameters import SimulationParams
+from backend.run import build_engine
+from backend.worker import SimulationWorker, Snapshot
+
+
+def make_engine():
+    params = SimulationParams(num_runways=2, inbound_rate_per_hour=30, outbound_rate_per_hour=30)
+    return build_engine(params, seed=7)
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_snapshot_copies_engine_state():
+    engine = make_engine()
+    engine.run_for(60)
+    snap = SimulationWorker(engine).snapshot
+
+    assert isinstance(snap, Snapshot)
+    assert snap.time == 60
+    assert snap.holding_size == len(engine.get_holding_queue())
+    assert [a.callsign for a in snap.holding] == [a.callsign for a in engine.get_holding_queue()][:50]
+    assert [r.id for r in snap.runways] == [r.id for r in engine.get_runways()]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.time = 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.runways[0].status = "Closed"
+
+
+def test_snapshot_lists_holding_aircraft_in_landing_order():
+    params = SimulationParams(
+        num_runways=1, inbound_rate_per_hour=60, outbound_rate_per_hour=10,
+        p_mechanical_failure=0.1, p_passenger_illness=0.1,
+    )
+    engine = build_engine(params, seed=7)
+    engine.run_for(120)
+    snap = SimulationWorker(engine, queue_limit=None).snapshot
+
+    landing = [a.id for a in engine.airport.holding.landing_order()]
+    assert [a.id for a in snap.holding] == landing
+    assert landing != [a.id for a in engine.airport.holding.to_list()]
+
+
+def test_submit_runs_inline_when_not_started():
+    engine = make_engine()
+    worker = SimulationWorker(engine)
+    seq = worker.snapshot.seq
+
+    assert worker.call(lambda e: e.run_for(5) or e.get_time()) == 5
+    assert worker.snapshot.seq == seq + 1
+    assert worker.latest().time == 5
+    assert worker.latest() is None
+
+
+def test_worker_ticks_in_background_and_matches_direct_run():
+    engine = make_engine()
+    engine.speed_multiplier = 10_000.0
+    worker = SimulationWorker(engine).start()
+    try:
+        wait_for(lambda: worker.snapshot.time >= 200)
+        stopped_at = worker.call(lambda e: setattr(e, "is_paused", True) or e.get_time())
+        report = worker.call(lambda e: e.get_report())
+        time.sleep(0.05)
+        assert worker.call(lambda e: e.get_time()) == stopped_at
+        assert worker.snapshot.is_paused
+    finally:
+        worker.stop(timeout=5)
+    assert not worker.is_alive()
+
+    reference = make_engine()
+    reference.run_for(stopped_at)
+    assert report == reference.get_report()
+
+
+def test_latest_keeps_only_the_newest_snapshot():
+    engine = make_engine()
+    engine.speed_multiplier = 10_000.0
+    worker = SimulationWorker(engine, publish_interval=0.0).start()
+    try:
+        wait_for(lambda: worker.snapshot.time >= 50)
+        worker.call(lambda e: setattr(e, "is_paused", True))
+        last = worker.snapshot
+        assert worker.latest() is last
+        assert worker.latest() is None
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_commands_run_on_worker_thread_and_reraise():
+    engine = make_engine()
+    engine.is_paused = True
+    worker = SimulationWorker(engine).start()
+    try:
+        assert worker.call(lambda e: threading.current_thread().name) == "simulation-worker"
+        with pytest.raises(ZeroDivisionError):
+            worker.call(lambda e: 1 / 0)
+        assert worker.is_alive()
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_fast_forward_without_thread_runs_to_target():
+    engine = make_engine()
+    worker = SimulationWorker(engine)
+
+    assert worker.fast_forward(until=120, batch_min=7).result(timeout=0) == 120
+    assert worker.snapshot.time == 120
+    assert worker.snapshot.fast_forward_to is None
+
+
+def test_fast_forward_reaches_target_then_returns_to_live_speed():
+    engine = make_engine()
+    engine.speed_multiplier = 1.0
+    worker = SimulationWorker(engine).start()
+    try:
+        assert worker.fast_forward(until=360).result(timeout=10) == 360
+        report = worker.call(lambda e: e.get_report())
+        time.sleep(0.1)
+        # Back at one tick per second
+        assert worker.call(lambda e: e.get_time()) <= 361
+        assert worker.snapshot.fast_forward_to is None
+    finally:
+        worker.stop(timeout=5)
+
+    reference = make_engine()
+    reference.run_for(360)
+    assert report == reference.get_report()
+
+
+def test_unbounded_fast_forward_runs_until_stopped():
+    engine = make_engine()
+    engine.speed_multiplier = 1.0
+    worker = SimulationWorker(engine).start()
+    try:
+        done = worker.fast_forward()
+        wait_for(lambda: worker.snapshot.time >= 500)
+        assert worker.snapshot.fast_forward_to == float("inf")
+        worker.stop_fast_forward().result(timeout=5)
+        assert done.result(timeout=5) >= 500
+        assert worker.snapshot.fast_forward_to is None
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_queue_limit_none_copies_whole_queues():
+    engine = make_engine()
+    engine.run_for(240)
+    assert len(engine.get_takeoff_queue()) > 5
+
+    assert len(SimulationWorker(engine, queue_limit=5).snapshot.takeoff) == 5
+    snap = SimulationWorker(engine, queue_limit=None).snapshot
+    assert len(snap.takeoff) == snap.takeoff_size == len(engine.get_takeoff_queue())
+    assert len(snap.holding) == snap.holding_size == len(engine.get_holding_queue())
+
+
+def test_unchanged_aircraft_and_runways_keep_their_snapshot():
+    engine = make_engine()
+    engine.run_for(120)
+    worker = SimulationWorker(engine, queue_limit=None)
+    first = worker.snapshot
+    worker.call(lambda e: e.run_for(1))
+    second = worker.snapshot
+
+    old = {a.id: a for a in first.holding + first.takeoff}
+    for plane in second.holding + second.takeoff:
+        if plane.id in old and plane.id not in second.changes.changed:
+            assert plane is old[plane.id]
+    for before, after in zip(first.runways, second.runways):
+        assert (after is before) == (after.id not in second.changes.runways)
+    for runway in second.runways:
+        if runway.currentAircraft is not None:
+            assert second.on_runway[runway.currentAircraft.id] is runway
+
+
+def test_holding_fuel_follows_snapshot_time():
+    engine = make_engine()
+    engine.run_for(60)
+    worker = SimulationWorker(engine, queue_limit=None)
+    for _ in range(5):
+        worker.call(lambda e: e.run_for(3))
+        fuel = {a.id: a.fuelRemaining for a in engine.get_holding_queue()}
+        snap = worker.snapshot
+        assert {a.id: snap.fuel_remaining(a) for a in snap.holding} == fuel
+
+
+def test_snapshot_copies_a_window_without_touching_the_engine():
+    params = SimulationParams(num_runways=1, inbound_rate_per_hour=60, outbound_rate_per_hour=60)
+    engine = build_engine(params, seed=7)
+    engine.run_for(120)
+    fuel = {a.id: a.fuelRemaining for a in engine.airport.holding.to_list()}
+    assert len(fuel) > 5 and len(engine.airport.takeoff) > 5
+
+    worker = SimulationWorker(engine, queue_limit=5)
+    for _ in range(3):
+        worker.call(lambda e: None)
+    snap = worker.snapshot
+
+    assert [a.id for a in snap.holding] == [a.id for a in engine.airport.holding.landing_order()[:5]]
+    assert [a.id for a in snap.takeoff] == [a.id for a in engine.airport.takeoff.to_list()[:5]]
+    assert (snap.holding_size, snap.takeoff_size) == (len(engine.airport.holding), len(engine.airport.takeoff))
+    assert {a.id: a.fuelRemaining for a in engine.airport.holding.to_list()} == fuel
+    assert [snap.fuel_remaining(a) for a in snap.holding] == [
+        a.fuelRemaining for a in engine.get_holding_queue()[:5]
+    ]
+
+
+def test_skipped_snapshots_pass_their_changes_on():
+    engine = make_engine()
+    worker = SimulationWorker(engine)
+    worker.latest()
+    for _ in range(30):
+        worker.submit(lambda e: e.run_for(1))
+
+    snap = worker.latest()
+    assert snap.time == 30
+    assert worker.latest() is None
+    queued = {a.id for a in snap.holding + snap.takeoff} | set(snap.on_runway)
+    assert snap.changes.added <= queued
+    assert snap.changes.added | snap.changes.removed
+
+
+def test_reset_reports_discarded_aircraft_and_never_reuses_their_ids():
+    engine = make_engine()
+    engine.run_for(120)
+    worker = SimulationWorker(engine, queue_limit=None)
+    before = worker.snapshot
+    discarded = {a.id for a in before.holding + before.takeoff} | set(before.on_runway)
+    assert discarded
+
+    def reset(e):
+        # What the UI's reset does on the worker thread
+        e.current_time = 0
+        e.airport.clearAircraft()
+        e._pending_inbound.clear()
+        e._pending_outbound.clear()
+        e._prime_scheduler(lookahead_window=15)
+
+    worker.call(reset)
+    snap = worker.snapshot
+    assert snap.changes.removed == discarded
+    assert not snap.holding and not snap.takeoff and not snap.on_runway
+    assert all(r.currentAircraft is None for r in snap.runways)
+
+    worker.call(lambda e: e.run_for(60))
+    snap = worker.snapshot
+    fresh = {a.id for a in snap.holding + snap.takeoff} | set(snap.on_runway)
+    assert fresh and not fresh & discarded
+    old_copies = {id(a) for a in before.holding + before.takeoff}
+    assert not any(id(a) in old_copies for a in snap.holding + snap.takeoff)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+import csv
+
+# Default number of stored samples (one day at one-minute resolution)
+DEFAULT_CAPACITY = 1440
+
+
+class TimeSeries:
+    """
+    Fixed-size history of queue lengths and runway utilisation.
+
+    Ticks are grouped into buckets of ``every`` minutes. For each bucket the
+    series stores the mean holding and takeoff queue sizes and, per runway,
+    the fraction of ticks the runway was busy. Buckets live in preallocated
+    arrays used as a ring buffer: once ``capacity`` buckets are stored, each
+    new bucket overwrites the oldest, so memory stays constant however long
+    the run is.
+
+    Attach a series to ``Statistics.timeseries`` to enable it; the engine
+    then reports each runway's busy state with every queue snapshot.
+
+    Parameters
+    ----------
+    runway_ids : Sequence[Any]
+        Ids of the runways, one utilisation column each.
+    every : int, optional
+        Bucket width in minutes. Default is 1 (no downsampling).
+    capacity : int, optional
+        Number of buckets kept. Default is 1440.
+    """
+
+    def __init__(self, runway_ids: Sequence[Any], every: int = 1, capacity: int = DEFAULT_CAPACITY) -> None:
+        if every < 1:
+            raise ValueError("every must be >= 1.")
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        self.runway_ids = list(runway_ids)
+        self.every = int(every)
+        self.capacity = int(capacity)
+
+        self._time = array("q", bytes(8 * capacity))
+        self._holding = array("d", bytes(8 * capacity))
+        self._takeoff = array("d", bytes(8 * capacity))
+        self._busy = [array("d", bytes(8 * capacity)) for _ in self.runway_ids]
+        self._start = 0
+        self._len = 0
+
+        # Bucket being filled
+        self._bucket = None
+        self._ticks = 0
+        self._holding_sum = 0
+        self._takeoff_sum = 0
+        self._busy_ticks = [0] * len(self.runway_ids)
+
+    def record(
+        self,
+        time: int,
+        holding_size: int,
+        takeoff_size: int,
+        runways_busy: Sequence[bool] = (),
+        ticks: int = 1,
+        dt: int = 1,
+    ) -> None:
+        """
+        Add one snapshot, possibly standing for several identical ticks.
+
+        Parameters
+        ----------
+        time : int
+            Time of the (last) tick of the snapshot.
+        holding_size, takeoff_size : int
+            Queue sizes.
+        runways_busy : Sequence[bool], optional
+            Busy state of each runway, in ``runway_ids`` order. Missing
+            entries count as idle.
+        ticks : int, optional
+            Number of consecutive ticks, ending at ``time``, with this
+            state. Default is 1.
+        dt : int, optional
+            Tick duration in minutes. Default is 1.
+        """
+        first = int(time) - (int(ticks) - 1) * dt
+        remaining = int(ticks)
+        busy = list(runways_busy)[: len(self.runway_ids)]
+        while remaining > 0:
+            bucket = first // self.every
+            if bucket != self._bucket:
+                self._close_bucket()
+                self._bucket = bucket
+            # Ticks of this snapshot that fall into the current bucket
+            n = min(remaining, -(-((bucket + 1) * self.every - first) // dt))
+            self._ticks += n
+            self._holding_sum += holding_size * n
+            self._takeoff_sum += takeoff_size * n
+            for i, is_busy in enumerate(busy):
+                if is_busy:
+                    self._busy_ticks[i] += n
+            first += n * dt
+            remaining -= n
+
+    def _close_bucket(self) -> None:
+        """Store the bucket being filled in the ring and start an empty one."""
+        if self._bucket is None or self._ticks == 0:
+            return
+        if self._len == self.capacity:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        else:
+            slot = (self._start + self._len) % self.capacity
+            self._len += 1
+        self._write(slot)
+        self._bucket = None
+        self._ticks = 0
+        self._holding_sum = 0
+        self._takeoff_sum = 0
+        self._busy_ticks = [0] * len(self.runway_ids)
+
+    def _write(self, slot: int) -> None:
+        """Write the means of the bucket being filled into ring position ``slot``."""
+        self._time[slot] = self._bucket * self.every
+        self._holding[slot] = self._holding_sum / self._ticks
+        self._takeoff[slot] = self._takeoff_sum / self._ticks
+        for column, busy_ticks in zip(self._busy, self._busy_ticks):
+            column[slot] = busy_ticks / self._ticks
+
+    def __len__(self) -> int:
+        """Number of buckets available, including the one being filled."""
+        return min(self.capacity, self._len + (1 if self._ticks else 0))
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """
+        Return the stored history, oldest bucket first.
+
+        The bucket being filled is included with the means so far, without
+        closing it.
+
+        Returns
+        -------
+        Dict[str, List[Any]]
+            ``time`` (bucket start, minutes), ``holding`` and ``takeoff``
+            (mean queue sizes), and ``busy`` (one list of busy fractions per
+            runway, in ``runway_ids`` order).
+        """
+        order = [(self._start + i) % self.capacity for i in range(self._len)]
+        time = [self._time[i] for i in order]
+        holding = [self._holding[i] for i in order]
+        takeoff = [self._takeoff[i] for i in order]
+        busy = [[column[i] for i in order] for column in self._busy]
+
+        if self._ticks:
+            time.append(self._bucket * self.every)
+            holding.append(self._holding_sum / self._ticks)
+            takeoff.append(self._takeoff_sum / self._ticks)
+            for column, busy_ticks in zip(busy, self._busy_ticks):
+                column.append(busy_ticks / self._ticks)
+            if len(time) > self.capacity:
+                time, holding, takeoff = time[1:], holding[1:], takeoff[1:]
+                busy = [column[1:] for column in busy]
+
+        return {"time": time, "holding": holding, "takeoff": takeoff, "busy": busy}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Return the history as NumPy arrays.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            As ``columns``, with ``busy`` as a 2-D array of shape
+            (buckets, runways).
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        import numpy as np
+
+        cols = self.columns()
+        busy = np.array(cols["busy"], dtype=float).reshape(len(self.runway_ids), len(cols["time"])).T
+        return {
+            "time": np.array(cols["time"], dtype=np.int64),
+            "holding": np.array(cols["holding"], dtype=float),
+            "takeoff": np.array(cols["takeoff"], dtype=float),
+            "busy": busy,
+        }
+
+    def to_csv(self, path: Union[str, Path]) -> str:
+        """
+        Write the history to a CSV file, one row per bucket.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file; it is overwritten.
+
+        Returns
+        -------
+        str
+            The resolved path of the written file.
+        """
+        p = Path(path).expanduser().resolve()
+        p.parent.mkdir(parents=True, exist_ok=True)
+        cols = self.columns()
+        with p.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["time", "holding", "takeoff"] + [f"runway_{rid}_busy" for rid in self.runway_ids])
+            for i, t in enumerate(cols["time"]):
+                w.writerow([t, cols["holding"][i], cols["takeoff"][i]] + [column[i] for column in cols["busy"]])
+        return str(p)
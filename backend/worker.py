@@ -0,0 +1,626 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+import math
+import queue
+import threading
+import time
+
+from .changes import EMPTY, ChangeFeed, ChangeSet
+
+# Aircraft of each queue copied into a snapshot by default
+DEFAULT_QUEUE_LIMIT = 50
+
+# Shortest real time between two published snapshots, in seconds
+DEFAULT_PUBLISH_INTERVAL_S = 1 / 60
+
+# Largest real-time backlog, in seconds, the worker catches up on after a stall
+MAX_LAG_S = 0.25
+
+# Simulated minutes run per batch while fast-forwarding, between command checks
+DEFAULT_BATCH_MIN = 30
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class EmergencySnapshot:
+    """Immutable copy of an aircraft's ``EmergencyType``."""
+
+    mechanical_failure: bool = False
+    passenger_illness: bool = False
+    fuel_emergency: bool = False
+
+    def __bool__(self) -> bool:
+        return self.mechanical_failure or self.passenger_illness or self.fuel_emergency
+
+
+@dataclass(frozen=True)
+class AircraftSnapshot:
+    """
+    Immutable copy of the aircraft attributes the UI displays.
+
+    For a holding aircraft ``fuelOutAt`` is the time its fuel runs out, so
+    the copy stays valid as time passes; use ``Snapshot.fuel_remaining``
+    for the fuel left at a snapshot's time (``fuelRemaining`` is only the
+    value the aircraft held when it was copied).
+    """
+
+    id: str
+    callsign: str
+    operator: str
+    type: str
+    scheduledTime: int
+    fuelRemaining: int
+    altitude: int
+    origin: str
+    destination: str
+    ground_speed: int
+    aircraft_class: str
+    enteredHoldingAt: Optional[int]
+    joinedTakeoffQueueAt: Optional[int]
+    emergency: Optional[EmergencySnapshot]
+    fuelOutAt: Optional[int] = None
+
+    @classmethod
+    def of(cls, aircraft: Any, fuel_out_at: Optional[int] = None) -> "AircraftSnapshot":
+        """
+        Copy an aircraft.
+
+        Parameters
+        ----------
+        aircraft : Aircraft
+            The aircraft to copy.
+        fuel_out_at : int, optional
+            Time the fuel of a holding aircraft runs out.
+
+        Returns
+        -------
+        AircraftSnapshot
+            Its current state.
+        """
+        emergency = getattr(aircraft, "emergency", None)
+        if emergency is not None:
+            emergency = EmergencySnapshot(
+                mechanical_failure=bool(emergency.mechanical_failure),
+                passenger_illness=bool(emergency.passenger_illness),
+                fuel_emergency=bool(emergency.fuel_emergency),
+            )
+        return cls(
+            id=aircraft.id,
+            callsign=aircraft.callsign,
+            operator=aircraft.operator,
+            type=aircraft.type,
+            scheduledTime=aircraft.scheduledTime,
+            fuelRemaining=aircraft.fuelRemaining,
+            altitude=getattr(aircraft, "altitude", 0),
+            origin=aircraft.origin,
+            destination=aircraft.destination,
+            ground_speed=aircraft.ground_speed,
+            aircraft_class=getattr(aircraft, "aircraft_class", None),
+            enteredHoldingAt=getattr(aircraft, "enteredHoldingAt", None),
+            joinedTakeoffQueueAt=getattr(aircraft, "joinedTakeoffQueueAt", None),
+            emergency=emergency,
+            fuelOutAt=fuel_out_at,
+        )
+
+
+@dataclass(frozen=True)
+class RunwaySnapshot:
+    """Immutable copy of the runway attributes the UI displays."""
+
+    id: Any
+    mode: str
+    status: str
+    occupancy: str
+    currentOperation: Optional[str]
+    currentAircraft: Optional[AircraftSnapshot]
+    startTime: int
+    duration: int
+    occupiedUntil: int
+    length: int
+    bearing: int
+
+    @classmethod
+    def of(cls, runway: Any, aircraft: Optional[AircraftSnapshot] = None) -> "RunwaySnapshot":
+        """
+        Copy a runway, including the aircraft using it.
+
+        Parameters
+        ----------
+        runway : Runway
+            The runway to copy.
+        aircraft : AircraftSnapshot, optional
+            Copy of the aircraft using the runway. Made here if omitted.
+
+        Returns
+        -------
+        RunwaySnapshot
+            Its current state.
+        """
+        if aircraft is None and runway.currentAircraft is not None:
+            aircraft = AircraftSnapshot.of(runway.currentAircraft)
+        return cls(
+            id=runway.id,
+            mode=runway.mode,
+            status=runway.status,
+            occupancy=runway.occupancy,
+            currentOperation=runway.currentOperation,
+            currentAircraft=aircraft,
+            startTime=getattr(runway, "startTime", 0),
+            duration=getattr(runway, "duration", 1),
+            occupiedUntil=getattr(runway, "occupiedUntil", 0),
+            length=getattr(runway, "length", 0),
+            bearing=getattr(runway, "bearing", 0),
+        )
+
+    def getBearingString(self) -> str:
+        """Return the runway bearing as a two-digit string, as ``Runway.getBearingString``."""
+        return f"{self.bearing:02d}"
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Immutable view of the simulation after one tick or command.
+
+    Attributes
+    ----------
+    seq : int
+        Publication number; increases with every snapshot.
+    time : int
+        Simulation time in minutes.
+    holding, takeoff : Tuple[AircraftSnapshot, ...]
+        The holding and take-off queues (up to the worker's ``queue_limit``
+        aircraft each), in queue order.
+    holding_size, takeoff_size : int
+        Full lengths of the queues.
+    runways : Tuple[RunwaySnapshot, ...]
+        All runways, in airport order.
+    params : SimulationParams
+        The engine's parameters (already immutable).
+    speed : float
+        Simulation speed in ticks per real second.
+    is_paused : bool
+        Whether the engine is paused.
+    tick_at : float
+        ``time.monotonic()`` of the last tick, for interpolating progress bars.
+    fast_forward_to : float, optional
+        Target time of the fast-forward in progress (``math.inf`` when
+        running as fast as possible until stopped), or None at live speed.
+    on_runway : Mapping[str, RunwaySnapshot]
+        The runway each aircraft on a runway is using, by aircraft id.
+    changes : ChangeSet
+        What changed since the snapshot before it. If ``latest`` skipped
+        unread snapshots, their changes are included.
+    """
+
+    seq: int
+    time: int
+    holding: Tuple[AircraftSnapshot, ...]
+    takeoff: Tuple[AircraftSnapshot, ...]
+    holding_size: int
+    takeoff_size: int
+    runways: Tuple[RunwaySnapshot, ...]
+    params: Any
+    speed: float
+    is_paused: bool
+    tick_at: float
+    fast_forward_to: Optional[float] = None
+    on_runway: Mapping[str, RunwaySnapshot] = field(default_factory=lambda: MappingProxyType({}))
+    changes: ChangeSet = EMPTY
+
+    def fuel_remaining(self, plane: AircraftSnapshot) -> int:
+        """
+        Return the fuel of an aircraft at the end of the snapshot's tick.
+
+        Parameters
+        ----------
+        plane : AircraftSnapshot
+            An aircraft of this snapshot.
+
+        Returns
+        -------
+        int
+            Fuel remaining in minutes, as ``SimulationEngine.get_holding_queue`` reports it.
+        """
+        if plane.fuelOutAt is None:
+            return plane.fuelRemaining
+        return max(0, plane.fuelOutAt - self.time - int(getattr(self.params, "tick_size_min", 1)))
+
+
+class SimulationWorker:
+    """
+    Run a ``SimulationEngine`` on a background thread.
+
+    The worker ticks the engine at ``engine.speed_multiplier`` ticks per real
+    second and, after ticks and commands, publishes an immutable ``Snapshot``
+    through a single-slot queue: an unread snapshot is replaced by the newer
+    one, so a slow consumer only ever sees the latest state and never holds
+    the engine back. Snapshots are published at most every
+    ``publish_interval`` seconds while ticking.
+
+    The engine belongs to the worker thread once ``start`` is called. Other
+    threads change it only through ``submit`` or ``call``, which run a
+    function on the worker thread between two ticks.
+
+    ``fast_forward`` leaves live speed: the engine then runs ``run_for``
+    batches of ``batch_min`` simulated minutes back to back, still
+    publishing at most one snapshot per ``publish_interval`` and checking
+    for commands between batches, and returns to live speed at the target
+    time or on ``stop_fast_forward``.
+
+    The worker attaches a ``ChangeFeed`` to the engine's airport (unless it
+    already has one) and passes on what changed in ``Snapshot.changes``.
+    Copies of aircraft and runways that did not change are reused from the
+    previous snapshot, so an unchanged object keeps its identity from one
+    snapshot to the next and consumers can skip it with an ``is`` check.
+
+    Parameters
+    ----------
+    engine : SimulationEngine
+        The engine to run. Its ``is_paused`` flag pauses the worker.
+    queue_limit : int, optional
+        Aircraft of each queue copied into a snapshot. Default is 50; None
+        copies the whole queues.
+    publish_interval : float, optional
+        Shortest real time between two snapshots while ticking, in seconds.
+        Default is 1/60.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        queue_limit: Optional[int] = DEFAULT_QUEUE_LIMIT,
+        publish_interval: float = DEFAULT_PUBLISH_INTERVAL_S,
+    ) -> None:
+        if not hasattr(engine, "speed_multiplier"):
+            engine.speed_multiplier = 1.0
+        self.engine = engine
+        self.queue_limit = None if queue_limit is None else int(queue_limit)
+        self.publish_interval = float(publish_interval)
+        self.error: Optional[BaseException] = None
+
+        self._commands: "queue.Queue[Any]" = queue.Queue()
+        self._snapshots: "queue.Queue[Snapshot]" = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+        self._seq = 0
+        self._tick_at = time.monotonic()
+        self._next_tick = self._tick_at
+        self._published_at = 0.0
+        self._forward_to: Optional[float] = None
+        self._forward_batch = DEFAULT_BATCH_MIN
+        self._forward_future: Optional[Future] = None
+
+        airport = getattr(engine, "airport", None)
+        if airport is not None and getattr(airport, "changes", None) is None:
+            airport.changes = ChangeFeed()
+        self._feed: Optional[ChangeFeed] = getattr(airport, "changes", None)
+        # Copies made for the previous snapshot, by aircraft and runway object
+        self._aircraft_copies: Dict[Any, AircraftSnapshot] = {}
+        self._runway_copies: Dict[Any, RunwaySnapshot] = {}
+        self.snapshot = self._capture()
+
+    """
+    THREAD CONTROL
+    """
+    def start(self) -> "SimulationWorker":
+        """Start the worker thread. Returns the worker."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="simulation-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker thread after the command or tick in progress.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for the thread to finish. Waits indefinitely by default.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._commands.put(_STOP)
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        """Return whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    """
+    COMMANDS
+    """
+    def submit(self, fn: Callable[[Any], Any]) -> Future:
+        """
+        Run ``fn(engine)`` on the worker thread between two ticks.
+
+        A fresh snapshot is published once it has run. If the worker thread
+        is not running, or this is the worker thread, ``fn`` runs at once.
+
+        Parameters
+        ----------
+        fn : Callable[[SimulationEngine], Any]
+            The change to make.
+
+        Returns
+        -------
+        Future
+            Resolves to the return value of ``fn``, or its exception.
+        """
+        future: Future = Future()
+        if not self.is_alive() or threading.current_thread() is self._thread:
+            self._execute(fn, future)
+            self._publish()
+        else:
+            self._commands.put((fn, future))
+        return future
+
+    def call(self, fn: Callable[[Any], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run ``fn(engine)`` on the worker thread and wait for its result.
+
+        Parameters
+        ----------
+        fn : Callable[[SimulationEngine], Any]
+            The change to make.
+        timeout : float, optional
+            Seconds to wait. Waits indefinitely by default.
+
+        Returns
+        -------
+        Any
+            The return value of ``fn``; its exceptions are re-raised here.
+        """
+        return self.submit(fn).result(timeout)
+
+    def fast_forward(self, until: Optional[int] = None, batch_min: int = DEFAULT_BATCH_MIN) -> Future:
+        """
+        Run the engine as fast as possible, then drop back to live speed.
+
+        Parameters
+        ----------
+        until : int, optional
+            Simulation time to stop at. By default the worker runs until
+            ``stop_fast_forward`` is called.
+        batch_min : int, optional
+            Simulated minutes per ``run_for`` batch; commands wait at most
+            one batch. Default is 30.
+
+        Returns
+        -------
+        Future
+            Resolves to the simulation time when live speed resumes. A
+            fast-forward replaced by a new one resolves at once. If the
+            worker thread is not running, a fast-forward to ``until`` runs
+            to completion before this returns.
+        """
+        if batch_min < 1:
+            raise ValueError("batch_min must be >= 1.")
+        target = math.inf if until is None else int(until)
+        done: Future = Future()
+        done.set_running_or_notify_cancel()
+
+        def begin(engine: Any) -> None:
+            self._end_fast_forward()
+            self._forward_to = target
+            self._forward_batch = int(batch_min)
+            self._forward_future = done
+
+        self.submit(begin)
+        if not self.is_alive() and target != math.inf:
+            # No thread to run the batches: run them here
+            while not self.engine.is_paused and self.engine.get_time() < target:
+                self._run_batch()
+            if self.engine.get_time() >= target:
+                self._end_fast_forward()
+                self._publish()
+        return done
+
+    def stop_fast_forward(self) -> Future:
+        """
+        Return to live speed; no effect at live speed.
+
+        Returns
+        -------
+        Future
+            Resolves once the worker runs at live speed again.
+        """
+        return self.submit(lambda engine: self._end_fast_forward())
+
+    def _run_batch(self) -> None:
+        """Run one fast-forward batch, up to the target time."""
+        engine = self.engine
+        remaining = self._forward_to - engine.get_time()
+        if remaining > 0:
+            engine.run_for(int(min(self._forward_batch, remaining)))
+        self._tick_at = time.monotonic()
+
+    def _end_fast_forward(self) -> None:
+        """Leave fast-forward, resolve its future and restart live ticking from now."""
+        if self._forward_to is None:
+            return
+        self._forward_to = None
+        if self._forward_future is not None:
+            self._forward_future.set_result(self.engine.get_time())
+            self._forward_future = None
+        self._tick_at = time.monotonic()
+        self._next_tick = self._tick_at + self._interval()
+
+    def _execute(self, fn: Callable[[Any], Any], future: Future) -> None:
+        """Run one command and resolve its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(self.engine))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    """
+    SNAPSHOTS
+    """
+    def latest(self) -> Optional[Snapshot]:
+        """
+        Return the snapshot published since the last call, if any.
+
+        Returns
+        -------
+        Snapshot or None
+            The newest snapshot, or None if nothing was published since the
+            previous call. ``snapshot`` always holds the newest one.
+        """
+        try:
+            return self._snapshots.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _capture(self, unseen: Optional[ChangeSet] = None) -> Snapshot:
+        """
+        Copy the engine state into a new snapshot.
+
+        Only aircraft and runways the change feed reports as changed, or not
+        copied before, are copied again. Without a feed everything is copied.
+
+        Parameters
+        ----------
+        unseen : ChangeSet, optional
+            Changes of an unread snapshot this one replaces.
+        """
+        engine = self.engine
+        limit = self.queue_limit
+        fresh = self._feed.drain() if self._feed is not None else None
+        changes = fresh or EMPTY
+        if unseen is not None:
+            changes = unseen.then(changes)
+
+        old_aircraft, aircraft_copies = self._aircraft_copies, {}
+        old_runways, runway_copies = self._runway_copies, {}
+
+        def copy(aircraft, fuel_out_at=None):
+            snap = old_aircraft.get(aircraft)
+            if snap is None or fresh is None or aircraft.id in fresh.changed:
+                snap = AircraftSnapshot.of(aircraft, fuel_out_at)
+            aircraft_copies[aircraft] = snap
+            return snap
+
+        # Only the shown window of each queue is read, and nothing in the engine is written:
+        # holding copies keep their fuel-out time and Snapshot.fuel_remaining works out the fuel
+        airport = engine.airport
+        shown_holding = airport.holding.head(limit)
+        shown_takeoff = airport.takeoff.head(limit)
+
+        runways = []
+        on_runway = {}
+        for runway in engine.get_runways():
+            snap = old_runways.get(runway)
+            if snap is None or fresh is None or runway.id in fresh.runways:
+                aircraft = runway.currentAircraft
+                snap = RunwaySnapshot.of(runway, copy(aircraft) if aircraft is not None else None)
+            elif runway.currentAircraft is not None:
+                aircraft_copies[runway.currentAircraft] = snap.currentAircraft
+            runway_copies[runway] = snap
+            runways.append(snap)
+            if snap.currentAircraft is not None:
+                on_runway[snap.currentAircraft.id] = snap
+
+        self._aircraft_copies = aircraft_copies
+        self._runway_copies = runway_copies
+        self._seq += 1
+        return Snapshot(
+            seq=self._seq,
+            time=engine.get_time(),
+            holding=tuple(copy(a, fuel_out_at) for fuel_out_at, a in shown_holding),
+            takeoff=tuple(copy(a) for a in shown_takeoff),
+            holding_size=len(airport.holding),
+            takeoff_size=len(airport.takeoff),
+            runways=tuple(runways),
+            params=engine.params,
+            speed=float(engine.speed_multiplier),
+            is_paused=bool(engine.is_paused),
+            tick_at=self._tick_at,
+            fast_forward_to=self._forward_to,
+            on_runway=MappingProxyType(on_runway),
+            changes=changes,
+        )
+
+    def _publish(self) -> None:
+        """Replace the unread snapshot, if any, with the current state."""
+        # Only this thread puts, so the slot is free again after the get
+        try:
+            unread = self._snapshots.get_nowait()
+        except queue.Empty:
+            unread = None
+        snapshot = self._capture(unread.changes if unread is not None else None)
+        self.snapshot = snapshot
+        self._published_at = time.monotonic()
+        self._snapshots.put_nowait(snapshot)
+
+    """
+    MAIN LOOP
+    """
+    def _run(self) -> None:
+        """Tick the engine on schedule (or in batches) and run commands as they arrive."""
+        engine = self.engine
+        self._next_tick = time.monotonic()
+        try:
+            while True:
+                paused = engine.is_paused
+                forwarding = self._forward_to is not None
+                if paused:
+                    timeout = None
+                elif forwarding:
+                    timeout = 0.0
+                else:
+                    timeout = max(0.0, self._next_tick - time.monotonic())
+                try:
+                    command = self._commands.get(timeout=timeout)
+                except queue.Empty:
+                    command = None
+
+                if command is _STOP:
+                    return
+                if command is not None:
+                    self._execute(*command)
+                    if paused and not engine.is_paused:
+                        # Resuming: the first tick is one interval away, like any other
+                        self._tick_at = time.monotonic()
+                        self._next_tick = self._tick_at + self._interval()
+                    self._publish()
+                    continue
+                if paused:
+                    continue
+
+                if forwarding:
+                    self._run_batch()
+                    if engine.get_time() >= self._forward_to:
+                        self._end_fast_forward()
+                        self._publish()
+                        continue
+                else:
+                    engine.tick()
+                    self._tick_at = time.monotonic()
+                    self._next_tick = max(self._next_tick + self._interval(), self._tick_at - MAX_LAG_S)
+                now = time.monotonic()
+                if now - self._published_at >= self.publish_interval:
+                    self._publish()
+        except BaseException as exc:
+            self.error = exc
+            self._publish()
+        finally:
+            # Commands queued behind the stop (or the failure) still run
+            while True:
+                try:
+                    command = self._commands.get_nowait()
+                except queue.Empty:
+                    break
+                if command is not _STOP:
+                    self._execute(*command)
+            self._end_fast_forward()
+
+    def _interval(self) -> float:
+        """Real seconds between two ticks at the engine's speed."""
+        speed = float(getattr(self.engine, "speed_multiplier", 1.0))
+        return 1.0 / speed if speed > 0 else 1.0
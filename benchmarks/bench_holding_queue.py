@@ -0,0 +1,170 @@
+"""
+Microbenchmark: heapq-backed HoldingQueue against the PriorityQueue version.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_holding_queue
+"""
+from __future__ import annotations
+
+import random
+import timeit
+from queue import PriorityQueue
+
+from backend.SimulationParameters import SimulationParams
+from backend.queues import HoldingQueue
+
+PARAMS = SimulationParams(num_runways=1, inbound_rate_per_hour=30.0, outbound_rate_per_hour=30.0)
+
+
+class PriorityQueueHoldingQueue:
+    """The previous ``queue.PriorityQueue`` backed holding queue, kept for comparison.
+
+    Emergency promotion is a remove-and-reinsert: a new entry is pushed and
+    the old one is skipped when it surfaces. Fuel thresholds are found by
+    scanning every queued aircraft, as the engine did before the fuel heaps.
+    """
+
+    def __init__(self):
+        self.items = PriorityQueue()
+        self.arrival_order = 0
+        self._entries = {}
+        self._fuel_out = {}
+        self._alerted = set()
+
+    def enqueue(self, a, time):
+        entry = (0 if a.isEmergency() else 1, self.arrival_order, a)
+        self._entries[self.arrival_order] = entry
+        self._fuel_out[self.arrival_order] = time + a.fuelRemaining
+        self.items.put(entry)
+        self.arrival_order += 1
+        a.enteredHoldingAt = time
+
+    def dequeue(self):
+        while self._entries:
+            entry = self.items.get()
+            if self._entries.get(entry[1]) is entry:
+                del self._entries[entry[1]]
+                return entry[2]
+        return None
+
+    def peek(self):
+        if not self._entries:
+            return None
+        while self._entries.get(self.items.queue[0][1]) is not self.items.queue[0]:
+            self.items.get()
+        return self.items.queue[0][2]
+
+    def size(self):
+        return len(self._entries)
+
+    def promote(self, order):
+        entry = self._entries.get(order)
+        if entry is None or entry[0] == 0:
+            return
+        entry = (0, order, entry[2])
+        self._entries[order] = entry
+        self.items.put(entry)
+
+    def pop_fuel_alerts(self, cutoff):
+        due = [
+            (self._fuel_out[order], order, entry[2])
+            for order, entry in self._entries.items()
+            if order not in self._alerted and self._fuel_out[order] <= cutoff
+        ]
+        self._alerted.update(order for _, order, _ in due)
+        return due
+
+    def remove_fuel_out(self, cutoff):
+        due = [
+            (self._fuel_out[order], order, entry[2])
+            for order, entry in self._entries.items()
+            if self._fuel_out[order] <= cutoff
+        ]
+        for _, order, _ in due:
+            del self._entries[order]
+        return due
+
+
+class BenchAircraft:
+    def __init__(self, emergency: bool, fuel: int):
+        self.emergency = emergency
+        self.fuelRemaining = fuel
+        self.enteredHoldingAt = None
+        self.altitude = 0
+
+    def isEmergency(self) -> bool:
+        return self.emergency
+
+
+def make_aircraft(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [
+        BenchAircraft(rng.random() < 0.1, rng.randint(PARAMS.fuel_initial_min_min, PARAMS.fuel_initial_max_min))
+        for _ in range(n)
+    ]
+
+
+AIRCRAFT = make_aircraft(2000)
+
+
+def fill(queue_cls, n: int):
+    q = queue_cls()
+    for t, a in enumerate(AIRCRAFT[:n]):
+        q.enqueue(a, t)
+    return q
+
+
+def bench_enqueue_dequeue(queue_cls, n: int) -> None:
+    q = fill(queue_cls, n)
+    while q.dequeue() is not None:
+        pass
+
+
+def bench_peek_size(queue_cls, n: int) -> None:
+    q = fill(queue_cls, n)
+    for _ in range(n):
+        q.peek()
+        q.size()
+
+
+def bench_promote(queue_cls, n: int) -> None:
+    q = fill(queue_cls, n)
+    for order in random.Random(2).sample(range(n), n // 2):
+        q.promote(order)
+    while q.dequeue() is not None:
+        pass
+
+
+def bench_ticks(queue_cls, n: int) -> None:
+    """One arrival per tick, a landing every other tick and the engine's fuel checks."""
+    q = queue_cls()
+    for t, a in enumerate(AIRCRAFT[:n]):
+        q.enqueue(a, t)
+        horizon = t + 1
+        for _, order, _ in q.pop_fuel_alerts(horizon + PARAMS.fuel_emergency_min):
+            q.promote(order)
+        q.remove_fuel_out(horizon + PARAMS.fuel_min_min)
+        if t % 2:
+            q.dequeue()
+
+
+def main() -> None:
+    n = 2000
+    repeat = 20
+    cases = [
+        ("enqueue + dequeue", bench_enqueue_dequeue),
+        ("enqueue + peek/size", bench_peek_size),
+        ("enqueue + promote half + drain", bench_promote),
+        ("ticks with fuel checks", bench_ticks),
+    ]
+
+    print(f"{'case':<32}{'PriorityQueue':>16}{'heapq':>12}{'speedup':>10}")
+    for name, fn in cases:
+        old = min(timeit.repeat(lambda: fn(PriorityQueueHoldingQueue, n), number=1, repeat=repeat))
+        new = min(timeit.repeat(lambda: fn(HoldingQueue, n), number=1, repeat=repeat))
+        print(f"{name:<32}{old * 1e3:>13.2f} ms{new * 1e3:>9.2f} ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
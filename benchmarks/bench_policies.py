@@ -0,0 +1,64 @@
+"""
+Benchmark: runway assignment policies on mixed-runway airports.
+
+Reports movements (landings + takeoffs) per runway-hour, diversions,
+cancellations, average delays and run time per policy, averaged over seeds.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_policies
+"""
+from __future__ import annotations
+
+import time
+
+from backend.SimulationParameters import SimulationParams
+from backend.run import build_engine
+from backend.policies import POLICIES
+
+DURATION_MIN = 24 * 60
+SEEDS = range(5)
+
+SCENARIOS = [
+    # A runway handles roughly 15-30 movements/h: 2-4 minutes per operation by aircraft class, longer on short runways
+    ("2 MIXED, 16+16/h", SimulationParams(num_runways=2, inbound_rate_per_hour=16, outbound_rate_per_hour=16), None),
+    ("2 MIXED, 19+19/h", SimulationParams(num_runways=2, inbound_rate_per_hour=19, outbound_rate_per_hour=19), None),
+    ("2 MIXED, 22+22/h (overloaded)", SimulationParams(num_runways=2, inbound_rate_per_hour=22, outbound_rate_per_hour=22), None),
+    (
+        "1 LANDING + 2 MIXED, 30+25/h",
+        SimulationParams(num_runways=3, inbound_rate_per_hour=30, outbound_rate_per_hour=25),
+        ["LANDING", "MIXED", "MIXED"],
+    ),
+]
+
+
+def run(params: SimulationParams, runway_modes, policy: str):
+    totals = {"movements/rwy-h": 0.0, "diversions": 0.0, "cancellations": 0.0, "avgHoldingTime": 0.0, "avgTakeoffWait": 0.0}
+    started = time.perf_counter()
+    for seed in SEEDS:
+        engine = build_engine(params, seed=seed, runway_modes=runway_modes, event_driven=True, policy=policy)
+        engine.run_for(DURATION_MIN)
+        stats = engine.stats
+        report = stats.report()
+        movements = stats.holding_count + stats.takeoff_count
+        totals["movements/rwy-h"] += movements / (params.num_runways * DURATION_MIN / 60)
+        for key in ("diversions", "cancellations", "avgHoldingTime", "avgTakeoffWait"):
+            totals[key] += report[key]
+    elapsed = (time.perf_counter() - started) / len(SEEDS)
+    return {k: v / len(SEEDS) for k, v in totals.items()}, elapsed
+
+
+def main() -> None:
+    header = f"{'scenario':<34}{'policy':<12}{'mov/rwy-h':>10}{'divert':>8}{'cancel':>8}{'hold':>7}{'t/o wait':>9}{'s/run':>8}"
+    print(header)
+    for name, params, modes in SCENARIOS:
+        for policy in POLICIES:
+            m, elapsed = run(params, modes, policy)
+            print(
+                f"{name:<34}{policy:<12}{m['movements/rwy-h']:>10.2f}{m['diversions']:>8.1f}"
+                f"{m['cancellations']:>8.1f}{m['avgHoldingTime']:>7.1f}{m['avgTakeoffWait']:>9.1f}{elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,45 @@
 import tkinter as tk
 import time
 import itertools
+from collections import OrderedDict
 import os
 import sys
 from PIL import Image, ImageTk
-from tkinter import ttk
+from tkinter import ttk, simpledialog, messagebox
 from backend.SimulationParameters import SimulationParams
-from backend.report import read_last_report, DEFAULT_STATS_CSV_PATH, append_report_csv
+from backend.report import read_last_report, read_recent_reports, DEFAULT_STATS_CSV_PATH, append_report_csv
 from backend.statistics import Statistics
-from backend.queues import HoldingQueue, TakeOffQueue
+from backend import rng
 from backend.runway import Runway
+from backend.worker import SimulationWorker
+from frontend.virtual_list import VirtualList
+
+# Real time between two UI frames, in milliseconds
+FRAME_INTERVAL_MS = 33
+
+# Resized and rotated images kept ready to display, least recently used dropped first
+IMAGE_CACHE_SIZE = 32
+
+# Aircraft of each queue copied into every snapshot and listed; the queue titles show the full counts
+QUEUE_WINDOW = 100
+
+class QueueRows:
+    """
+        Rows of a queue list: the aircraft of the queue that are on a runway, then the queued window of a
+        snapshot. Rows are looked up by index, so nothing is copied when the list is handed a new snapshot.
+    """
+
+    def __init__(self, active, queued):
+        self.active = active
+        self.queued = queued
+
+    def __len__(self):
+        return len(self.active) + len(self.queued)
+
+    def __getitem__(self, index):
+        if index < len(self.active):
+            return self.active[index]
+        return self.queued[index - len(self.active)]
 
 def resource_path(relative_path):
     """Return absolute path to resource (works for dev and PyInstaller)."""
@@ -30,17 +60,17 @@ class AirportUI:
         screen_w = self.root.winfo_screenwidth()
         self.scale = 1.0 if screen_w >= 2000 else 0.75
 
-        # Image cache to prevent reloading files from disk every frame
-        self.image_cache = {} 
+        # Ready-to-display PhotoImages by (image name, rotation, size), least recently used first
+        self.image_cache = OrderedDict()
         # Stores original PIL images for rotation
         self.base_images = {} 
 
-        # Initialize loop identifiers and time tracking
+        # Initialize loop identifiers and pending runway changes (by runway id)
         self.sim_loop_id = None
         self.smooth_loop_id = None
-        self.last_tick_real_time = time.time()
         self.pending_runway_removals = []
         self.pending_status_changes = {}
+        self.flagged_runways = set()
         
         # Tracks whichever widget is currently highlighted
         # Format: {'type': 'plane'|'runway', 'id': str, 'widget': dict_ref}
@@ -54,9 +84,15 @@ class AirportUI:
         if not hasattr(self.engine, 'speed_multiplier'):
             self.engine.speed_multiplier = 1.0
 
-        # Dictionaries to store active widgets
-        self.holding_plane_widgets = {}
-        self.takeoff_plane_widgets = {}
+        # The engine runs on a worker thread from here on; the UI only reads its snapshots
+        # and changes the engine through self.worker.call
+        self.engine.is_paused = True
+        self.worker = SimulationWorker(self.engine, queue_limit=QUEUE_WINDOW).start()
+        self.snapshot = self.worker.snapshot
+
+        # Plane queue lists (built with the interface) and runway widgets
+        self.holding_list = None
+        self.takeoff_list = None
         self.runway_widgets = {}
 
         # Run initial setup functions
@@ -121,6 +157,13 @@ class AirportUI:
         self.root.geometry(f"{int(self.window_w)}x{int(self.window_h)}")
         self.root.configure(bg=self.dark_grey)
         self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self):
+        """Stop the simulation worker and close the window."""
+
+        self.worker.stop(timeout=1.0)
+        self.root.destroy()
 
     def setup_styles(self):
         """Function to configure custom styles for widgets."""
@@ -155,6 +198,8 @@ class AirportUI:
         self.root.bind("r", lambda x: self.reset_simulation())
         self.root.bind("X", lambda x: self.stop_simulation())
         self.root.bind("x", lambda x: self.stop_simulation())
+        self.root.bind("F", lambda x: self.fast_forward())
+        self.root.bind("f", lambda x: self.fast_forward())
 
     def stop_simulation(self):
         """Function to stop the simulation and save the final report"""
@@ -162,8 +207,7 @@ class AirportUI:
         self.toggle_pause(force_pause=True)
         try:
             # Capture the final state
-            self.last_saved_report = self.engine.get_report()
-            self.last_saved_time = self.engine.get_time()
+            self.last_saved_report, self.last_saved_time = self.worker.call(lambda e: (e.get_report(), e.get_time()))
             try:
                 # Append report to CSV
                 append_report_csv(self.last_saved_report or {}, int(self.last_saved_time or 0), DEFAULT_STATS_CSV_PATH)
@@ -267,23 +311,69 @@ class AirportUI:
 
         return scrollable_inner_frame
 
+    def create_queue_section(self, parent, x, y, w, h, name):
+        """
+            Create a titled section holding a virtualized plane list.
+            Only the plane widgets in view exist; they are reused as the list scrolls.
+
+            Parameters
+            ----------
+            parent : Frame
+                The parent frame the function is creating the section in
+            x, y : int
+                The x and y co-ordinates to place the new section in
+            w, h : int
+                The width and height of the new section
+            name : String
+                The text in the title of the section
+
+            Returns
+            -------
+            Tuple
+                The VirtualList of planes and the title label.
+        """
+
+        inner_frame = self.create_section(parent, x, y, w, h, name)
+        title_label = inner_frame.winfo_children()[0]
+        title_h = int(40 * self.scale)
+        inner_h = h - 8
+
+        canvas = tk.Canvas(inner_frame, bg=self.light_grey, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(inner_frame, orient="vertical")
+        canvas.place(x=0, y=title_h, relwidth=1, height=inner_h - title_h)
+        plane_list = VirtualList(
+            canvas, scrollbar, self.create_plane_widget, self.update_plane_widget, key=lambda plane: plane.callsign,
+            refresh_row=self.update_plane_status,
+            scrollbar_place={"relx": 1, "y": title_h, "anchor": "ne", "height": inner_h - title_h},
+        )
+
+        # Mouse wheel scrolling logic
+        def on_mousewheel(event):
+            plane_list.scroll(int(-1 * (event.delta / 120)))
+
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        return plane_list, title_label
+
     def build_interface(self):
         """Construct the main interface layout."""
 
         x_pos = self.margin_x
         # Create takeoff queue section
-        self.takeoff_queue_frame = self.create_section(self.root, x_pos, self.margin_y, self.col_w_standard, self.top_col_h, "Take-off Queue", scrollable=True)
-        self.takeoff_queue_title = self.takeoff_queue_frame.master.master.winfo_children()[0] # Stores the title label.
+        self.takeoff_list, self.takeoff_queue_title = self.create_queue_section(self.root, x_pos, self.margin_y, self.col_w_standard, self.top_col_h, "Take-off Queue")
 
         x_pos += self.col_w_standard + self.gap
         # Create holding queue section
-        self.holding_queue_frame = self.create_section(self.root, x_pos, self.margin_y, self.col_w_standard, self.top_col_h, "Holding Queue", scrollable=True)
-        self.holding_queue_title = self.holding_queue_frame.master.master.winfo_children()[0] 
+        self.holding_list, self.holding_queue_title = self.create_queue_section(self.root, x_pos, self.margin_y, self.col_w_standard, self.top_col_h, "Holding Queue")
 
         x_pos += self.col_w_standard + self.gap
         # Create visual display area
         self.display_area_frame = self.create_section(self.root, x_pos, self.margin_y, self.col_w_display, self.col_w_display, "Display", title=False)
 
+        # Display image, updated in place under the status overlay; display_image_key is the (image name, rotation, idle) it shows
+        self.display_image_label = tk.Label(self.display_area_frame, bd=0, bg=self.display_area_frame.cget("bg"))
+        self.display_image_key = None
+
         # Display Status Overlay
         self.display_status_label = tk.Label(self.display_area_frame, text="Nothing Selected", bg="#202020", fg="white", font=("Arial", int(12 * self.scale), "bold"), padx=10, pady=5)
         self.display_status_label.place(relx=0, rely=0, anchor="nw")
@@ -309,10 +399,11 @@ class AirportUI:
 
         # Add control buttons
         tk.Button(control_panel_frame, text="Pause/Continue [P]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.toggle_pause).grid(column=1, row=0, sticky="nsew", padx=5, pady=7)
-        tk.Button(control_panel_frame, text="Simulation Settings [S]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.open_simulation_settings).grid(column=2, row=0, sticky="nsew", padx=5, pady=7)
-        tk.Button(control_panel_frame, text="View Statistics [V]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.open_statistics).grid(column=3, row=0, sticky="nsew", padx=5, pady=7)
-        tk.Button(control_panel_frame, text="Reset Simulation [R]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.reset_simulation).grid(column=4, row=0, sticky="nsew", padx=5, pady=7)
-        tk.Button(control_panel_frame, text="Stop [X]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.stop_simulation).grid(column=5, row=0, sticky="nsew", padx=5, pady=7)
+        tk.Button(control_panel_frame, text="Fast Forward [F]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.fast_forward).grid(column=2, row=0, sticky="nsew", padx=5, pady=7)
+        tk.Button(control_panel_frame, text="Simulation Settings [S]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.open_simulation_settings).grid(column=3, row=0, sticky="nsew", padx=5, pady=7)
+        tk.Button(control_panel_frame, text="View Statistics [V]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.open_statistics).grid(column=4, row=0, sticky="nsew", padx=5, pady=7)
+        tk.Button(control_panel_frame, text="Reset Simulation [R]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.reset_simulation).grid(column=5, row=0, sticky="nsew", padx=5, pady=7)
+        tk.Button(control_panel_frame, text="Stop [X]", bg=self.lightest_grey, font=("Arial", int(12 * self.scale), "bold", "underline"), padx=5, relief="flat", command=self.stop_simulation).grid(column=6, row=0, sticky="nsew", padx=5, pady=7)
 
     def open_simulation_settings(self, event=None):
         """Open the settings window."""
@@ -369,9 +460,9 @@ class AirportUI:
             entries[label_text] = entry
 
         # Get current parameters or defaults
-        p = getattr(self.engine, 'params', None)
-        curr_runways = len(self.engine.airport.runways) if hasattr(self.engine, 'airport') else 3
-        curr_speed = getattr(self.engine, 'speed_multiplier', 1.0)
+        p = self.snapshot.params
+        curr_runways = len(self.snapshot.runways)
+        curr_speed = self.snapshot.speed
         settings_list = [
             ("Number Of Runways:", curr_runways),
             ("Inbound flow (per hour):", getattr(p, 'inbound_rate_per_hour', 10) if p else 10),
@@ -432,7 +523,7 @@ class AirportUI:
                     self.build_interface()
                     self.ui_built = True
 
-                self.update_ui()
+                self.update_ui(full=True)
                 self.settings_win.destroy()
                 self.root.deiconify()
                 self.root.lift()
@@ -556,7 +647,7 @@ class AirportUI:
             add_stat(8, "Total inbound diversions:", report_data.get("diversions", 0))
             add_stat(9, "Total outbound cancellations:", report_data.get("cancellations", 0))
 
-            if sim_time_min is None: sim_time_min = report_data.get("sim_time_min", self.engine.get_time())
+            if sim_time_min is None: sim_time_min = report_data.get("sim_time_min", self.snapshot.time)
             add_stat(10, "Total simulation time:", self.format_time(int(safe_num(sim_time_min, 0))))
 
             if isinstance(report_data, dict) and report_data.get("saved_at_utc"):
@@ -568,30 +659,18 @@ class AirportUI:
                 current_report = dict(read_last_report(DEFAULT_STATS_CSV_PATH) or {})
             except Exception:
                 current_report = dict(self.last_saved_report) if self.last_saved_report is not None else {}
-            current_time = current_report.get("sim_time_min", self.last_saved_time if self.last_saved_time is not None else self.engine.get_time())
+            current_time = current_report.get("sim_time_min", self.last_saved_time if self.last_saved_time is not None else self.snapshot.time)
         else:
-            current_report = self.engine.get_report()
-            current_time = self.engine.get_time()
+            current_report, current_time = self.worker.call(lambda e: (e.get_report(), e.get_time()))
 
         current_tab = tk.Frame(notebook, bg=self.lightest_grey)
         notebook.add(current_tab, text="Current")
         render_report(current_tab, current_report, current_time)
 
-        def read_all_reports_csv(path):
-            """Handle CSV reading for Previous Runs"""
-
-            import csv
-            rows = []
-            try:
-                with open(path, "r", newline="", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for r in reader: rows.append(dict(r))
-            except Exception: return []
-            return rows
-
-        previous_runs = read_all_reports_csv(DEFAULT_STATS_CSV_PATH)
-        if previous_runs and previous_runs[0].get("saved_at_utc"):
-            previous_runs.sort(key=lambda r: (r.get("saved_at_utc") or ""), reverse=True)
+        # Only the 12 most recent runs are shown, so only those are read (newest first)
+        try:
+            previous_runs = read_recent_reports(12, DEFAULT_STATS_CSV_PATH)
+        except Exception: previous_runs = []
 
         for idx, run in enumerate(previous_runs[:12], start=1):
             sim_t = int(safe_num(run.get("sim_time_min", 0), 0))
@@ -644,30 +723,40 @@ class AirportUI:
             p_mechanical_failure=(emerg_rate / 100.0) / 2, p_passenger_illness=(emerg_rate / 100.0) / 2,
             fuel_emergency_min=15, fuel_min_min=int(min_fuel)
         )
-        self.engine.speed_multiplier = speed_mult
-        self.engine.params = params
-        self.engine.stats.configure_from_params(params)
-        self.engine.regenerate_schedule(lookahead_window=15)
-
-        # Adjust runway count dynamically
-        current_runways = list(self.engine.airport.runways)
-        if num_runways > len(current_runways):
-            highest_id = max([r.id for r in current_runways]) if current_runways else 0
-            for i in range(num_runways - len(current_runways)):
-                highest_id += 1
-                current_runways.append(Runway(runway_id=highest_id, runway_mode="MIXED"))
-            self.engine.airport.runways = current_runways
-        elif num_runways < len(current_runways):
-            # Mark runways for closure if reducing count
-            for r in current_runways[num_runways:]:
-                if r not in self.pending_runway_removals:
-                    self.pending_runway_removals.append(r)
-                    r.status = "Closed"
-            self.engine.airport.runways = current_runways
+        pending = list(self.pending_runway_removals)
+
+        def configure(engine):
+            """Apply the parameters on the worker thread; returns the ids of runways to close."""
+
+            engine.speed_multiplier = speed_mult
+            engine.params = params
+            engine.stats.configure_from_params(params)
+            engine.regenerate_schedule(lookahead_window=15)
+
+            # Adjust runway count dynamically
+            current_runways = list(engine.airport.runways)
+            closing = []
+            if num_runways > len(current_runways):
+                highest_id = max([r.id for r in current_runways]) if current_runways else 0
+                for i in range(num_runways - len(current_runways)):
+                    highest_id += 1
+                    current_runways.append(Runway(runway_id=highest_id, runway_mode="MIXED", rng=rng.stream(engine.seed, rng.METADATA, "runway", highest_id)))
+                engine.airport.runways = current_runways
+            elif num_runways < len(current_runways):
+                # Mark runways for closure if reducing count
+                for r in current_runways[num_runways:]:
+                    if r.id not in pending:
+                        closing.append(r.id)
+                        r.status = "Closed"
+                engine.airport.runways = current_runways
+            return closing
+
+        self.pending_runway_removals.extend(self.worker.call(configure))
+        self.snapshot = self.worker.snapshot
 
         # Refresh UI if it is already built
         if getattr(self, "ui_built", False):
-            self.update_ui()
+            self.update_ui(full=True)
 
     def toggle_pause(self, force_pause=False, force_play=False):
         """
@@ -681,22 +770,56 @@ class AirportUI:
             force_play : bool
                 If true, plays the simulation.
         """
-        if force_pause: self.engine.is_paused = True
-        elif force_play: self.engine.is_paused = False
-        else: self.engine.is_paused = not self.engine.is_paused
-
-        if self.engine.is_paused:
-            if self.sim_loop_id:
-                self.root.after_cancel(self.sim_loop_id)
-                self.sim_loop_id = None
-            if self.smooth_loop_id:
-                self.root.after_cancel(self.smooth_loop_id)
-                self.smooth_loop_id = None
-        else:
-            self.last_tick_real_time = time.time()
+        def set_paused(engine):
+            """Set the pause flag on the worker thread and return it."""
+
+            if force_pause: engine.is_paused = True
+            elif force_play: engine.is_paused = False
+            else: engine.is_paused = not engine.is_paused
+            return engine.is_paused
+
+        paused = self.worker.call(set_paused)
+
+        # Both loops are restarted from scratch when playing, so never run twice
+        if self.sim_loop_id:
+            self.root.after_cancel(self.sim_loop_id)
+            self.sim_loop_id = None
+        if self.smooth_loop_id:
+            self.root.after_cancel(self.smooth_loop_id)
+            self.smooth_loop_id = None
+        if not paused:
             self.simulation_tick()
             self.smooth_update()
 
+    def fast_forward(self, event=None):
+        """
+            Skip ahead at maximum speed, or return to live speed if already skipping.
+            Asks how many simulated hours to skip; leaving it blank runs as fast as possible until pressed again.
+        """
+
+        if not getattr(self, "ui_built", False):
+            return
+        if self.snapshot.fast_forward_to is not None:
+            self.worker.stop_fast_forward()
+            return
+
+        answer = simpledialog.askstring("Fast Forward", "Simulated hours to skip\n(leave blank to run at maximum speed until stopped):", parent=self.root)
+        if answer is None:
+            return
+        until = None
+        if answer.strip():
+            try:
+                hours = float(answer)
+            except ValueError:
+                hours = 0
+            if not hours > 0:
+                messagebox.showerror("Fast Forward", "Invalid input: enter a number of hours above 0", parent=self.root)
+                return
+            until = self.snapshot.time + max(1, int(round(hours * 60)))
+
+        self.worker.fast_forward(until)
+        self.toggle_pause(force_play=True)
+
     def reset_simulation(self, open_settings=True):
         """
             Reset the simulation to initial state.
@@ -707,43 +830,39 @@ class AirportUI:
                 Defaults to true. If true, will open settings window upon reset.
         """
 
+        self.worker.stop_fast_forward()
         self.toggle_pause(force_pause=True)
-        self.engine.current_time = 0
-        
-        # Reset statistics
-        new_stats = Statistics()
-        new_stats.configure_from_params(self.engine.params)
-        self.engine.stats = new_stats
-        self.engine.airport.stats = new_stats
-        
-        # Reset queues and accumulators
-        self.engine.airport.holding = HoldingQueue()
-        self.engine.airport.takeoff = TakeOffQueue()
-        self.engine._pending_inbound.clear()
-        self.engine._pending_outbound.clear()
+
+        def reset(engine):
+            """Reset the engine on the worker thread."""
+
+            engine.current_time = 0
+
+            # Reset statistics
+            new_stats = Statistics()
+            new_stats.configure_from_params(engine.params)
+            engine.stats = new_stats
+            engine.airport.stats = new_stats
+
+            # Clear queues and runways, reporting the discarded aircraft to the UI
+            engine.airport.clearAircraft()
+
+            # Reset the schedule. Aircraft ids keep counting, so an id from
+            # before the reset never comes back for a different aircraft.
+            engine._pending_inbound.clear()
+            engine._pending_outbound.clear()
+            engine._inbound_acc = 0.0
+            engine._outbound_acc = 0.0
+            engine._prime_scheduler(lookahead_window=15)
+
+        self.worker.call(reset)
+        self.snapshot = self.worker.snapshot
         self.pending_status_changes.clear()
-        self.pending_runway_removals.clear()
-        self.engine._inbound_acc = 0.0
-        self.engine._outbound_acc = 0.0
-        self.engine._next_in_id = 1
-        self.engine._next_out_id = 1
-        self.engine._prime_scheduler(lookahead_window=15)
-
-        # Reset runways
-        for runway in self.engine.airport.runways:
-            runway.currentAircraft = None
-            runway.currentOperation = None
-            runway.status = "AVAILABLE"
-            runway.occupancy = "FREE"
-            runway.startTime = 0
-            runway.duration = 0
 
         # Clear UI elements
         self.pending_runway_removals.clear()
-        for w in list(self.holding_plane_widgets.values()): w["frame"].destroy()
-        self.holding_plane_widgets.clear()
-        for w in list(self.takeoff_plane_widgets.values()): w["frame"].destroy()
-        self.takeoff_plane_widgets.clear()
+        self.holding_list.set_items([])
+        self.takeoff_list.set_items([])
         for w in list(self.runway_widgets.values()): w["frame"].destroy()
         self.runway_widgets.clear()
 
@@ -751,7 +870,7 @@ class AirportUI:
         self.selection_data = None
         self.show_idle_display()
 
-        self.update_ui()
+        self.update_ui(full=True)
         if open_settings:
             self.open_simulation_settings()
         else:
@@ -765,87 +884,123 @@ class AirportUI:
         tk.Label(self.display_info_frame, text="Nothing Selected", bg=self.lightest_grey, fg=self.text_colour, font=("Arial", int(14 * self.scale), "bold")).place(relx=0, rely=0, relwidth=1, anchor="nw")
         
     def simulation_tick(self):
-        """Main simulation tick function"""
+        """Render the latest snapshot published by the simulation worker, once per frame."""
+
+        snapshot = self.worker.latest()
+        if snapshot is not None:
+            self.snapshot = snapshot
+            self.apply_pending_runway_changes()
+            self.update_ui()
+            self.refresh_selection()
 
-        if self.engine.is_paused: return
-        self.engine.tick()
-        self.last_tick_real_time = time.time()
+        self.sim_loop_id = self.root.after(FRAME_INTERVAL_MS, self.simulation_tick)
+
+    def apply_pending_runway_changes(self):
+        """Remove closing runways and apply status visuals once their runway is clear."""
 
         # Handle pending runway removals
-        for r in self.pending_runway_removals[:]:
-            if r.currentAircraft is None or r.occupancy == "FREE":
-                current_list = list(self.engine.airport.runways)
-                if r in current_list:
-                    current_list.remove(r)
-                    self.engine.airport.runways = current_list
-                self.pending_runway_removals.remove(r)
-        
+        for rid in self.pending_runway_removals[:]:
+            rw = self.find_runway(rid)
+            if rw is None or rw.currentAircraft is None or rw.occupancy == "FREE":
+                self.worker.submit(lambda e, rid=rid: setattr(e.airport, 'runways', [r for r in e.airport.runways if r.id != rid]))
+                self.pending_runway_removals.remove(rid)
+
         # Handle pending status changes
-        for r in list(self.pending_status_changes):
-            if r.currentAircraft is None:
-                next_status, wf, pc, pgs = self.pending_status_changes.pop(r)
-                r.status = next_status
+        for rid in list(self.pending_status_changes):
+            rw = self.find_runway(rid)
+            if rw is None or rw.currentAircraft is None:
+                next_status, wf, pc, pgs = self.pending_status_changes.pop(rid)
                 self.apply_status_visuals(next_status, wf, pc, pgs)
 
-        self.update_ui()
+    def refresh_selection(self):
+        """Update the display area if the selected plane or runway changed state."""
 
-        # Update Display Area if Selection Changes State
-        if self.selection_data:
-            sel_type = self.selection_data['type']
-            sel_id = self.selection_data['id']
-            should_reset = False
-            
-            if sel_type == 'plane':
-                # Find plane object
-                all_objs = self.engine.get_holding_queue() + self.engine.get_takeoff_queue()
-                for r in self.engine.get_runways():
-                    if r.currentAircraft: all_objs.append(r.currentAircraft)
-                
-                plane = next((p for p in all_objs if p.callsign == sel_id), None)
-                
-                if plane:
-                    # Plane still exists, refresh display
-                    self.show_aircraft_in_display(plane)
-                else:
-                    # Plane deleted/departed
-                    should_reset = True
-            
-            elif sel_type == 'runway':
-                # Find runway object
-                rw = next((r for r in self.engine.get_runways() if str(r.id) == str(sel_id)), None)
-                if rw:
-                    self.show_runway_in_display(rw)
-                else:
-                    should_reset = True
+        if not self.selection_data:
+            return
+        sel_type = self.selection_data['type']
+        sel_id = self.selection_data['id']
+        should_reset = False
+
+        if sel_type == 'plane':
+            plane = self.find_plane(sel_id)
+            if plane:
+                # Plane still exists, refresh display
+                self.show_aircraft_in_display(plane)
+            else:
+                # Plane deleted/departed
+                should_reset = True
+
+        elif sel_type == 'runway':
+            rw = self.find_runway(sel_id)
+            if rw:
+                self.show_runway_in_display(rw)
+            else:
+                should_reset = True
+
+        if should_reset:
+            self.selection_data = None
+            self.show_idle_display()
+            self.clear_info_panel()
+
+    def find_plane(self, callsign):
+        """
+            Find a plane in the current snapshot.
+
+            Parameters
+            ----------
+            callsign : String
+                Callsign of the plane.
+
+            Returns
+            -------
+            AircraftSnapshot or None
+                The plane, if it is still queued or on a runway.
+        """
+
+        all_objs = [r.currentAircraft for r in self.snapshot.runways if r.currentAircraft]
+        return next((p for p in itertools.chain(all_objs, self.snapshot.holding, self.snapshot.takeoff) if p.callsign == callsign), None)
+
+    def find_runway(self, runway_id):
+        """
+            Find a runway in the current snapshot.
+
+            Parameters
+            ----------
+            runway_id : int or String
+                Id of the runway.
+
+            Returns
+            -------
+            RunwaySnapshot or None
+                The runway, if it still exists.
+        """
+
+        return next((r for r in self.snapshot.runways if str(r.id) == str(runway_id)), None)
 
-            if should_reset:
-                self.selection_data = None
-                self.show_idle_display()
-                self.clear_info_panel()
+    def runway_of(self, plane):
+        """Return the runway snapshot the plane is using, or None if it is queued."""
 
-        speed = float(getattr(self.engine, 'speed_multiplier', 1.0))
-        interval = int(1000 / speed) if speed > 0 else 1000
-        self.sim_loop_id = self.root.after(interval, self.simulation_tick)
+        return self.snapshot.on_runway.get(plane.id)
 
     def smooth_update(self):
         """Smooth progress bar updates between ticks."""
 
-        if self.engine.is_paused: return
         try:
-            speed = float(getattr(self.engine, 'speed_multiplier', 1.0))
+            snapshot = self.snapshot
+            speed = snapshot.speed
             tick_duration_ms = 1000 / speed if speed > 0 else 1000
-            real_time_passed = (time.time() - self.last_tick_real_time) * 1000
+            real_time_passed = (time.monotonic() - snapshot.tick_at) * 1000
             tick_fraction = min(1.0, real_time_passed / tick_duration_ms)
             active_aircraft_data = {}
 
             # Update runway progress bars
-            for r in self.engine.get_runways():
+            for r in snapshot.runways:
                 if r.currentAircraft and r.occupancy == "OCCUPIED":
-                    active_aircraft_data[r.currentAircraft.callsign] = {"start": r.startTime, "duration": getattr(r, 'duration', 1)}
+                    active_aircraft_data[r.currentAircraft.callsign] = {"start": r.startTime, "duration": r.duration}
                     if r.id in self.runway_widgets:
                         w = self.runway_widgets[r.id]
-                        elapsed = self.engine.get_time() - r.startTime
-                        smooth_val = ((elapsed + tick_fraction) / max(getattr(r, 'duration', 1), 1)) * 100
+                        elapsed = snapshot.time - r.startTime
+                        smooth_val = ((elapsed + tick_fraction) / max(r.duration, 1)) * 100
                         if w["progress"]["value"] != smooth_val:
                             w["progress"]["value"] = min(100, smooth_val)
                 else:
@@ -853,10 +1008,10 @@ class AirportUI:
                         self.runway_widgets[r.id]["progress"]["value"] = 0
 
             # Update queue progress bars
-            for cs, widget in itertools.chain(self.holding_plane_widgets.items(), self.takeoff_plane_widgets.items()):
+            for cs, widget in itertools.chain(self.holding_list.rows_by_key.items(), self.takeoff_list.rows_by_key.items()):
                 if cs in active_aircraft_data:
                     data = active_aircraft_data[cs]
-                    elapsed = self.engine.get_time() - data["start"]
+                    elapsed = snapshot.time - data["start"]
                     smooth_val = ((elapsed + tick_fraction) / max(data["duration"], 1)) * 100
                     if widget["progress"]["value"] != smooth_val:
                         widget["progress"]["value"] = min(100, smooth_val)
@@ -867,21 +1022,37 @@ class AirportUI:
             pass 
         self.smooth_loop_id = self.root.after(16, self.smooth_update)
 
-    def update_ui(self):
-        """Refresh the entire UI state."""
+    def update_ui(self, full=False):
+        """
+            Refresh the UI from the current snapshot.
 
-        all_runways = self.engine.get_runways()
-        active_inbound = [r.currentAircraft for r in all_runways if r.currentAircraft and r.currentAircraft.type == "INBOUND"]
-        full_holding_list = active_inbound + self.engine.get_holding_queue()
-        active_outbound = [r.currentAircraft for r in all_runways if r.currentAircraft and r.currentAircraft.type == "OUTBOUND"]
-        full_takeoff_list = active_outbound + self.engine.get_takeoff_queue()
-        
-        self.update_plane_queue(full_holding_list[:50], self.holding_queue_frame, self.holding_plane_widgets)
-        self.update_plane_queue(full_takeoff_list[:50], self.takeoff_queue_frame, self.takeoff_plane_widgets)
-        self.update_runway_queue(all_runways, self.runway_queue_frame, self.runway_widgets)
-        self.clock_label.config(text=f"{self.format_time(self.engine.get_time())}")
-        self.takeoff_queue_title.config(text=f"Take-off Queue ({len(full_takeoff_list)})")
-        self.holding_queue_title.config(text=f"Holding Queue ({len(full_holding_list)})")
+            The queue lists are handed the snapshot's rows only when its change set says aircraft entered,
+            left or moved within the queues (or on a full refresh); otherwise only the time-dependent status
+            lines of the rows in view are redrawn.
+
+            Parameters
+            ----------
+            full : Bool
+                Defaults to false. If true, rebuilds the lists whatever the snapshot reports.
+        """
+
+        snapshot = self.snapshot
+        changes = snapshot.changes
+        if full or changes.added or changes.removed or changes.changed:
+            active = [r.currentAircraft for r in snapshot.on_runway.values()]
+            active_inbound = [p for p in active if p.type == "INBOUND"]
+            active_outbound = [p for p in active if p.type == "OUTBOUND"]
+            self.holding_list.set_items(QueueRows(active_inbound, snapshot.holding))
+            self.takeoff_list.set_items(QueueRows(active_outbound, snapshot.takeoff))
+            self.takeoff_queue_title.config(text=f"Take-off Queue ({len(active_outbound) + snapshot.takeoff_size})")
+            self.holding_queue_title.config(text=f"Holding Queue ({len(active_inbound) + snapshot.holding_size})")
+        else:
+            self.holding_list.refresh()
+            self.takeoff_list.refresh()
+
+        self.update_runway_queue(snapshot.runways, self.runway_queue_frame, self.runway_widgets, None if full else changes.runways)
+        forwarding = " >>" if snapshot.fast_forward_to is not None else ""
+        self.clock_label.config(text=f"{self.format_time(snapshot.time)}{forwarding}")
 
     def format_time(self, time_var):
         """
@@ -897,49 +1068,15 @@ class AirportUI:
         minutes = time_var % 60
         return f"{hours:02d}:{minutes:02d}"
 
-    def update_plane_queue(self, queue, frame, widget_dict):
-        """
-            Update widgets for plane queues
-
-            Parameters
-            ----------
-            queue : List
-                The holding queue/take off queue
-            frame : Frame
-                The frame the queue is being displayed in
-            widget_dict : Dictionary
-                The dictionary of widgets for this queue type.
-        """
-        
-        # Updates each plane widget in the queue
-        current_ids = set()
-        for plane in queue:
-            pid = plane.callsign
-            current_ids.add(pid)
-            if pid not in widget_dict:
-                widget_dict[pid] = self.create_plane_widget(frame, plane)
-            self.update_plane_widget(widget_dict[pid], plane)
-
-        # Safe deletion by iterating over copy of keys
-        for pid in list(widget_dict.keys()):
-            if pid not in current_ids:
-                if self.selection_data and self.selection_data['id'] == pid:
-                    self.selection_data = None
-                    self.show_idle_display()
-                    self.clear_info_panel()
-                widget_dict[pid]["frame"].destroy()
-                del widget_dict[pid]
-
-    def create_plane_widget(self, queue_column, plane):
+    def create_plane_widget(self, queue_column):
         """
-            Create a new widget representing a plane
+            Create a new (empty) widget representing a plane. The queue list positions it and
+            reuses it for whichever plane scrolls into its row; update_plane_widget fills it in.
 
             Parameters
             ----------
-            queue_column : Frame
-                The column frame (holding queue/take off queue) that the widget will be put in
-            plane : Aircraft
-                The plane object being displayed as a widget
+            queue_column : Canvas
+                The canvas of the queue list (holding queue/take off queue) that the widget will be put in
 
             Returns
             -------
@@ -949,7 +1086,6 @@ class AirportUI:
 
         # Creates and configues the frame for the widget.
         widget_frame = tk.Frame(queue_column, bg=self.lightest_grey, padx=5, pady=5, cursor="hand2")
-        widget_frame.pack(fill="x", pady=4, padx=(4, 22))
         widget_frame.columnconfigure(0, weight=1)
         widget_frame.columnconfigure(1, weight=1)
 
@@ -975,14 +1111,16 @@ class AirportUI:
         progress = ttk.Progressbar(pc, orient="horizontal", mode="determinate")
         progress.pack(fill="both", expand=True)
 
-        widget_ref = { "frame": widget_frame, "tl": tl, "tr": tr, "ml": ml, "bl": bl, "br": br, "progress": progress }
+        widget_ref = { "frame": widget_frame, "tl": tl, "tr": tr, "ml": ml, "bl": bl, "br": br, "progress": progress, "callsign": None, "selected": False, "plane": None, "status": None }
         
         def on_click(e):
-            """Click hander for selection."""
+            """Click hander for selection of whichever plane the widget currently shows."""
 
-            self.select_widget(widget_ref, 'plane', plane.callsign)
-            self.show_airplane_info(plane)
-            self.show_aircraft_in_display(plane)
+            current = self.find_plane(widget_ref["callsign"])
+            if current is None: return
+            self.select_widget(widget_ref, 'plane', current.callsign)
+            self.show_airplane_info(current)
+            self.show_aircraft_in_display(current)
 
         widget_frame.bind("<Button-1>", on_click)
         for lbl in (tl, tr, ml, mr, bl, br): lbl.bind("<Button-1>", on_click)
@@ -997,26 +1135,55 @@ class AirportUI:
             ----------
             widget : Frame
                 The widget being updated
-            plane : Aircraft
-                The plane object who's information is going to be shown in the widget.
+            plane : AircraftSnapshot
+                The plane who's information is going to be shown in the widget.
         """
 
-        # Emergency output (if there is an emergency)
-        emerg = ""
-        if hasattr(plane, 'emergency') and plane.emergency:
-            if plane.emergency.mechanical_failure: emerg = "Mechanical Failure"
-            elif plane.emergency.passenger_illness: emerg = "Passenger Illness"
-            elif plane.emergency.fuel_emergency: emerg = "Fuel Emergency"
-
-        # Other aircraft attribute outputs
-        if widget["tl"].cget("text") != plane.callsign: widget["tl"].config(text=plane.callsign)
-        if widget["tr"].cget("text") != emerg: widget["tr"].config(text=emerg)
-        if widget["ml"].cget("text") != getattr(plane, 'operator', 'Unknown'): widget["ml"].config(text=getattr(plane, 'operator', 'Unknown'))
-        
-        sched = "Scheduled " + self.format_time(getattr(plane, 'scheduledTime', 0))
-        if widget["br"].cget("text") != sched: widget["br"].config(text=sched)
+        # The widget may have shown another plane before; keep the selection highlight on the selected plane
+        widget["callsign"] = plane.callsign
+        selected = bool(self.selection_data) and self.selection_data['type'] == 'plane' and self.selection_data['id'] == plane.callsign
+        if widget["selected"] != selected:
+            widget["selected"] = selected
+            self.update_widget_colours(widget["frame"], "#c8c6c6" if selected else self.lightest_grey)
+
+        # The worker reuses the snapshot of a plane that did not change, so the fixed fields only need
+        # filling in when the row shows a different plane or the plane changed
+        if widget["plane"] is not plane:
+            widget["plane"] = plane
+
+            # Emergency output (if there is an emergency)
+            emerg = ""
+            if hasattr(plane, 'emergency') and plane.emergency:
+                if plane.emergency.mechanical_failure: emerg = "Mechanical Failure"
+                elif plane.emergency.passenger_illness: emerg = "Passenger Illness"
+                elif plane.emergency.fuel_emergency: emerg = "Fuel Emergency"
+
+            # Other aircraft attribute outputs
+            widget["tl"].config(text=plane.callsign)
+            widget["tr"].config(text=emerg)
+            widget["ml"].config(text=getattr(plane, 'operator', 'Unknown'))
+            widget["br"].config(text="Scheduled " + self.format_time(getattr(plane, 'scheduledTime', 0)))
+
+            # Colours progress bars depending on inbout/outbound
+            style = "Orange.Horizontal.TProgressbar" if plane.type == "INBOUND" else "Green.Horizontal.TProgressbar"
+            widget["progress"].config(style=style)
+
+        self.update_plane_status(widget, plane)
+
+    def update_plane_status(self, widget, plane):
+        """
+            Update the status line of a plane widget, which follows the simulation time.
 
-        active_runway = next((r for r in self.engine.get_runways() if r.currentAircraft == plane), None)
+            Parameters
+            ----------
+            widget : Frame
+                The widget being updated
+            plane : AircraftSnapshot
+                The plane the widget shows.
+        """
+
+        # Worked out every time but only redrawn when it changes
+        active_runway = self.runway_of(plane)
         status_text = ""
         status_colour = self.text_colour
 
@@ -1024,29 +1191,30 @@ class AirportUI:
             action = "Landing" if plane.type == "INBOUND" else "Taking Off"
             status_text = f"{action} - Runway {active_runway.id}"
         else:
-            current_time = self.engine.get_time()
+            current_time = self.snapshot.time
             if plane.type == "INBOUND":
-                fuel = getattr(plane, 'fuelRemaining', 0)
+                fuel = self.snapshot.fuel_remaining(plane)
                 status_text = f"Fuel remaining: {fuel}min"
-                if fuel <= (getattr(self.engine.params, 'fuel_min_min', 10) + 5):
+                if fuel <= (getattr(self.snapshot.params, 'fuel_min_min', 10) + 5):
                     status_colour = self.emergency_text_colour
             else:
                 wait_time = int(current_time - (plane.joinedTakeoffQueueAt if hasattr(plane, 'joinedTakeoffQueueAt') else getattr(plane, 'scheduledTime', 0)))
                 status_text = f"Waiting for {wait_time}min"
-                if wait_time >= (getattr(self.engine.params, 'max_takeoff_wait_min', 30) - 5):
+                if wait_time >= (getattr(self.snapshot.params, 'max_takeoff_wait_min', 30) - 5):
                     status_colour = self.emergency_text_colour
 
-        if widget["bl"].cget("text") != status_text: widget["bl"].config(text=status_text)
-        if widget["bl"].cget("fg") != status_colour: widget["bl"].config(fg=status_colour)
-
-        # Colours progress bars depending on inbout/outbound
-        style = "Orange.Horizontal.TProgressbar" if plane.type == "INBOUND" else "Green.Horizontal.TProgressbar"
-        if widget["progress"].cget("style") != style: widget["progress"].config(style=style)
+        status = (status_text, status_colour)
+        if widget["status"] != status:
+            widget["status"] = status
+            widget["bl"].config(text=status_text, fg=status_colour)
 
-    def update_runway_queue(self, rw_list, frame, widget_dict):
+    def update_runway_queue(self, rw_list, frame, widget_dict, changed=None):
         """
             Update widgets for runway list.
 
+            Only the runways in changed are redrawn, along with those whose closing or clearing flag was set or
+            lifted since the last update.
+
             Parameters
             ----------
             list : List
@@ -1055,20 +1223,28 @@ class AirportUI:
                 The frame holding the runways
             widget_dict : Dictionary
                 The dictionary of runway widget
+            changed : Iterable
+                Defaults to None. Ids of the runways that changed; if None, every runway is redrawn.
         """
 
-        # Updates the runway widgets for each runway in the list.
-        current_ids = set()
+        flagged = set(self.pending_runway_removals) | set(self.pending_status_changes)
+        if changed is None: dirty = {rw.id for rw in rw_list} | set(widget_dict)
+        else: dirty = set(changed) | (flagged ^ self.flagged_runways)
+        self.flagged_runways = flagged
+        if not dirty: return
+
+        # Updates the widgets of the dirty runways, creating new ones in runway order
         for rw in rw_list:
             rid = rw.id
-            current_ids.add(rid)
+            if rid not in dirty: continue
+            dirty.discard(rid)
             if rid not in widget_dict:
                 widget_dict[rid] = self.create_runway_widget(frame, rw)
             self.update_runway_widget(widget_dict[rid], rw)
-        
-        # Runway widget deletion if not needed
-        for rid in list(widget_dict.keys()):
-            if rid not in current_ids:
+
+        # Runway widget deletion if not needed (what is left was removed from the list)
+        for rid in dirty:
+            if rid in widget_dict:
                 widget_dict[rid]["frame"].destroy()
                 if self.selection_data and self.selection_data['id'] == rid:
                     self.selection_data = None
@@ -1083,8 +1259,8 @@ class AirportUI:
             ----------
             queue_col : Frame
                 The runway frame the widget will be put in
-            rw : Runway
-                The runway object being displayed as a widget
+            rw : RunwaySnapshot
+                The runway being displayed as a widget
 
             Returns
             -------
@@ -1110,17 +1286,14 @@ class AirportUI:
         # Create button images
         btn_size = int(20 * self.scale)
 
-        cycle_img = self.base_images["cycle_icon.png"].resize((btn_size, btn_size), Image.BICUBIC)
-        cycle_photo = ImageTk.PhotoImage(cycle_img)
-
-        warning_img = self.base_images["warning_icon.png"].resize((btn_size, btn_size), Image.BICUBIC)
-        warning_photo = ImageTk.PhotoImage(warning_img)
+        cycle_photo = self.photo_image("cycle_icon.png", btn_size)
+        warning_photo = self.photo_image("warning_icon.png", btn_size)
 
-        mode_btn = tk.Button(bf, image=cycle_photo, bg=self.lightest_grey, padx=5, relief="solid", command=lambda: self.cycle_runway_mode(rw))
+        mode_btn = tk.Button(bf, image=cycle_photo, bg=self.lightest_grey, padx=5, relief="solid", command=lambda: self.cycle_runway_mode(self.find_runway(rw.id) or rw))
         mode_btn.image = cycle_photo 
         mode_btn.pack(side="right", padx=(2, 0))
 
-        status_btn = tk.Button(bf, image=warning_photo, bg=self.lightest_grey, padx=5, relief="solid", command=lambda r=rw, wf=widget_frame, c=pc: self.cycle_runway_status(r, wf, c, pg_settings))
+        status_btn = tk.Button(bf, image=warning_photo, bg=self.lightest_grey, padx=5, relief="solid", command=lambda wf=widget_frame, c=pc: self.cycle_runway_status(self.find_runway(rw.id) or rw, wf, c, pg_settings))
         status_btn.image = warning_photo
         status_btn.pack(side="right", padx=(0, 2))
 
@@ -1137,10 +1310,11 @@ class AirportUI:
         def on_click(e):
             """Click hander for selection."""
 
-            if rw.status == "AVAILABLE":
-                self.select_widget(widget_ref, 'runway', rw.id)
-            self.show_runway_info(rw)
-            self.show_runway_in_display(rw)
+            current = self.find_runway(rw.id) or rw
+            if current.status == "AVAILABLE":
+                self.select_widget(widget_ref, 'runway', current.id)
+            self.show_runway_info(current)
+            self.show_runway_in_display(current)
 
         widget_frame.bind("<Button-1>", on_click)
         for lbl in (tl, bl, br): lbl.bind("<Button-1>", on_click)
@@ -1154,13 +1328,13 @@ class AirportUI:
             ----------
             widget : Frame
                 The frame of the widget being updated
-            rw : Runway
+            rw : RunwaySnapshot
                 The runway whose attributes are being used to update the widget.
         """
 
         title = f"Runway {rw.id} - " + ("Landing Only" if rw.mode == "LANDING" else "Take Off Only" if rw.mode == "TAKEOFF" else "Mixed Use")
-        if rw in self.pending_runway_removals: title += " (CLOSING)"
-        if self.pending_status_changes.get(rw): title += " (Clearing)"
+        if rw.id in self.pending_runway_removals: title += " (CLOSING)"
+        if self.pending_status_changes.get(rw.id): title += " (Clearing)"
 
         if rw.currentAircraft is None: airplane_txt = "Not currently in use"
         else:
@@ -1180,14 +1354,39 @@ class AirportUI:
 
             Parameters
             ----------
-            rw : Runway
-                The runway object whose runway mode is being updated.
+            rw : RunwaySnapshot
+                The runway whose runway mode is being updated.
         """
 
-        if rw in self.pending_runway_removals: return
-        rw.mode = "MIXED" if rw.mode == "LANDING" else "TAKEOFF" if rw.mode == "MIXED" else "LANDING"
+        if rw.id in self.pending_runway_removals: return
+        next_mode = "MIXED" if rw.mode == "LANDING" else "TAKEOFF" if rw.mode == "MIXED" else "LANDING"
+        self.set_runway_attribute(rw.id, "mode", next_mode)
         self.update_ui()
 
+    def set_runway_attribute(self, runway_id, name, value):
+        """
+            Set an attribute of an engine runway on the worker thread, then take a fresh snapshot.
+
+            Parameters
+            ----------
+            runway_id : int
+                Id of the runway being changed.
+            name : String
+                Attribute name ('mode' or 'status').
+            value : String
+                The new value.
+        """
+
+        def apply(engine):
+            """Change the runway on the worker thread."""
+
+            for r in engine.airport.runways:
+                if r.id == runway_id:
+                    setattr(r, name, value)
+
+        self.worker.call(apply)
+        self.snapshot = self.worker.snapshot
+
     def update_widget_colours(self, widget, colour):
         """Recursively update background colours for a widget tree"""
 
@@ -1228,8 +1427,8 @@ class AirportUI:
 
             Parameters
             ----------
-            rw : Runway
-                The runway object who's status is being changed
+            rw : RunwaySnapshot
+                The runway who's status is being changed
             wf : Frame
                 The frame of the widget being changed.
             pc : Frame
@@ -1238,21 +1437,89 @@ class AirportUI:
                 Progress bar settings.
         """
 
-        if rw in self.pending_runway_removals: return
+        if rw.id in self.pending_runway_removals: return
         status_order = ["AVAILABLE", "Closed"]
-        pending = self.pending_status_changes.get(rw)
+        pending = self.pending_status_changes.get(rw.id)
         current = pending[0] if pending else rw.status
         next_status = status_order[(status_order.index(current) + 1) % len(status_order)]
 
+        self.set_runway_attribute(rw.id, "status", next_status)
         if rw.currentAircraft is None:
-            rw.status = next_status
-            self.pending_status_changes.pop(rw, None)
+            self.pending_status_changes.pop(rw.id, None)
             self.apply_status_visuals(next_status, wf, pc, pgs)
         else:
-            rw.status = next_status
-            self.pending_status_changes[rw] = (next_status, wf, pc, pgs)
+            self.pending_status_changes[rw.id] = (next_status, wf, pc, pgs)
         self.update_ui()
 
+    def photo_image(self, image_name, size, rotation=0):
+        """
+            Return a loaded image rotated and resized for display, creating it only if it is not cached.
+
+            Parameters
+            ----------
+            image_name : String
+                The name of the image in base_images
+            size : int
+                The width and height of the image in pixels.
+            rotation : int
+                The degree of rotation.
+
+            Returns
+            -------
+            PhotoImage
+                The image, ready to be shown in a label.
+        """
+
+        key = (image_name, rotation, size)
+        photo = self.image_cache.get(key)
+        if photo is not None:
+            self.image_cache.move_to_end(key)
+            return photo
+
+        img = self.base_images[image_name]
+        if rotation != 0:
+            img = img.rotate(rotation, expand=False)
+        photo = ImageTk.PhotoImage(img.resize((size, size), resample=Image.BICUBIC))
+
+        # Labels keep their own reference to an image, so one dropped from the cache stays valid while shown
+        self.image_cache[key] = photo
+        if len(self.image_cache) > IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+        return photo
+
+    def show_display_image(self, image_name, rotation=0, idle=False):
+        """
+            Show an image in the display area, reusing the display label.
+
+            Parameters
+            ----------
+            image_name : String
+                The name of the image to be displayed
+            rotation : int
+                The degree of rotation.
+            idle : bool
+                Whether this is the idle image, which sits at the top of the display area on a grey background.
+        """
+
+        key = (image_name, rotation, idle)
+        if key == self.display_image_key:
+            return
+
+        photo = self.photo_image(image_name, int(self.col_w_display * 1.4), rotation)
+        lbl = self.display_image_label
+        lbl.config(image=photo, bg=self.light_grey if idle else self.display_area_frame.cget("bg"))
+        lbl.image = photo # Keep ref
+
+        # Only move the label when switching between the idle and the selection layout
+        if self.display_image_key is None or self.display_image_key[2] != idle:
+            if idle:
+                lbl.place_forget()
+                lbl.pack(expand=False)
+            else:
+                lbl.pack_forget()
+                lbl.place(relx=0.5, rely=0.5, anchor="center")
+        self.display_image_key = key
+
     def render_display_image(self, image_name, rotation=0, status_text=""):
         """
             Render an image to the display area with rotation and status text.
@@ -1268,25 +1535,8 @@ class AirportUI:
         """
         # Use Cached Images
         if image_name in self.base_images:
-            img = self.base_images[image_name]
-            if rotation != 0:
-                img = img.rotate(rotation, expand=False)
-            
-            # Resize
-            size = int(self.col_w_display * 1.4)
-            img = img.resize((size, size), resample=Image.BICUBIC)
-            photo = ImageTk.PhotoImage(img)
-
-            # Update display frame
-            for w in self.display_area_frame.winfo_children():
-                # Don't delete the status label
-                if w != self.display_status_label:
-                    w.destroy()
-
-            lbl = tk.Label(self.display_area_frame, image=photo, bg=self.display_area_frame.cget("bg"))
-            lbl.image = photo # Keep ref
-            lbl.place(relx=0.5, rely=0.5, anchor="center")
-            
+            self.show_display_image(image_name, rotation)
+
             # Update Status Label text
             try:
                 self.display_status_label.config(text=status_text)
@@ -1306,11 +1556,11 @@ class AirportUI:
 
             Parameters
             ----------
-            plane : Aircraft
-                The aircraft object the image is being generated about.
+            plane : AircraftSnapshot
+                The aircraft the image is being generated about.
         """
 
-        assigned_runway = next((r for r in self.engine.get_runways() if r.currentAircraft == plane), None)
+        assigned_runway = self.runway_of(plane)
         status_text = ""
         
         if assigned_runway:
@@ -1323,14 +1573,14 @@ class AirportUI:
             # If the plane is in queue, determine if it is on sky or ground
             if plane.type == "OUTBOUND":
                 # Waiting on ground
-                current_time = self.engine.get_time()
+                current_time = self.snapshot.time
                 wait_time = int(current_time - (plane.joinedTakeoffQueueAt if hasattr(plane, 'joinedTakeoffQueueAt') else getattr(plane, 'scheduledTime', 0)))
                 status_text = f"Flight {plane.callsign} - Waiting for {wait_time}min"
                 # Use new image for ground queue
                 self.render_display_image("display_plane_waiting.png", rotation=0, status_text=status_text)
             else:
                 # Holding in sky
-                fuel = getattr(plane, 'fuelRemaining', 0)
+                fuel = self.snapshot.fuel_remaining(plane)
                 status_text = f"Flight {plane.callsign} - Holding (Fuel: {fuel}m)"
                 self.render_display_image("display_plane.png", rotation=0, status_text=status_text)
 
@@ -1360,18 +1610,12 @@ class AirportUI:
     def show_idle_display(self):
         """Show the default idle screen when nothing is selected"""
 
-        # Clear everything except the status label
-        for w in self.display_area_frame.winfo_children():
-            if w != self.display_status_label:
-                w.destroy()
-
         if "idle_icon.png" in self.base_images:
-            img = self.base_images["idle_icon.png"]
-            img = img.resize((int(self.col_w_display * 1.4), int(self.col_w_display * 1.4)), Image.BICUBIC)
-            photo = ImageTk.PhotoImage(img)
-            lbl = tk.Label(self.display_area_frame, image=photo, bg=self.light_grey)
-            lbl.image = photo 
-            lbl.pack(expand=False)
+            self.show_display_image("idle_icon.png", idle=True)
+        else:
+            self.display_image_label.pack_forget()
+            self.display_image_label.place_forget()
+            self.display_image_key = None
             
         # Reset the status label text since we are idle
         self.display_status_label.config(text="Nothing Selected")
@@ -1416,7 +1660,7 @@ class AirportUI:
         add(0, "Operator:", getattr(airplane, 'operator', 'N/A'))
         add(1, "Origin:", getattr(airplane, 'origin', 'N/A'))
         add(2, "Destination:", getattr(airplane, 'destination', 'N/A'))
-        add(3, "Fuel Level:", getattr(airplane, 'fuelRemaining', 'N/A'))
+        add(3, "Fuel Level:", self.snapshot.fuel_remaining(airplane))
         add(4, "Altitude:", getattr(airplane, 'altitude', 'N/A'))
         add(5, "Ground Speed:", getattr(airplane, 'ground_speed', 'N/A'))
         add(6, "Scheduled:", self.format_time(getattr(airplane, 'scheduledTime', 0)))
@@ -1477,10 +1721,12 @@ class AirportUI:
         if self.selection_data:
             try:
                 self.update_widget_colours(self.selection_data["widget"]["frame"], self.lightest_grey)
+                self.selection_data["widget"]["selected"] = False
             except tk.TclError:
                 pass
         self.selection_data = {'type': type_str, 'id': id_str, 'widget': widget}
         self.update_widget_colours(widget["frame"], "#c8c6c6")
+        widget["selected"] = True
 
 def create_ui(engine):
     """Entry point to launch the UI."""
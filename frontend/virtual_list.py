@@ -0,0 +1,178 @@
+class VirtualList:
+    """
+        Scrollable list that only builds widgets for the rows in view.
+
+        Every row has the same height. The canvas scroll region covers all items, but only enough
+        row widgets to fill the visible part of the canvas are ever created; as the view scrolls,
+        the same widgets are moved and refilled with the items that came into view. Rendering
+        costs O(visible rows) however many items the list holds.
+    """
+
+    def __init__(self, canvas, scrollbar, create_row, update_row, key, refresh_row=None, scrollbar_place=None, pad_x=(4, 22), pad_y=4):
+        """
+            Parameters
+            ----------
+            canvas : Canvas
+                The canvas the rows are drawn on.
+            scrollbar : Scrollbar
+                The vertical scrollbar of the canvas. It is only shown when the items do not fit.
+            create_row : function
+                Called with the canvas; returns a dictionary of widgets for one row, with its frame under "frame".
+            update_row : function
+                Called with a row dictionary and an item to show that item in the row.
+            key : function
+                Returns the key of an item (e.g. a callsign), used for rows_by_key.
+            refresh_row : function
+                Called with a row dictionary and the item it shows by refresh, to redraw what changes
+                with time alone. Defaults to update_row.
+            scrollbar_place : Dictionary
+                Options for scrollbar.place when the scrollbar is shown. Defaults to the right edge of its parent.
+            pad_x : tuple
+                Left and right padding of the rows.
+            pad_y : int
+                Vertical padding above and below each row.
+        """
+
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.create_row = create_row
+        self.update_row = update_row
+        self.key = key
+        self.refresh_row = refresh_row or update_row
+        self.pad_x = pad_x
+        self.pad_y = pad_y
+        self.scrollbar_place = scrollbar_place or {"relx": 1, "rely": 0, "anchor": "ne", "relheight": 1}
+
+        self.items = ()
+        self.row_height = None
+        self.rows_by_key = {} # Key of each item in view -> its row
+        self._in_view = [] # (row, item) of each item in view
+        self._rows = [] # Pool of [canvas window id, row dictionary, y position or None if hidden]
+        self._width = 1
+        self._scrollbar_shown = False
+
+        self.scrollbar.configure(command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    def set_items(self, items):
+        """
+            Replace the items and redraw the rows in view.
+
+            Parameters
+            ----------
+            items : Sequence
+                All items of the list, in display order. Only its length and the items in view are
+                read (len and indexing), so it need not be a list built for the purpose.
+        """
+
+        self.items = items
+        if self.row_height is None and items:
+            self._measure()
+        self._update_scroll_region()
+        self.render()
+
+    def refresh(self):
+        """Redraw the rows in view with refresh_row, keeping the items and their positions."""
+
+        for row, item in self._in_view:
+            self.refresh_row(row, item)
+
+    def yview(self, *args):
+        """Scroll the canvas (scrollbar command) and refill the rows."""
+
+        self.canvas.yview(*args)
+        self.render()
+
+    def scroll(self, units):
+        """
+            Scroll by a number of rows and refill the rows.
+
+            Parameters
+            ----------
+            units : int
+                Rows to scroll; negative scrolls up.
+        """
+
+        self.canvas.yview_scroll(units, "units")
+        self.render()
+
+    def render(self):
+        """Show the items in view, creating row widgets only if the pool is too small."""
+
+        if self.row_height is None:
+            return
+        canvas = self.canvas
+        first = max(0, int(canvas.canvasy(0) // self.row_height))
+        count = max(0, min(len(self.items) - first, canvas.winfo_height() // self.row_height + 2))
+        while len(self._rows) < count:
+            self._add_row()
+
+        rows_by_key = {}
+        in_view = []
+        for slot in range(count):
+            row = self._rows[slot]
+            index = first + slot
+            y = index * self.row_height + self.pad_y
+            if row[2] != y:
+                if row[2] is None:
+                    canvas.itemconfigure(row[0], state="normal")
+                canvas.coords(row[0], self.pad_x[0], y)
+                row[2] = y
+            item = self.items[index]
+            self.update_row(row[1], item)
+            rows_by_key[self.key(item)] = row[1]
+            in_view.append((row[1], item))
+
+        # Hide the rows that are not needed
+        for row in self._rows[count:]:
+            if row[2] is not None:
+                canvas.itemconfigure(row[0], state="hidden")
+                row[2] = None
+        self.rows_by_key = rows_by_key
+        self._in_view = in_view
+
+    def _measure(self):
+        """Create the first row and take the row height from it."""
+
+        row = self._add_row()
+        row[1]["frame"].update_idletasks()
+        self.row_height = row[1]["frame"].winfo_reqheight() + 2 * self.pad_y
+        self.canvas.configure(yscrollincrement=self.row_height)
+
+    def _add_row(self):
+        """Create one hidden row and add it to the pool."""
+
+        widget = self.create_row(self.canvas)
+        window = self.canvas.create_window(self.pad_x[0], 0, window=widget["frame"], anchor="nw", width=self._row_width(), state="hidden")
+        row = [window, widget, None]
+        self._rows.append(row)
+        return row
+
+    def _row_width(self):
+        """Width of a row inside the canvas padding."""
+
+        return max(1, self._width - self.pad_x[0] - self.pad_x[1])
+
+    def _update_scroll_region(self):
+        """Size the scroll region to all items and show the scrollbar only if they do not fit."""
+
+        total = len(self.items) * (self.row_height or 0)
+        self.canvas.configure(scrollregion=(0, 0, self._width, max(total, 1)))
+        if total <= self.canvas.winfo_height():
+            if self._scrollbar_shown:
+                self.scrollbar.place_forget()
+                self._scrollbar_shown = False
+            self.canvas.yview_moveto(0)
+        elif not self._scrollbar_shown:
+            self.scrollbar.place(**self.scrollbar_place)
+            self._scrollbar_shown = True
+
+    def _on_resize(self, event):
+        """Fit the rows to the new canvas width and refill them."""
+
+        self._width = event.width
+        for row in self._rows:
+            self.canvas.itemconfigure(row[0], width=self._row_width())
+        self._update_scroll_region()
+        self.render()
@@ -1,10 +1,10 @@
+from backend import rng
 from backend.SimulationParameters import SimulationParams
 from backend.SimulationEngine import SimulationEngine
 from backend.statistics import Statistics
 from backend.queues import HoldingQueue, TakeOffQueue
 from backend.runway import Runway
 from backend.airport import Airport
-from frontend.frontend import create_ui
 
 
 def build_engine(seed: int = 42) -> SimulationEngine:
@@ -59,8 +59,8 @@ def build_engine(seed: int = 42) -> SimulationEngine:
     takeoff = TakeOffQueue()
 
     runways = [
-        Runway(runway_id=1, runway_mode="TAKEOFF"),
-        Runway(runway_id=2, runway_mode="LANDING"),
+        Runway(runway_id=1, runway_mode="TAKEOFF", rng=rng.stream(seed, rng.METADATA, "runway", 1)),
+        Runway(runway_id=2, runway_mode="LANDING", rng=rng.stream(seed, rng.METADATA, "runway", 2)),
     ]
 
     airport = Airport(runways=runways, holding=holding, takeoff=takeoff, stats=stats)
@@ -74,6 +74,9 @@ def build_engine(seed: int = 42) -> SimulationEngine:
 
 
 def main():
+    # Imported here so build_engine can be used without pulling in tkinter and PIL
+    from frontend.frontend import create_ui
+
     engine = build_engine(seed=1)
     create_ui(engine)
 